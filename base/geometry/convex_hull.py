@@ -41,3 +41,51 @@ def put_line(points: np.ndarray) -> tp.Tuple[float, float]:
     model = LinearRegression().fit(points.T[0].reshape(len(points), 1),
                                    points.T[1])
     return model.coef_[0], model.intercept_
+
+
+def fit_suffix_bounds(x: np.ndarray, y: np.ndarray, upper: bool = False) -> \
+        tp.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Least squares lines through the lower (or upper) convex bound
+    of every suffix points[i:] of points sorted by x.
+    returns arrays k, b and the sum of squared residuals over the bound,
+    index i is the line of the suffix starting with point i
+
+    Bounds of all suffixes are built in one right to left pass, the bound
+    is kept as a stack with running sums of its points, so every line
+    is fitted in closed form. Points are shifted to the last one
+    to keep the sums small.
+    """
+    n = len(x)
+    x0, y0 = x[-1], y[-1]
+    xs = (np.asarray(x, dtype=float) - x0).tolist()
+    ys = (np.asarray(y, dtype=float) - y0).tolist()
+    sign = -1. if upper else 1.
+    stack: tp.List[int] = []
+    # sums[m] are count, x, y, x^2, x*y and y^2 sums of the bottom m points
+    sums = [(0., 0., 0., 0., 0., 0.)]
+    stats = np.zeros((n, 6))
+    for i in range(n - 1, -1, -1):
+        px, py = xs[i], ys[i]
+        while len(stack) >= 2:
+            a, b = stack[-1], stack[-2]
+            cross = (xs[a] - px) * (ys[b] - py) - (ys[a] - py) * (xs[b] - px)
+            if sign * cross > 0:
+                break
+            stack.pop()
+            sums.pop()
+        stack.append(i)
+        c, sx, sy, sxx, sxy, syy = sums[-1]
+        sums.append((c + 1, sx + px, sy + py, sxx + px * px,
+                     sxy + px * py, syy + py * py))
+        stats[i] = sums[-1]
+
+    counts, sums_x, sums_y, sums_xx, sums_xy, sums_yy = stats.T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_x, mean_y = sums_x / counts, sums_y / counts
+        var_x = sums_xx - counts * mean_x ** 2
+        cov = sums_xy - counts * mean_x * mean_y
+        k = np.where(var_x > 0, cov / var_x, 0.)
+        intercepts = mean_y - k * mean_x
+        sse = np.maximum(sums_yy - counts * mean_y ** 2 - k * cov, 0.)
+    return k, intercepts + y0 - k * x0, sse
@@ -0,0 +1,78 @@
+import math
+import typing as tp
+from collections import deque
+
+
+class RollingExtremum:
+    """
+    Min (or max) of the last window_size values in O(1) amortized per value.
+
+    The deque keeps (index, value) of the values that can still become
+    the extremum, monotonic from the current extremum at the left.
+    """
+
+    def __init__(self, window_size: int, maximum: bool = False):
+        self.window_size = window_size
+        self.maximum = maximum
+        self.count = 0
+        self._candidates: tp.Deque[tp.Tuple[int, float]] = deque()
+
+    def push(self, value: float) -> None:
+        while self._candidates and (
+                self._candidates[-1][1] <= value if self.maximum
+                else self._candidates[-1][1] >= value):
+            self._candidates.pop()
+        self._candidates.append((self.count, value))
+        self.count += 1
+        if self._candidates[0][0] <= self.count - 1 - self.window_size:
+            self._candidates.popleft()
+
+    def get_value(self) -> tp.Optional[float]:
+        """ None until window_size values are pushed """
+        if self.count < self.window_size:
+            return None
+        return self._candidates[0][1]
+
+
+class RollingMean:
+    """
+    Mean of the last window_size values in O(1) per value,
+    NaN if any of them is NaN. Equal values give exactly their value,
+    so means of constant windows can be compared.
+    """
+
+    def __init__(self, window_size: int):
+        self.window_size = window_size
+        self._window: tp.Deque[float] = deque()
+        self._sum = 0.
+        self._nan_count = 0
+        self._pushes = 0
+        self._same_count = 0
+
+    def push(self, value: float) -> None:
+        self._same_count = self._same_count + 1 \
+            if self._window and self._window[-1] == value else 1
+        self._window.append(value)
+        self._add(value, 1)
+        if len(self._window) > self.window_size:
+            self._add(self._window.popleft(), -1)
+        self._pushes += 1
+        # Bound floating point drift of the running sum
+        if self._pushes % (16 * self.window_size) == 0:
+            self._sum = math.fsum(x for x in self._window if not math.isnan(x))
+
+    def get_value(self) -> tp.Optional[float]:
+        """ None until window_size values are pushed """
+        if len(self._window) < self.window_size:
+            return None
+        if self._nan_count > 0:
+            return float('nan')
+        if self._same_count >= self.window_size:
+            return self._window[-1]
+        return self._sum / self.window_size
+
+    def _add(self, value: float, sign: int) -> None:
+        if math.isnan(value):
+            self._nan_count += sign
+        else:
+            self._sum += sign * value
@@ -7,3 +7,7 @@ class Clock:
 
     def get_timestamp(self) -> int:
         return int(datetime.now().timestamp())
+
+    def get_ticks_passed(self) -> int:
+        """ Ticks of the clock since the previous step of the trading loop """
+        return 1
@@ -0,0 +1,77 @@
+import pickle
+import struct
+import typing as tp
+from pathlib import Path
+from time import monotonic
+
+EVENT_LOG_HEADER = b'EVENTLOG1\n'
+RECORD_SIZE = struct.Struct('<I')
+
+
+class EventLogWriter:
+    """
+    Append-only log of pickled events.
+
+    Every record is a pickle prefixed with its size as uint32,
+    records are buffered and written when the buffer exceeds FLUSH_SIZE bytes
+    or FLUSH_INTERVAL seconds passed since the last write,
+    so memory is bounded and a crash loses only the buffered tail.
+    """
+
+    FLUSH_SIZE = 2 ** 20
+    FLUSH_INTERVAL = 5.
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: tp.Optional[tp.BinaryIO] = open(path, 'wb')
+        self._file.write(EVENT_LOG_HEADER)
+        self._buffer: tp.List[bytes] = []
+        self._buffer_size = 0
+        self._last_flush = monotonic()
+
+    def write(self, event: tp.Any) -> None:
+        data = pickle.dumps(event, pickle.HIGHEST_PROTOCOL)
+        self._buffer.append(RECORD_SIZE.pack(len(data)))
+        self._buffer.append(data)
+        self._buffer_size += RECORD_SIZE.size + len(data)
+        if self._buffer_size >= self.FLUSH_SIZE or \
+                monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._file is None:
+            return
+        self._file.write(b''.join(self._buffer))
+        self._file.flush()
+        self._buffer = []
+        self._buffer_size = 0
+        self._last_flush = monotonic()
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def read_event_log(path: Path) -> tp.Iterator[tp.Any]:
+    """
+    Iterates over events of the log written by EventLogWriter,
+    an incomplete last record is skipped.
+    Logs of the old format with a single pickled list are read as well.
+    """
+    with open(path, 'rb') as file:
+        if file.read(len(EVENT_LOG_HEADER)) != EVENT_LOG_HEADER:
+            file.seek(0)
+            yield from pickle.load(file)
+            return
+        while True:
+            prefix = file.read(RECORD_SIZE.size)
+            if len(prefix) < RECORD_SIZE.size:
+                return
+            size, = RECORD_SIZE.unpack(prefix)
+            data = file.read(size)
+            if len(data) < size:
+                return
+            yield pickle.loads(data)
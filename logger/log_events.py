@@ -1,118 +1,166 @@
 from trading import AssetPair, TrendLine, Candle, Order
-from varname import argname
 import typing as tp
 
 
-def _create_dict(*args: tp.Any) -> tp.Dict[str, tp.Any]:
+class LogEvent:
     """
-    Given arguments arg_1, ..., arg_n, return 
-    dict {'arg_1': arg_1, ..., 'arg_n': arg_n} 
+    Event for logs and the visualizer.
+    obj is made of the values of `fields` when the event is dumped,
+    msg is formatted only if the event gets to a log.
     """
-    return dict(zip(argname(args), args))
+    __slots__: tp.Tuple[str, ...] = ()
+    fields: tp.Tuple[str, ...] = ()
 
+    @property
+    def msg(self) -> str:
+        raise NotImplementedError
 
-class LogEvent:
-    def __init__(self, msg: str, obj: tp.Any):
-        self.msg = msg
-        self.obj = obj
+    @property
+    def obj(self) -> tp.Dict[str, tp.Any]:
+        return {field: getattr(self, field) for field in self.fields}
 
 
 class TrendLinesEvent(LogEvent):
+    __slots__ = fields = ('lower_trend_line', 'upper_trend_line')
+
     def __init__(self,
-                 lower_trend_line: TrendLine,
-                 upper_trend_line: TrendLine):
-        super().__init__('Trend lines updated',
-                         _create_dict(lower_trend_line, upper_trend_line))
+                 lower_trend_line: tp.Optional[TrendLine],
+                 upper_trend_line: tp.Optional[TrendLine]):
+        self.lower_trend_line = lower_trend_line
+        self.upper_trend_line = upper_trend_line
+
+    @property
+    def msg(self) -> str:
+        return 'Trend lines updated'
 
 
 class CurveEvent(LogEvent):
+    __slots__ = ('value', 'params')
+    fields = ('value', 'params', 'min_value', 'max_value', 'value_fmt')
     # This name will appear on legend for this event
     name = 'Custom Curve'
+    min_value: tp.Optional[float] = None
+    max_value: tp.Optional[float] = None
+    value_format = 'Value: {value:.4f}'
 
-    def __init__(self,
-                 msg: str,
-                 value: float,
-                 params: str,
-                 min_value: tp.Optional[float] = None,
-                 max_value: tp.Optional[float] = None,
-                 value_fmt: str = 'Value: {value:.4f}'):
-        value_fmt = value_fmt.format(value=value)
-        super().__init__(msg,
-                         _create_dict(value, params, min_value, max_value,
-                                      value_fmt))
+    def __init__(self, value: float, params: str):
+        self.value = value
+        self.params = params
+
+    @property
+    def value_fmt(self) -> str:
+        return self.value_format.format(value=self.value)
+
+    @property
+    def msg(self) -> str:
+        return f'New {self.name} {self.params}: {self.value}'
 
 
 class ExpMovingAverageEvent(CurveEvent):
+    __slots__ = ()
     name = 'Exp Moving Average'
 
     def __init__(self, value: float, window_size: int):
-        super().__init__(
-            f'New EMA of last {window_size} elements: {value}',
-            value,
-            f'{window_size}')
+        super().__init__(value, f'{window_size}')
+
+    @property
+    def msg(self) -> str:
+        return f'New EMA of last {self.params} elements: {self.value}'
 
 
 class MovingAverageEvent(CurveEvent):
+    __slots__ = ()
     name = 'Moving Average'
 
     def __init__(self, average_value: float, window_size: int):
-        super().__init__(
-            f'New SMA of last {window_size} elements: {average_value}',
-            average_value,
-            f'{window_size}',
-        )
+        super().__init__(average_value, f'{window_size}')
+
+    @property
+    def msg(self) -> str:
+        return f'New SMA of last {self.params} elements: {self.value}'
 
 
 class RSIEvent(CurveEvent):
+    __slots__ = ()
     name = 'RSI'
+    min_value = 0
+    max_value = 100
+    value_format = 'RSI: {value:.2f}'
 
     def __init__(self, rsi: float):
-        super().__init__(
-            f'New RSI: {rsi:.2f}', rsi, '',
-            min_value=0, max_value=100,
-            value_fmt='RSI: {value:.2f}'
-        )
+        super().__init__(rsi, '')
 
+    @property
+    def msg(self) -> str:
+        return f'New RSI: {self.value:.2f}'
+
+
+class OrderEvent(LogEvent):
+    __slots__ = ('asset_pair', 'amount', 'price', 'order_id')
+    fields = ('amount_asset', 'price_asset', 'amount', 'price', 'order_id')
 
-class BuyEvent(LogEvent):
     def __init__(self, asset_pair: AssetPair, amount: float,
                  price: float, order_id: str):
-        super().__init__(
-            f'Buying {amount} {asset_pair.amount_asset} at price {price} '
-            f'{asset_pair.amount_asset}/{asset_pair.price_asset}, order {order_id}',
-            _create_dict(asset_pair.amount_asset, asset_pair.price_asset,
-                         amount, price,
-                         order_id))
+        self.asset_pair = asset_pair
+        self.amount = amount
+        self.price = price
+        self.order_id = order_id
 
+    @property
+    def amount_asset(self) -> tp.Any:
+        return self.asset_pair.amount_asset
 
-class SellEvent(LogEvent):
-    def __init__(self, asset_pair: AssetPair, amount: float,
-                 price: float, order_id: str) -> None:
-        super().__init__(
-            f'Selling {amount} {asset_pair.amount_asset} at price {price} '
-            f'{asset_pair.amount_asset}/{asset_pair.price_asset}, order {order_id}',
-            _create_dict(asset_pair.amount_asset, asset_pair.price_asset,
-                         amount, price,
-                         order_id))
+    @property
+    def price_asset(self) -> tp.Any:
+        return self.asset_pair.price_asset
 
 
-class CancelEvent(LogEvent):
+class BuyEvent(OrderEvent):
+    __slots__ = ()
+
+    @property
+    def msg(self) -> str:
+        return f'Buying {self.amount} {self.amount_asset} at price {self.price} ' \
+               f'{self.amount_asset}/{self.price_asset}, order {self.order_id}'
+
+
+class SellEvent(OrderEvent):
+    __slots__ = ()
+
+    @property
+    def msg(self) -> str:
+        return f'Selling {self.amount} {self.amount_asset} at price {self.price} ' \
+               f'{self.amount_asset}/{self.price_asset}, order {self.order_id}'
+
+
+class CancelEvent(OrderEvent):
+    __slots__ = ()
+
     def __init__(self, order: Order):
-        super().__init__(f'Cancel order {order.order_id}',
-                         {'amount_asset': order.asset_pair.amount_asset,
-                          'price_asset': order.asset_pair.price_asset,
-                          'amount': order.amount,
-                          'price': order.price,
-                          'order_id': order.order_id})
+        super().__init__(order.asset_pair, order.amount, order.price, order.order_id)
+
+    @property
+    def msg(self) -> str:
+        return f'Cancel order {self.order_id}'
 
 
 class FilledOrderEvent(LogEvent):
+    __slots__ = fields = ('order_id',)
+
     def __init__(self, order_id: str) -> None:
-        super().__init__(f'Order {order_id} is filled',
-                         _create_dict(order_id))
+        self.order_id = order_id
+
+    @property
+    def msg(self) -> str:
+        return f'Order {self.order_id} is filled'
 
 
 class NewCandleEvent(LogEvent):
+    __slots__ = fields = ('candle',)
+
     def __init__(self, candle: Candle) -> None:
-        super().__init__(f'New candle: {candle}',
-                         _create_dict(candle))
+        self.candle = candle
+
+    @property
+    def msg(self) -> str:
+        return f'New candle: {self.candle}'
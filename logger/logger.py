@@ -1,10 +1,10 @@
 import logging
-import pickle
 
 from datetime import datetime
 from pathlib import Path
 
 from logger.clock import Clock
+from logger.event_log import EventLogWriter
 from logger.log_events import LogEvent
 
 import typing as tp
@@ -43,10 +43,12 @@ class Logger:
 
     @classmethod
     def set_log_file_name(cls, name: str) -> None:
+        cls._close_event_log()
         cls._file_name = name.replace(":", "-")
 
     @classmethod
     def set_logs_path(cls, path: Path) -> None:
+        cls._close_event_log()
         cls._logs_path = path
 
     @classmethod
@@ -82,8 +84,21 @@ class Logger:
 
     @classmethod
     def store_log(cls) -> None:
-        with open(cls.create_log_file('dump', 'dump'), 'wb') as f:
-            pickle.dump(cls._dump_logs, f)
+        """ Writes the rest of events to the dump, the next ones start a new dump """
+        cls._get_event_log().close()
+        cls._event_log = None
+
+    @classmethod
+    def _get_event_log(cls) -> EventLogWriter:
+        if cls._event_log is None:
+            cls._event_log = EventLogWriter(cls.create_log_file('dump', 'dump'))
+        return cls._event_log
+
+    @classmethod
+    def _close_event_log(cls) -> None:
+        if cls._event_log is not None:
+            cls._event_log.close()
+            cls._event_log = None
 
     @staticmethod
     def create_log_file(log_type: str, ext: str) -> Path:
@@ -100,9 +115,10 @@ class Logger:
 
     @staticmethod
     def to_visualize(log_event: LogEvent) -> None:
-        log_event.obj['ts'] = Logger._clock.get_timestamp()
-        log_event.obj['event_type'] = log_event.__class__
-        Logger._dump_logs.append(log_event.obj)
+        obj = log_event.obj
+        obj['ts'] = Logger._clock.get_timestamp()
+        obj['event_type'] = log_event.__class__
+        Logger._get_event_log().write(obj)
 
     def trading_event(self, event: LogEvent,
                       *args: tp.Any, **kwargs: tp.Any) -> None:
@@ -132,7 +148,7 @@ class Logger:
     _log_format = (f'[%(asctime)s] [%(levelname)s] [%(name)s] %(message)s',
                    '%m-%d %H:%M:%S')
     _file_handlers: tp.Dict[Path, logging.FileHandler] = {}
-    _dump_logs: tp.List[LogEvent] = []
+    _event_log: tp.Optional[EventLogWriter] = None
     _file_name: tp.Optional[str] = None
     _logs_path = Path('logs')
     _default_config: Config = ConfigParser.load_config(
@@ -0,0 +1,108 @@
+import json
+import os
+import typing as tp
+from pathlib import Path
+from time import time
+
+import numpy as np
+
+from trading import AssetPair, Timeframe, TimeRange, CandleSeries, CANDLE_COLUMNS
+
+
+class CandlesCache:
+    """
+    On-disk storage of downloaded candles for one asset pair and timeframe.
+
+    Every column is a separate .npy file sorted by ts and served memory-mapped,
+    ranges.json lists the time ranges already downloaded, so only the missing
+    parts of a requested range have to be loaded from the exchange.
+    Files are replaced atomically, ranges.json is written last.
+    """
+
+    def __init__(self, path: Path, asset_pair: AssetPair, timeframe: Timeframe):
+        self.path = path / f'{asset_pair.amount_asset}-{asset_pair.price_asset}' / \
+            timeframe.to_string()
+        self.timeframe = timeframe
+
+    def get_missing_ranges(self, time_range: TimeRange) -> tp.List[TimeRange]:
+        missing = []
+        current_ts = time_range.from_ts
+        for from_ts, to_ts in self._load_ranges():
+            if to_ts < current_ts:
+                continue
+            if from_ts > time_range.to_ts:
+                break
+            if from_ts > current_ts:
+                missing.append(TimeRange(current_ts, from_ts - 1))
+            current_ts = to_ts + 1
+        if current_ts <= time_range.to_ts:
+            missing.append(TimeRange(current_ts, time_range.to_ts))
+        return missing
+
+    def get(self, time_range: TimeRange) -> CandleSeries:
+        """ Memory-mapped candles of the range, must be covered by the cache """
+        columns = self._load_columns(mmap_mode='r')
+        if columns is None:
+            return CandleSeries.empty()
+        return CandleSeries.from_arrays(columns).get_time_range(time_range)
+
+    def put(self, candles: CandleSeries, time_range: TimeRange) -> None:
+        """ Stores candles downloaded for the time range """
+        columns = self._load_columns()
+        if columns is not None:
+            merged = {name: np.concatenate([column, columns[name]])
+                      for name, column in candles.get_columns().items()}
+            # New candles win over the cached ones with the same ts,
+            # a cached candle may have been downloaded while still open
+            _, unique = np.unique(merged['ts'], return_index=True)
+            columns = {name: column[unique] for name, column in merged.items()}
+        else:
+            columns = candles.get_columns()
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        for name, column in columns.items():
+            self._write(f'{name}.npy', lambda file: np.save(file, column))
+
+        # The last candle may be still open, so the range ends before it
+        ranges = self._load_ranges() + [[
+            time_range.from_ts,
+            min(time_range.to_ts, int(time()) - self.timeframe.to_seconds())]]
+        self._write('ranges.json',
+                    lambda file: file.write(json.dumps(self._merge(ranges)).encode()))
+
+    @staticmethod
+    def _merge(ranges: tp.List[tp.List[int]]) -> tp.List[tp.List[int]]:
+        merged: tp.List[tp.List[int]] = []
+        for from_ts, to_ts in sorted(ranges):
+            if from_ts > to_ts:
+                continue
+            if merged and from_ts <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], to_ts)
+            else:
+                merged.append([from_ts, to_ts])
+        return merged
+
+    def _load_ranges(self) -> tp.List[tp.List[int]]:
+        try:
+            with open(self.path / 'ranges.json') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return []
+
+    def _load_columns(self,
+                      mmap_mode: tp.Optional[tp.Literal['r', 'r+', 'w+', 'c']] = None) \
+            -> tp.Optional[tp.Dict[str, np.ndarray]]:
+        try:
+            columns = {name: np.load(self.path / f'{name}.npy', mmap_mode=mmap_mode)
+                       for name in CANDLE_COLUMNS}
+        except FileNotFoundError:
+            return None
+        if len({len(column) for column in columns.values()}) != 1:
+            raise RuntimeError(f'Corrupted candles cache in {self.path}')
+        return columns
+
+    def _write(self, name: str, write: tp.Callable[[tp.BinaryIO], tp.Any]) -> None:
+        tmp_path = self.path / f'.{name}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as file:
+            write(file)
+        os.replace(tmp_path, self.path / name)
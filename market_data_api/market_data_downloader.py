@@ -1,19 +1,27 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import ccxt
+import numpy as np
 import requests
-from copy import copy
+import requests.adapters
 from retry import retry
 import typing as tp
+from pathlib import Path
 
 from helpers.typing.common_types import Config
 from logger.logger import Logger
+from market_data_api.candles_cache import CandlesCache
 
-from trading import Candle, AssetPair, Timeframe, TimeRange, Timestamp
+from trading import AssetPair, Timeframe, TimeRange, Timestamp, \
+    CandleSeries, CANDLE_COLUMNS
 
 
 class MarketDataDownloader:
     _Config: Config = None
     _Exchange = None
     _Logger = None
+    _Session: tp.Optional[tp.Tuple[int, requests.Session]] = None
 
     @staticmethod
     def init(config: Config) -> None:
@@ -25,42 +33,75 @@ class MarketDataDownloader:
         MarketDataDownloader._Exchange.load_markets()
 
     @staticmethod
-    def get_candles(asset_pair: AssetPair, timeframe: Timeframe, time_range: TimeRange) -> tp.List[Candle]:
+    def get_candles(asset_pair: AssetPair, timeframe: Timeframe, time_range: TimeRange) -> CandleSeries:
+        cache_path = MarketDataDownloader._Config['cache_path']
+        if cache_path is None:
+            return MarketDataDownloader._fill_gaps(MarketDataDownloader._download_candles(
+                asset_pair=asset_pair, timeframe=timeframe, time_range=time_range))
+
+        cache = CandlesCache(Path(cache_path), asset_pair, timeframe)
+        for missing_range in cache.get_missing_ranges(time_range):
+            cache.put(MarketDataDownloader._download_candles(
+                asset_pair=asset_pair, timeframe=timeframe, time_range=missing_range),
+                missing_range)
+        return MarketDataDownloader._fill_gaps(cache.get(time_range))
+
+    @staticmethod
+    def _download_candles(asset_pair: AssetPair, timeframe: Timeframe,
+                          time_range: TimeRange) -> CandleSeries:
+        """
+        Raw candles from the exchange, empty candles have NaN prices.
+        The range is split into pages of 'candles_per_request' candles
+        which are requested concurrently by 'download_threads' threads.
+        """
         MarketDataDownloader._Logger.info(f"Loading candles in range {time_range}")
-        candles: tp.List[Candle] = []
-        current_ts = time_range.from_ts
-
-        while current_ts <= time_range.to_ts:
-            candles_data = MarketDataDownloader._load_candles_batch(
-                asset_pair=asset_pair,
-                timeframe=timeframe,
-                time_range=TimeRange(
-                    current_ts,
-                    min(current_ts + timeframe.to_seconds() * MarketDataDownloader._Config['candles_per_request'],
-                        time_range.to_ts)))
+        page_size = timeframe.to_seconds() * MarketDataDownloader._Config['candles_per_request']
+        pages = [TimeRange(from_ts, min(from_ts + page_size - 1, time_range.to_ts))
+                 for from_ts in range(time_range.from_ts, time_range.to_ts + 1, page_size)]
+        if not pages:
+            return CandleSeries.empty()
+
+        MarketDataDownloader._get_session()
+        threads = min(MarketDataDownloader._Config['download_threads'], len(pages))
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            batches = list(executor.map(
+                lambda page: MarketDataDownloader._load_candles_batch(
+                    asset_pair=asset_pair, timeframe=timeframe, time_range=page),
+                pages))
+
+        columns: tp.Dict[str, tp.List[tp.Any]] = {name: [] for name in CANDLE_COLUMNS}
+        for candles_data in batches:
             for candle in candles_data:
                 candle_data = candle['data']
-                new_candle = Candle(
-                    ts=Timestamp.from_iso_format(candle_data['time']),
-                    open=candle_data['open'],
-                    close=candle_data['close'],
-                    low=candle_data['low'],
-                    high=candle_data['high'],
-                    volume=candle_data['volume'])
-                candles.append(new_candle)
+                columns['ts'].append(Timestamp.from_iso_format(candle_data['time']))
+                for name in CANDLE_COLUMNS[1:]:
+                    columns[name].append(candle_data[name])
 
-            if not candles_data:
-                break
-            current_ts = candles[-1].ts + 1
+        candles = CandleSeries.from_columns(**columns)
+        # Pages may share border candles and come unsorted from the exchange
+        _, unique = np.unique(candles.ts, return_index=True)
+        return CandleSeries.from_arrays({name: column[unique] for name, column
+                                         in candles.get_columns().items()})
 
-        return MarketDataDownloader._fill_gaps(candles)
+    @staticmethod
+    def _get_session() -> requests.Session:
+        """ Keep-alive session shared by the download threads of this process """
+        if MarketDataDownloader._Session is None or \
+                MarketDataDownloader._Session[0] != os.getpid():
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=MarketDataDownloader._Config['download_threads'])
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            MarketDataDownloader._Session = (os.getpid(), session)
+        return MarketDataDownloader._Session[1]
 
     @staticmethod
     @retry(RuntimeError, tries=15, delay=3)
     def _load_candles_batch(asset_pair: AssetPair, timeframe: Timeframe,
                             time_range: TimeRange) -> tp.List[tp.Dict[str, tp.Any]]:
         asset_pair_id = MarketDataDownloader._Exchange.markets[str(asset_pair)]['id']
-        response = requests.get(
+        response = MarketDataDownloader._get_session().get(
             f'{MarketDataDownloader._Config["market_data_host"]}/v0/candles/{asset_pair_id}',
             params={  # type: ignore
                 'interval': timeframe.to_string(),
@@ -76,17 +117,24 @@ class MarketDataDownloader:
         return ts * 1000
 
     @staticmethod
-    def _fill_gaps(candles: tp.List[Candle]) -> tp.List[Candle]:
-        while candles and candles[0].open is None:
-            candles = candles[1:]
-        for index in range(1, len(candles)):
-            if candles[index].open is None:
-                candles[index].open = candles[index - 1].close
-                candles[index].high = candles[index - 1].close
-                candles[index].low = candles[index - 1].close
-                candles[index].close = candles[index - 1].close
-                candles[index].volume = 0
-        return candles
+    def _fill_gaps(candles: CandleSeries) -> CandleSeries:
+        """ Drops leading empty candles, the rest are flat at previous close. """
+        gaps = np.isnan(candles.open)
+        first_filled = len(candles) if gaps.all() else int(np.argmin(gaps))
+        candles, gaps = candles[first_filled:], gaps[first_filled:]
+        if not gaps.any():
+            return candles
+
+        # Index of the last non-empty candle at or before every position
+        last_filled = np.maximum.accumulate(
+            np.where(gaps, 0, np.arange(len(candles))))
+        columns = {name: column.copy()
+                   for name, column in candles.get_columns().items()}
+        previous_close = columns['close'][last_filled[gaps]]
+        for name in ('open', 'high', 'low', 'close'):
+            columns[name][gaps] = previous_close
+        columns['volume'][gaps] = 0
+        return CandleSeries.from_arrays(columns)
 
     @staticmethod
     def get_orderbook(asset_pair: AssetPair, depth: int = 50) -> tp.Dict[str, tp.Any]:
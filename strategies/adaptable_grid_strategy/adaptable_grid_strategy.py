@@ -50,7 +50,7 @@ class AdaptableGridStrategy(GridStrategy):  # type: ignore
             self.ts.cancel_all()
             self.place_orders()
             self.ticks = 0
-        self.ticks += 1
+        self.ticks += self.ts.ti.get_clock().get_ticks_passed()
 
     def handle_filled_order_signal(self, order: Order) -> None:
         if self.handle_filled_orders:
@@ -1,76 +1,66 @@
-import json
 import typing as tp
-from itertools import product
+from datetime import timedelta
 from pathlib import Path
 
 from numpy import prod
 from rich.console import Console
 
 from base.config_parser import ConfigParser
+from logger.logger import Logger
 from market_data_api.market_data_downloader import MarketDataDownloader
-from strategies.strategy_runner import StrategyRunner
+from strategies.adaptable_grid_strategy.adaptable_grid_strategy import AdaptableGridStrategy
+from strategies.search_engine import SearchEngine, params_grid
 from trading import TimeRange
-from trading_system.trading_statistics import TradingStatistics
 
 
-def generate_config(config: tp.Dict[str, tp.Any]) -> None:
-    with open('strategies/adaptable_grid_strategy/config.json', 'w') as f:
-        json.dump(config, f)
+if __name__ == '__main__':
+    time_range = TimeRange.from_iso_format(
+        from_ts='2020-10-01 00:00:00',
+        to_ts='2021-05-09 00:00:00')
+    base_config = ConfigParser.load_config(Path('configs/base.json'))
+    simulator_config = ConfigParser.load_config(Path('configs/simulator.json'))
+    strategy_config = ConfigParser.load_config(
+        Path('strategies/adaptable_grid_strategy/config.json'))
+    Logger.set_default_config(base_config['default_logger'])
+    MarketDataDownloader.init(base_config['market_data_downloader'])
+    console = Console()
 
+    fee = 0.1
+    window_grid = [40, 50]
+    coef_grid = [16]
+    timeout_grid = [20, 25]
+    total_levels_grid = [3, 5, 7]
+    param_grids: tp.List[tp.Dict[str, tp.List[tp.Any]]] = [{
+      'asset_pair': [['USDT', 'USDN']],
+      'total_levels': total_levels_grid,
+      'threshold': [0.],
+      'window': window_grid,
+      'coef': coef_grid,
+      'timeout_in_candles': timeout_grid,
+      'candles_lifetime': [8],
+      'timeout_only': [True],
+      'handle_filled_orders': [True, False]
+    }]
+    total = sum(prod(list(
+        map(len, param_grid.values()))) for param_grid in param_grids)
+    console.print(f'Searching among {total} configurations')
 
-def grid_generator(
-        grids: tp.List[tp.Dict[str, tp.List[tp.Any]]]
-        ) -> tp.Generator[tp.Dict[str, tp.Any], None, None]:
-    names = list(grids[0].keys())
-    param_grid: tp.List[tp.Any] = sum(
-        [list(product(*list(grid.values()))) for grid in grids], [])
-    for params in param_grid:
-        yield dict(zip(names, params))
+    engine = SearchEngine(
+        base_config=base_config,
+        simulator_config=simulator_config,
+        strategy_class=AdaptableGridStrategy,
+        strategy_config=strategy_config)
+    # Every round keeps the best half of configs and doubles the range
+    results = engine.successive_halving(
+        params_grid(param_grids), time_range,
+        min_range=int(timedelta(days=30).total_seconds()),
+        score=lambda stats: stats.calc_absolute_delta() - fee * stats.filled_order_count)
+    best_params, best_stats = results[0]
+    best_profit = best_stats.calc_absolute_delta() - fee * best_stats.filled_order_count
 
-
-time_range = TimeRange.from_iso_format(
-    from_ts='2020-10-01 00:00:00',
-    to_ts='2021-05-09 00:00:00')
-base_config = ConfigParser.load_config(Path('configs/base.json'))
-MarketDataDownloader.init(base_config['market_data_downloader'])
-strategy_runner = StrategyRunner(base_config=base_config)
-console = Console()
-
-fee = 0.1
-window_grid = [40, 50]
-coef_grid = [16]
-timeout_grid = [20, 25]
-total_levels_grid = [3, 5, 7]
-param_grids: tp.List[tp.Dict[str, tp.List[tp.Any]]] = [{
-  'asset_pair': [['USDT', 'USDN']],
-  'total_levels': total_levels_grid,
-  'threshold': [0.],
-  'window': window_grid,
-  'coef': coef_grid,
-  'timeout_in_candles': timeout_grid,
-  'candles_lifetime': [8],
-  'timeout_only': [True],
-  'handle_filled_orders': [True, False]
-}]
-total = sum(prod(list(
-    map(len, param_grid.values()))) for param_grid in param_grids)
-best_profit = float('-inf')
-best_stats: tp.Optional[TradingStatistics] = None
-best_params: tp.Dict[str, tp.List[tp.Any]] = {}
-
-for i, params_dict in enumerate(grid_generator(param_grids)):
-    generate_config(params_dict)
-    stats = strategy_runner.run_strategy(time_range=time_range)
-    profit = stats.calc_absolute_delta() - fee * stats.filled_order_count
-    console.print(f'Checked {i + 1} out of {total}')
-    if profit > best_profit:
-        best_profit = profit
-        best_stats = stats
-        best_params = params_dict
-
-color = 'green' if best_profit > 0 else 'red'
-console.print('[bold]Optimal parameters:[/bold]')
-console.print(best_params)
-console.print(
-    f'[bold]Profit (including fee): [{color}]{best_profit:.1f}[/{color}] '
-    f'{best_stats.price_asset}[/bold]')
+    color = 'green' if best_profit > 0 else 'red'
+    console.print('[bold]Optimal parameters:[/bold]')
+    console.print(best_params)
+    console.print(
+        f'[bold]Profit (including fee): [{color}]{best_profit:.1f}[/{color}] '
+        f'{best_stats.price_asset}[/bold]')
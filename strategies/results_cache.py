@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import typing as tp
+from pathlib import Path
+
+from trading_system.trading_statistics import TradingStatistics
+
+
+class ResultsCache:
+    """
+    Content-addressed storage of simulation results.
+
+    A key is the hash of everything a simulation depends on,
+    an entry holds pickled TradingStatistics and optionally the events dump.
+    Reading an entry marks it as recently used, the least recently used
+    entries are evicted when the total size exceeds max_size bytes.
+    Strategies code is not a part of the key, clear the cache after changing it.
+    """
+
+    def __init__(self, path: Path, max_size: int):
+        self.path = path
+        self.max_size = max_size
+
+    @staticmethod
+    def get_key(**key_parts: tp.Any) -> str:
+        """ key_parts: JSON serializable values the simulation result depends on """
+        data = json.dumps(key_parts, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key: str) -> tp.Optional[TradingStatistics]:
+        try:
+            with open(self._get_path(key, 'stats'), 'rb') as file:
+                stats = pickle.load(file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        os.utime(self._get_path(key, 'stats'))
+        return stats
+
+    def get_dump(self, key: str, destination: Path) -> bool:
+        """ Copies the cached events dump of the entry to destination if it exists """
+        try:
+            shutil.copyfile(self._get_path(key, 'dump'), destination)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def put(self, key: str, stats: TradingStatistics,
+            dump_path: tp.Optional[Path] = None) -> None:
+        self._get_path(key, 'stats').parent.mkdir(parents=True, exist_ok=True)
+        if dump_path is not None:
+            def copy_dump(file: tp.BinaryIO) -> None:
+                with open(dump_path, 'rb') as dump:
+                    shutil.copyfileobj(dump, file)
+
+            self._write(key, 'dump', copy_dump)
+        self._write(key, 'stats', lambda file: pickle.dump(stats, file))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total_size = 0
+        for stats_path in self.path.glob('*/*.stats'):
+            try:
+                size = sum(path.stat().st_size for path in
+                           [stats_path, stats_path.with_suffix('.dump')] if path.exists())
+                entries.append((stats_path.stat().st_mtime, size, stats_path))
+            except FileNotFoundError:
+                continue
+            total_size += size
+
+        for _, size, stats_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            for path in [stats_path, stats_path.with_suffix('.dump')]:
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+            total_size -= size
+
+    def _get_path(self, key: str, ext: str) -> Path:
+        return self.path / key[:2] / f'{key}.{ext}'
+
+    def _write(self, key: str, ext: str, write: tp.Callable[[tp.BinaryIO], tp.Any]) -> None:
+        path = self._get_path(key, ext)
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as file:
+            write(file)
+        os.replace(tmp_path, path)
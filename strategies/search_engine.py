@@ -0,0 +1,143 @@
+import multiprocessing as mp
+import traceback as tb
+import typing as tp
+from contextlib import contextmanager
+from itertools import product
+from pathlib import Path
+
+from helpers.typing.common_types import Config, ConfigsScope
+from logger.logger import Logger
+from market_data_api.market_data_downloader import MarketDataDownloader
+
+from strategies.strategy_base import StrategyBase
+from strategies.strategy_runner import StrategyRunner
+from trading_interface.simulator.simulator import Simulator
+from trading_system.trading_statistics import TradingStatistics
+
+from trading import AssetPair, Timeframe, TimeRange, SharedCandleSeries
+
+
+def params_grid(grids: tp.List[tp.Dict[str, tp.List[tp.Any]]]) \
+        -> tp.Iterator[Config]:
+    """ All combinations of values of every grid {param: [values]} """
+    for grid in grids:
+        for values in product(*grid.values()):
+            yield dict(zip(grid.keys(), values))
+
+
+class SearchEngine:
+    """
+    Evaluates strategy configs in parallel simulations.
+
+    Configs are passed to strategies in memory, candles of the time range
+    are loaded once and shared with the worker processes.
+    Every evaluation writes its logs into its own logs_path/<index> directory.
+    """
+
+    def __init__(self,
+                 base_config: ConfigsScope,
+                 simulator_config: Config,
+                 strategy_class: tp.Type[StrategyBase],
+                 strategy_config: Config,
+                 processes: int = mp.cpu_count(),
+                 logs_path: Path = Path('logs/search')):
+        """
+        strategy_config: base strategy config, searched params override it
+        """
+        self.base_config = base_config
+        self.simulator_config = simulator_config
+        self.strategy_class = strategy_class
+        self.strategy_config = strategy_config
+        self.processes = processes
+        self.logs_path = logs_path
+        self._candles: tp.Optional[SharedCandleSeries] = None
+
+    def search(self, params_space: tp.Iterable[Config], time_range: TimeRange) \
+            -> tp.Iterator[tp.Tuple[Config, TradingStatistics]]:
+        """
+        Yields (params, statistics) in order of completion,
+        failed evaluations are reported to stderr and skipped
+        """
+        with self._load_candles(time_range):
+            for _, params, stats in self._evaluate_all(enumerate(params_space), time_range):
+                yield params, stats
+
+    def successive_halving(self, params_space: tp.Iterable[Config],
+                           time_range: TimeRange, min_range: int,
+                           score: tp.Callable[[TradingStatistics], float],
+                           eta: int = 2) -> tp.List[tp.Tuple[Config, TradingStatistics]]:
+        """
+        Evaluates all params on the first min_range seconds of the time range,
+        keeps the best 1/eta of them by score and evaluates the survivors
+        on an eta times longer prefix, until the whole range is reached.
+        returns [(params, statistics)] on the whole range, best score first,
+        raises RuntimeError if every evaluation of a round failed,
+        eta must be at least 2
+        """
+        logger = Logger('SearchEngine')
+        candidates = list(enumerate(params_space))
+        if eta < 2:
+            raise ValueError(f'eta must be at least 2, got {eta}')
+        if min_range <= 0:
+            raise ValueError(f'min_range must be positive, got {min_range}')
+        if not candidates:
+            raise ValueError('params_space is empty')
+        range_length = min(min_range, time_range.get_range())
+        with self._load_candles(time_range):
+            while True:
+                prefix = TimeRange(time_range.from_ts, time_range.from_ts + range_length)
+                results = sorted(self._evaluate_all(candidates, prefix),
+                                 key=lambda result: (-score(result[2]), result[0]))
+                logger.info(f"Evaluated {len(candidates)} candidates on {prefix}")
+                if not results:
+                    raise RuntimeError(f'All {len(candidates)} evaluations on {prefix} failed')
+                if range_length == time_range.get_range():
+                    return [(params, stats) for _, params, stats in results]
+
+                survivors = results[:max(1, -(-len(results) // eta))]
+                candidates = [(index, params) for index, params, _ in survivors]
+                range_length = time_range.get_range() if len(candidates) <= 1 else \
+                    min(range_length * eta, time_range.get_range())
+
+    @contextmanager
+    def _load_candles(self, time_range: TimeRange) -> tp.Iterator[None]:
+        trading_config = self.base_config['trading_interface']
+        self._candles = SharedCandleSeries.create(MarketDataDownloader.get_candles(
+            asset_pair=AssetPair(*trading_config['asset_pair']),
+            timeframe=Timeframe(trading_config['timeframe']),
+            time_range=TimeRange(time_range.from_ts - Simulator.HISTORY_OFFSET,
+                                 time_range.to_ts)))
+        try:
+            yield
+        finally:
+            self._candles.detach()
+            self._candles.unlink()
+            self._candles = None
+
+    def _evaluate_all(self, candidates: tp.Iterable[tp.Tuple[int, Config]],
+                      time_range: TimeRange) \
+            -> tp.Iterator[tp.Tuple[int, Config, TradingStatistics]]:
+        """ candidates: (index, params), index names the evaluation logs """
+        tasks = ((candidate, time_range) for candidate in candidates)
+        with mp.Pool(processes=self.processes, maxtasksperchild=1) as pool:
+            for index, params, stats in pool.imap_unordered(self._evaluate, tasks):
+                if stats is not None:
+                    yield index, params, stats
+
+    def _evaluate(self, task: tp.Tuple[tp.Tuple[int, Config], TimeRange]) \
+            -> tp.Tuple[int, Config, tp.Optional[TradingStatistics]]:
+        (index, params), time_range = task
+        try:
+            runner = StrategyRunner(
+                base_config=self.base_config,
+                simulator_config=self.simulator_config,
+                exchange_config={})
+            runner.set_strategy(self.strategy_class, {**self.strategy_config, **params})
+            return index, params, runner.run_simulation(
+                time_range=time_range,
+                logs_path=self.logs_path / str(index),
+                candles=self._candles,
+                print_stats=False)
+        except Exception:
+            tb.print_exc()
+            return index, params, None
@@ -0,0 +1,59 @@
+import typing as tp
+
+from trading import Signal
+from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
+from trading_system.trading_system import TradingSystem
+
+
+class SignalBus:
+    """
+    Delivers signals of detectors to the strategy.
+
+    Strategy handlers `handle_<name>_signal` are resolved once into
+    a dispatch table by signal name, detectors with required handlers
+    are asked for signals only after some of them updated.
+    Detectors are registered for call backs of the trading system.
+    """
+
+    def __init__(self, strategy: tp.Any,
+                 detectors: tp.Sequence[TradingSignalDetector],
+                 trading_system: TradingSystem):
+        self.strategy = strategy
+        self.trading_system = trading_system
+        self.update_tracker = trading_system.update_tracker
+        self.dispatch_table: tp.Dict[str, tp.Callable[[tp.Any], tp.Any]] = {}
+        # (detector, update tracker subscription or None to poll every tick)
+        self.detectors: tp.List[tp.Tuple[TradingSignalDetector, tp.Optional[int]]] = []
+        for detector in detectors:
+            self.add_detector(detector)
+
+    def add_detector(self, detector: TradingSignalDetector) -> None:
+        for name in detector.signal_names:
+            self._resolve(name)
+        if isinstance(detector, TradingSignalDetector):
+            self.trading_system.add_detector(detector)
+        handlers = detector.get_required_handlers()
+        subscription = self.update_tracker.subscribe(handlers, updated='any') \
+            if handlers else None
+        self.detectors.append((detector, subscription))
+
+    def get_trading_signals(self) -> tp.List[Signal]:
+        signals: tp.List[Signal] = []
+        check = self.update_tracker.check
+        for detector, subscription in self.detectors:
+            if subscription is None or check(subscription):
+                signals += detector.get_trading_signals()
+        return signals
+
+    def dispatch(self) -> None:
+        for signal in self.get_trading_signals():
+            handler = self.dispatch_table.get(signal.name)
+            if handler is None:
+                handler = self._resolve(signal.name)
+            handler(signal.content)
+
+    def _resolve(self, name: str) -> tp.Callable[[tp.Any], tp.Any]:
+        handler: tp.Callable[[tp.Any], tp.Any] = \
+            getattr(self.strategy, f'handle_{name}_signal')
+        self.dispatch_table[name] = handler
+        return handler
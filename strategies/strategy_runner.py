@@ -2,6 +2,7 @@ import importlib
 import multiprocessing as mp
 import traceback as tb
 import typing as tp
+from copy import deepcopy
 from pathlib import Path
 from time import sleep, time
 from os import getpid
@@ -11,23 +12,28 @@ from logger.logger import Logger
 from base.config_parser import ConfigParser
 
 from trading_interface.trading_interface import TradingInterface
+from trading_interface.simulator.clock_simulator import ClockSimulator
 from trading_interface.simulator.simulator import Simulator
 from trading_interface.waves_exchange.waves_exchange_interface import WAVESExchangeInterface
 
 from trading_system.trading_system import TradingSystem
 from trading_system.trading_statistics import TradingStatistics
 
-from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
 from trading_signal_detectors.extremum.extremum_signal_detector \
     import ExtremumSignalDetector
 from trading_signal_detectors.moving_average.moving_average_signal_detector \
     import MovingAverageSignalDetector
 
 from strategies.strategy_base import StrategyBase
+from strategies.results_cache import ResultsCache
+from strategies.signal_bus import SignalBus
 
 from logger.logger import Logger
 
-from trading import Timestamp, TimeRange, Signal
+from market_data_api.market_data_downloader import MarketDataDownloader
+
+from trading import Timestamp, TimeRange, AssetPair, Timeframe, \
+    CandleSeries, SharedCandleSeries
 
 
 class StrategyRunner:
@@ -43,25 +49,56 @@ class StrategyRunner:
         self._ti: tp.Optional[TradingInterface] = None
         self._ts: tp.Optional[TradingSystem] = None
         self._strategy_inst: tp.Optional[StrategyBase] = None
-        self._signal_detectors: tp.List[TradingSignalDetector] = []
+        self._signal_bus: tp.Optional[SignalBus] = None
+        self._strategy: tp.Optional[tp.Tuple[tp.Type[StrategyBase], Config]] = None
         self._stdout_frequency = self.base_config['strategy_runner']['stdout_frequency']
         self._between_iteration_pause = self.base_config['strategy_runner']['between_iteration_pause']
-
-    def _get_strategy_instance(self) -> tp.Any:
+        cache_config = self.base_config['strategy_runner']['results_cache']
+        self._results_cache = None if cache_config['path'] is None else ResultsCache(
+            path=Path(cache_config['path']), max_size=int(cache_config['max_size_mb'] * 2 ** 20))
+        self._cache_dumps = cache_config['store_dump']
+
+    def set_strategy(self, strategy_class: tp.Type[StrategyBase], config: Config) -> None:
+        """ Runs the given strategy and config instead of loading them by base config """
+        self._strategy = (strategy_class, config)
+
+    def _get_strategy(self) -> tp.Tuple[tp.Type[StrategyBase], Config]:
+        if self._strategy is not None:
+            return self._strategy
         module_path = 'strategies' + ('.' + self.base_config["strategy"]["dir"]) * 2
         module = importlib.import_module(module_path)
         strategy_class = module.__getattribute__(self.base_config["strategy"]["name"])
         path = 'strategies/' + self.base_config["strategy"]["dir"] + '/config.json'
         config = ConfigParser.load_config(Path(path))
-        strategy_instance = strategy_class(config=config)
+        return strategy_class, config
+
+    def _get_strategy_instance(self) -> tp.Any:
+        strategy_class, config = self._get_strategy()
+        strategy_instance = strategy_class(config=deepcopy(config))
         return strategy_instance
 
+    def _get_results_cache_key(self, time_range: TimeRange, candles: CandleSeries) -> str:
+        strategy_class, strategy_config = self._get_strategy()
+        return ResultsCache.get_key(
+            strategy=f'{strategy_class.__module__}.{strategy_class.__qualname__}',
+            strategy_config=strategy_config,
+            simulator_config=self.simulator_config,
+            trading_interface_config=self.base_config['trading_interface'],
+            trading_system_config=self.base_config['trading_system'],
+            time_range=[time_range.from_ts, time_range.to_ts],
+            candles=candles.get_fingerprint())
+
     def run_simulation(
             self,
             time_range: TimeRange,
             logs_path: tp.Optional[Path] = None,
-            pretty_print: bool = True) -> TradingStatistics:
-        assert self._ti is not None
+            pretty_print: bool = True,
+            candles: tp.Optional[CandleSeries] = None,
+            print_stats: bool = True) -> TradingStatistics:
+        """
+        candles: preloaded candles covering time_range with a day of history,
+                 downloaded by the simulator if not given
+        """
 
         def get_progress() -> float:
             return (min(self._ti.get_timestamp(),  # type: ignore
@@ -72,10 +109,29 @@ class StrategyRunner:
         if logs_path is not None:
             Logger.set_logs_path(logs_path)
 
+        cache_key = None
+        if self._results_cache is not None:
+            # Looked up before the simulator builds its price paths
+            candles = Simulator.load_candles(
+                time_range, self.base_config['trading_interface'], candles)
+            cache_key = self._get_results_cache_key(time_range, candles)
+            stats = self._results_cache.get(cache_key)
+            if stats is not None:
+                Logger.set_clock(ClockSimulator(
+                    start_ts=time_range.from_ts,
+                    timeframe=Timeframe(self.base_config['trading_interface']['timeframe']),
+                    config=self.simulator_config['clock_simulator']))
+                self.logger.info("Simulation result is taken from cache")
+                self._results_cache.get_dump(cache_key, Logger.create_log_file('dump', 'dump'))
+                if print_stats:
+                    self._print_stats(stats, pretty_print)
+                return stats
+
         self._ti = Simulator(
             time_range=time_range,
             trading_config=self.base_config['trading_interface'],
-            exchange_config=self.simulator_config
+            exchange_config=self.simulator_config,
+            candles=candles
         )
         Logger.set_clock(self._ti.get_clock())  # type: ignore
 
@@ -93,7 +149,12 @@ class StrategyRunner:
 
             self._do_trading_iteration()
 
-        return self._stop_trading(pretty_print)
+        stats = self._stop_trading(pretty_print, print_stats)
+        if cache_key is not None:
+            self._results_cache.put(  # type: ignore
+                cache_key, stats,
+                Logger.create_log_file('dump', 'dump') if self._cache_dumps else None)
+        return stats
 
     def run_simulation_on_periods(
             self,
@@ -113,23 +174,35 @@ class StrategyRunner:
         runs = runs if runs is not None else \
             time_range.get_range() // period
 
+        # Candles are loaded once and shared with the workers,
+        # every run takes its period from them
+        candles = SharedCandleSeries.create(MarketDataDownloader.get_candles(
+            asset_pair=AssetPair(*self.base_config['trading_interface']['asset_pair']),
+            timeframe=Timeframe(self.base_config['trading_interface']['timeframe']),
+            time_range=TimeRange(time_range.from_ts - Simulator.HISTORY_OFFSET,
+                                 time_range.from_ts + period * runs)))
         pool = mp.Pool(processes=processes, maxtasksperchild=1)
         current_ts = time_range.from_ts
         run_results: tp.List[TradingStatistics] = []
 
-        for run_id in range(runs):
-            next_ts = current_ts + period
-            pool.apply_async(
-                self.run_simulation,
-                kwds={
-                    'time_range': TimeRange(current_ts, next_ts),
-                    'logs_path': logs_path},
-                callback=lambda run_result: run_results.append(run_result),
-                error_callback=lambda e: tb.print_exception(type(e), e, None))
-            current_ts = next_ts
-
-        pool.close()
-        pool.join()
+        try:
+            for run_id in range(runs):
+                next_ts = current_ts + period
+                pool.apply_async(
+                    self.run_simulation,
+                    kwds={
+                        'time_range': TimeRange(current_ts, next_ts),
+                        'logs_path': logs_path,
+                        'candles': candles},
+                    callback=lambda run_result: run_results.append(run_result),
+                    error_callback=lambda e: tb.print_exception(type(e), e, None))
+                current_ts = next_ts
+
+            pool.close()
+            pool.join()
+        finally:
+            candles.detach()
+            candles.unlink()
         stats = TradingStatistics.merge(run_results)
         if pretty_print:
             stats.pretty_print()
@@ -171,29 +244,30 @@ class StrategyRunner:
 
         self._strategy_inst = self._get_strategy_instance()
         self._strategy_inst.init_trading(self._ts)  # type: ignore
-        self._signal_detectors = self._strategy_inst.get_signal_detectors()  # type: ignore
-        self._signal_detectors.append(self._ts)  # type: ignore
+        signal_detectors = self._strategy_inst.get_signal_detectors()  # type: ignore
+        signal_detectors.append(self._ts)  # type: ignore
+        self._signal_bus = SignalBus(self._strategy_inst, signal_detectors, self._ts)
 
     def _do_trading_iteration(self) -> None:
         self._ts.update()  # type: ignore
-        signals: tp.List[Signal] = []
-        for detector in self._signal_detectors:
-            signals += detector.get_trading_signals()
-        for signal in signals:
-            self._strategy_inst.__getattribute__(
-                f'handle_{signal.name}_signal')(signal.content)
+        self._signal_bus.dispatch()  # type: ignore
         self._strategy_inst.update()  # type: ignore
 
-    def _stop_trading(self, pretty_print: bool) -> TradingStatistics:
+    def _stop_trading(self, pretty_print: bool, print_stats: bool = True) -> TradingStatistics:
         self._ts.stop_trading()  # type: ignore
         self._ti.stop_trading()  # type: ignore
         self._ts.update()  # type: ignore
 
         stats = self._ts.get_trading_statistics()  # type: ignore
         Logger.store_log()
+        if print_stats:
+            self._print_stats(stats, pretty_print)
+
+        return stats
+
+    @staticmethod
+    def _print_stats(stats: TradingStatistics, pretty_print: bool) -> None:
         if pretty_print:
             stats.pretty_print()
         else:
             print(stats)
-
-        return stats
@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from helpers.rolling_window import RollingExtremum, RollingMean
+
+
+@pytest.mark.parametrize("window_size", [1, 3, 14])
+def test_rolling_window(window_size: int) -> None:
+    values = np.random.default_rng(0).integers(0, 10, 200).astype(float)
+    low, high = RollingExtremum(window_size), RollingExtremum(window_size, maximum=True)
+    mean = RollingMean(window_size)
+    results = []
+    for value in values:
+        low.push(value)
+        high.push(value)
+        mean.push(value)
+        results.append([np.nan if x is None else x for x in
+                        [low.get_value(), high.get_value(), mean.get_value()]])
+
+    series = pd.Series(values).rolling(window_size)
+    np.testing.assert_allclose(
+        results, np.column_stack([series.min(), series.max(), series.mean()]))
+
+
+def test_rolling_mean_nan() -> None:
+    mean = RollingMean(2)
+    for value, expected in [(1., None), (float('nan'), np.nan), (3., np.nan), (5., 4.)]:
+        mean.push(value)
+        assert mean.get_value() == pytest.approx(expected, nan_ok=True)
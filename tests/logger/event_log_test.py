@@ -0,0 +1,39 @@
+import pickle
+import typing as tp
+from pathlib import Path
+
+from logger.event_log import EventLogWriter, read_event_log
+
+
+def test_write_read(tmp_path: Path) -> None:
+    path = tmp_path / 'dump' / 'log.dump'
+    writer = EventLogWriter(path)
+    events = [{'ts': i, 'value': i / 3} for i in range(1000)]
+    for event in events:
+        writer.write(event)
+    writer.close()
+    assert list(read_event_log(path)) == events
+
+
+def test_flush_by_size(tmp_path: Path, monkeypatch: tp.Any) -> None:
+    monkeypatch.setattr(EventLogWriter, 'FLUSH_SIZE', 100)
+    path = tmp_path / 'log.dump'
+    writer = EventLogWriter(path)
+    for i in range(100):
+        writer.write({'ts': i})
+        assert writer._buffer_size < 100
+    # Written records are readable before close, a cut record is skipped
+    written = list(read_event_log(path))
+    assert written == [{'ts': i} for i in range(100 - len(writer._buffer) // 2)]
+    cut_path = tmp_path / 'cut.dump'
+    cut_path.write_bytes(path.read_bytes()[:-1])
+    assert list(read_event_log(cut_path)) == written[:-1]
+    writer.close()
+    assert len(list(read_event_log(path))) == 100
+
+
+def test_read_old_format(tmp_path: Path) -> None:
+    path = tmp_path / 'log.dump'
+    events = [{'ts': 1}, {'ts': 2}]
+    path.write_bytes(pickle.dumps(events))
+    assert list(read_event_log(path)) == events
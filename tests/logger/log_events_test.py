@@ -0,0 +1,42 @@
+import typing as tp
+
+import pytest
+
+from logger.log_events import *
+from trading import Asset, AssetPair, Candle, Direction, Order
+
+asset_pair = AssetPair(Asset('WAVES'), Asset('USDN'))
+order_obj = {'amount_asset': Asset('WAVES'), 'price_asset': Asset('USDN'),
+             'amount': 1., 'price': 2., 'order_id': 'id'}
+
+
+@pytest.mark.parametrize("event,obj,msg", [
+    (BuyEvent(asset_pair, 1., 2., 'id'), order_obj,
+     'Buying 1.0 WAVES at price 2.0 WAVES/USDN, order id'),
+    (SellEvent(asset_pair, 1., 2., 'id'), order_obj,
+     'Selling 1.0 WAVES at price 2.0 WAVES/USDN, order id'),
+    (CancelEvent(Order('id', asset_pair, 1., 2., 0, Direction.BUY)), order_obj,
+     'Cancel order id'),
+    (FilledOrderEvent('id'), {'order_id': 'id'}, 'Order id is filled'),
+    (RSIEvent(30.), {'value': 30., 'params': '', 'min_value': 0, 'max_value': 100,
+                     'value_fmt': 'RSI: 30.00'}, 'New RSI: 30.00'),
+    (ExpMovingAverageEvent(1.5, 3), {'value': 1.5, 'params': '3', 'min_value': None,
+                                     'max_value': None, 'value_fmt': 'Value: 1.5000'},
+     'New EMA of last 3 elements: 1.5'),
+    (MovingAverageEvent(1.5, 3), {'value': 1.5, 'params': '3', 'min_value': None,
+                                  'max_value': None, 'value_fmt': 'Value: 1.5000'},
+     'New SMA of last 3 elements: 1.5'),
+    (TrendLinesEvent(None, None), {'lower_trend_line': None, 'upper_trend_line': None},
+     'Trend lines updated'),
+])
+def test_events(event: LogEvent, obj: tp.Dict[str, tp.Any], msg: str) -> None:
+    assert event.obj == obj
+    assert event.msg == msg
+    assert not hasattr(event, '__dict__')
+
+
+def test_new_candle_event() -> None:
+    candle = Candle(1, 2, 3, 4, 5, 6)
+    event = NewCandleEvent(candle)
+    assert event.obj == {'candle': candle}
+    assert event.msg == f'New candle: {candle}'
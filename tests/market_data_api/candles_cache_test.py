@@ -0,0 +1,75 @@
+import typing as tp
+from pathlib import Path
+
+import numpy as np
+
+from market_data_api.candles_cache import CandlesCache
+from market_data_api.market_data_downloader import MarketDataDownloader
+from trading import AssetPair, Timeframe, TimeRange, CandleSeries
+
+from tests.logger.empty_logger_mock import empty_logger_mock
+
+asset_pair = AssetPair('WAVES', 'USDN')
+timeframe = Timeframe('1m')
+
+
+def exchange_candles(time_range: TimeRange) -> CandleSeries:
+    ts = np.arange(-(-time_range.from_ts // 60) * 60, time_range.to_ts + 1, 60)
+    prices = ts / 60.
+    return CandleSeries.from_columns(ts=ts, open=prices, close=prices + 1,
+                                     low=prices, high=prices + 1, volume=prices)
+
+
+def test_missing_ranges(tmp_path: Path) -> None:
+    cache = CandlesCache(tmp_path, asset_pair, timeframe)
+    assert [(r.from_ts, r.to_ts) for r in cache.get_missing_ranges(TimeRange(0, 600))] \
+        == [(0, 600)]
+    for time_range in [TimeRange(120, 240), TimeRange(241, 300), TimeRange(420, 480)]:
+        cache.put(exchange_candles(time_range), time_range)
+
+    missing = cache.get_missing_ranges(TimeRange(0, 600))
+    assert [(r.from_ts, r.to_ts) for r in missing] == \
+        [(0, 119), (301, 419), (481, 600)]
+    assert cache.get_missing_ranges(TimeRange(150, 280)) == []
+
+    candles = cache.get(TimeRange(150, 480))
+    assert candles.ts.tolist() == [180, 240, 300, 420, 480]
+    assert isinstance(candles.close.base, np.memmap)
+
+
+def test_get_candles_downloads_once(tmp_path: Path, monkeypatch: tp.Any,
+                                    empty_logger_mock: empty_logger_mock) -> None:
+    downloaded: tp.List[tp.Tuple[int, int]] = []
+
+    def download_candles(asset_pair: AssetPair, timeframe: Timeframe,
+                         time_range: TimeRange) -> CandleSeries:
+        downloaded.append((time_range.from_ts, time_range.to_ts))
+        return exchange_candles(time_range)
+
+    monkeypatch.setattr(MarketDataDownloader, '_Config', {'cache_path': str(tmp_path)})
+    monkeypatch.setattr(MarketDataDownloader, '_download_candles', download_candles)
+
+    def get_candles(from_ts: int, to_ts: int) -> CandleSeries:
+        return MarketDataDownloader.get_candles(
+            asset_pair=asset_pair, timeframe=timeframe,
+            time_range=TimeRange(from_ts, to_ts))
+
+    first = get_candles(6000, 12000)
+    assert first.ts.tolist() == exchange_candles(TimeRange(6000, 12000)).ts.tolist()
+    assert get_candles(6000, 12000).get_fingerprint() == first.get_fingerprint()
+    assert get_candles(3000, 15000).to_candles() == \
+        exchange_candles(TimeRange(3000, 15000)).to_candles()
+    assert downloaded == [(6000, 12000), (3000, 5999), (12001, 15000)]
+
+
+def test_refetched_candles_replace_cached(tmp_path: Path) -> None:
+    cache = CandlesCache(tmp_path, asset_pair, timeframe)
+    cache.put(exchange_candles(TimeRange(120, 240)), TimeRange(120, 240))
+    refetched = exchange_candles(TimeRange(240, 360))
+    refetched = CandleSeries.from_columns(
+        **{**refetched.get_columns(), 'close': refetched.close + 5})
+    cache.put(refetched, TimeRange(240, 360))
+
+    candles = cache.get(TimeRange(120, 360))
+    assert candles.ts.tolist() == [120, 180, 240, 300, 360]
+    assert candles.close.tolist() == [3., 4., 10., 11., 12.]
@@ -1,10 +1,22 @@
+import json
+import threading
+import time
+import typing as tp
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
 import pytest
 
 from tests.configs import base_config
 from helpers.typing.common_types import ConfigsScope
 
+from logger.logger import Logger
 from market_data_api.market_data_downloader import MarketDataDownloader
-from trading import Timeframe, AssetPair, Asset, TimeRange
+from trading import Timeframe, AssetPair, Asset, TimeRange, CandleSeries
+
+from tests.logger.empty_logger_mock import empty_logger_mock
 
 
 @pytest.mark.parametrize("timeframe, candle_count", [
@@ -21,3 +33,75 @@ def test_candle_count(timeframe: str, candle_count: int, base_config: ConfigsSco
             to_ts='2021-03-01 02:00:00'
         ))
     assert len(candles) == candle_count
+
+
+def test_fill_gaps() -> None:
+    nan = None
+    candles = CandleSeries.from_columns(
+        ts=[0, 1, 2, 3, 4, 5],
+        open=[nan, 1, nan, nan, 3, nan],
+        close=[nan, 2, nan, nan, 4, nan],
+        low=[nan, 1, nan, nan, 3, nan],
+        high=[nan, 2, nan, nan, 4, nan],
+        volume=[nan, 5, nan, nan, 6, nan])
+    filled = MarketDataDownloader._fill_gaps(candles)
+    assert filled.ts.tolist() == [1, 2, 3, 4, 5]
+    assert filled.open.tolist() == [1, 2, 2, 3, 4]
+    assert filled.close.tolist() == [2, 2, 2, 4, 4]
+    assert filled.volume.tolist() == [5, 0, 0, 6, 0]
+
+
+class ExchangeStandIn(BaseHTTPRequestHandler):
+    """ Serves one-minute candles with close equal to the candle index """
+    active_requests = 0
+    max_active_requests = 0
+    lock = threading.Lock()
+
+    def do_GET(self) -> None:
+        with ExchangeStandIn.lock:
+            ExchangeStandIn.active_requests += 1
+            ExchangeStandIn.max_active_requests = max(
+                ExchangeStandIn.max_active_requests, ExchangeStandIn.active_requests)
+        time.sleep(0.05)
+        params = parse_qs(urlparse(self.path).query)
+        from_ts = -(-int(params['timeStart'][0]) // 60000) * 60
+        to_ts = int(params['timeEnd'][0]) // 1000
+        candles = [{'data': {
+            'time': datetime.fromtimestamp(ts, timezone.utc).isoformat(),
+            'open': ts // 60, 'close': ts // 60, 'low': ts // 60,
+            'high': ts // 60, 'volume': 1}} for ts in range(from_ts, to_ts + 1, 60)]
+        body = json.dumps({'data': candles}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with ExchangeStandIn.lock:
+            ExchangeStandIn.active_requests -= 1
+
+    def log_message(self, *args: tp.Any) -> None:
+        pass
+
+
+def test_concurrent_download(monkeypatch: tp.Any,
+                             empty_logger_mock: empty_logger_mock) -> None:
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ExchangeStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        monkeypatch.setattr(MarketDataDownloader, '_Config', {
+            'market_data_host': f'http://127.0.0.1:{server.server_port}',
+            'candles_per_request': 10,
+            'download_threads': 4,
+            'cache_path': None})
+        monkeypatch.setattr(MarketDataDownloader, '_Exchange', SimpleNamespace(
+            markets={'WAVES/USDN': {'id': 'WAVES/USDN'}}))
+        monkeypatch.setattr(MarketDataDownloader, '_Logger', Logger('MarketDataDownloader'))
+        candles = MarketDataDownloader.get_candles(
+            asset_pair=AssetPair(Asset('WAVES'), Asset('USDN')),
+            timeframe=Timeframe('1m'),
+            time_range=TimeRange(60 * 1000, 60 * 1234))
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert candles.close.tolist() == list(range(1000, 1235))
+    assert ExchangeStandIn.max_active_requests > 1
@@ -0,0 +1,98 @@
+import os
+import pickle
+import typing as tp
+from copy import deepcopy
+from pathlib import Path
+
+import pytest
+
+from helpers.typing.common_types import Config, ConfigsScope
+
+from market_data_api.market_data_downloader import MarketDataDownloader
+from strategies.grid_strategy.grid_strategy import GridStrategy
+from strategies.results_cache import ResultsCache
+from strategies.strategy_runner import StrategyRunner
+from trading import TimeRange
+from trading_interface.simulator.price_simulator import PriceSimulator
+from trading_system.trading_statistics import TradingStatistics
+
+from tests.configs.base_config import *
+from tests.logger.empty_logger_mock import empty_logger_mock
+from tests.strategies.search_engine_test import get_candles, strategy_config
+
+
+def test_key_is_order_independent() -> None:
+    assert ResultsCache.get_key(a={'x': 1, 'y': 2}, b=[1, 2]) == \
+        ResultsCache.get_key(b=[1, 2], a={'y': 2, 'x': 1})
+    assert ResultsCache.get_key(a={'x': 1}) != ResultsCache.get_key(a={'x': 2})
+
+
+def test_get_put(tmp_path: Path) -> None:
+    cache = ResultsCache(tmp_path, max_size=2 ** 20)
+    key = ResultsCache.get_key(a=1)
+    assert cache.get(key) is None
+
+    stats = TradingStatistics(initial_balance=1, start_timestamp=2)
+    dump_path = tmp_path / 'events.dump'
+    dump_path.write_bytes(b'events')
+    cache.put(key, stats, dump_path)
+    cached = cache.get(key)
+    assert cached is not None and cached.start_timestamp == 2
+    assert cache.get_dump(key, tmp_path / 'copy.dump')
+    assert (tmp_path / 'copy.dump').read_bytes() == b'events'
+
+
+def test_lru_eviction(tmp_path: Path) -> None:
+    dump_path = tmp_path / 'events.dump'
+    dump_path.write_bytes(b'0' * 1000)
+    entry_size = 1000 + len(pickle.dumps(TradingStatistics()))
+    cache = ResultsCache(tmp_path / 'cache', max_size=int(3.5 * entry_size))
+    keys = [ResultsCache.get_key(i=i) for i in range(4)]
+    for i, key in enumerate(keys[:3]):
+        cache.put(key, TradingStatistics(), dump_path)
+        # Entries differ in access time by whole seconds
+        os.utime(cache._get_path(key, 'stats'), (i, i))
+    assert cache.get(keys[0]) is not None
+
+    cache.put(keys[3], TradingStatistics(), dump_path)
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(key) is not None for key in [keys[0], keys[2], keys[3]])
+
+
+def test_runner_cache_hit(base_config: ConfigsScope,
+                          simulator_config: Config,
+                          monkeypatch: tp.Any, tmp_path: Path,
+                          empty_logger_mock: empty_logger_mock) -> None:
+    monkeypatch.setattr(MarketDataDownloader, 'get_candles', get_candles)
+    config = deepcopy(base_config)
+    config['strategy_runner']['results_cache'] = {
+        'path': str(tmp_path / 'cache'), 'max_size_mb': 1, 'store_dump': True}
+    time_range = TimeRange.from_iso_format(from_ts='2021-02-10 00:00:00',
+                                           to_ts='2021-02-10 12:00:00')
+
+    def run(params: Config) -> TradingStatistics:
+        runner = StrategyRunner(base_config=config,
+                                simulator_config=simulator_config,
+                                exchange_config={})
+        runner.set_strategy(GridStrategy, {**strategy_config, **params})
+        return runner.run_simulation(time_range=time_range, logs_path=tmp_path / 'logs',
+                                     print_stats=False)
+
+    stats = run({})
+    # Hits skip the simulation and building of the price paths
+    monkeypatch.setattr(StrategyRunner, '_init_trading', pytest.fail)
+    price_matrices = []
+    get_price_matrix = PriceSimulator.get_price_matrix
+
+    def count_price_matrices(self: PriceSimulator, candles: tp.Any) -> tp.Any:
+        price_matrices.append(len(candles))
+        return get_price_matrix(self, candles)
+
+    monkeypatch.setattr(PriceSimulator, 'get_price_matrix', count_price_matrices)
+    cached = run({})
+    assert not price_matrices
+    assert cached.final_balance == stats.final_balance
+    assert cached.filled_order_count == stats.filled_order_count
+    with pytest.raises(pytest.fail.Exception):
+        run({'interval': 0.005})
+    assert len(price_matrices) == 1
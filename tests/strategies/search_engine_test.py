@@ -0,0 +1,150 @@
+import typing as tp
+
+import numpy as np
+import pytest
+
+from helpers.typing.common_types import Config, ConfigsScope
+
+from market_data_api.market_data_downloader import MarketDataDownloader
+from strategies.grid_strategy.grid_strategy import GridStrategy
+from strategies.search_engine import SearchEngine, params_grid
+from strategies.strategy_runner import StrategyRunner
+from trading import AssetPair, CandleSeries, Timeframe, TimeRange
+
+from tests.configs.base_config import *
+from tests.logger.empty_logger_mock import empty_logger_mock
+
+strategy_config = {
+    "asset_pair": ["WAVES", "USDN"],
+    "total_levels": 7,
+    "base_price": 1.5,
+    "interval": 0.002,
+    "window_size": 20,
+    "min_amount": 1
+}
+
+
+def get_candles(asset_pair: AssetPair, timeframe: Timeframe,
+                time_range: TimeRange) -> CandleSeries:
+    ts = np.arange(time_range.from_ts, time_range.to_ts, timeframe.to_seconds())
+    rng = np.random.default_rng(0)
+    close = 1.5 + np.cumsum(rng.normal(0, 0.005, len(ts)))
+    open = np.concatenate([[1.5], close[:-1]])
+    return CandleSeries.from_columns(
+        ts=ts, open=open, close=close,
+        low=np.minimum(open, close) - rng.random(len(ts)) * 0.005,
+        high=np.maximum(open, close) + rng.random(len(ts)) * 0.005,
+        volume=np.ones(len(ts)))
+
+
+def test_params_grid() -> None:
+    assert list(params_grid([{'a': [1, 2], 'b': [3]}, {'a': [4], 'c': [5]}])) == \
+        [{'a': 1, 'b': 3}, {'a': 2, 'b': 3}, {'a': 4, 'c': 5}]
+
+
+def test_search_matches_runner(base_config: ConfigsScope,
+                               simulator_config: Config,
+                               monkeypatch: tp.Any, tmp_path: tp.Any,
+                               empty_logger_mock: empty_logger_mock) -> None:
+    monkeypatch.setattr(MarketDataDownloader, 'get_candles', get_candles)
+    time_range = TimeRange.from_iso_format(from_ts='2021-02-10 00:00:00',
+                                           to_ts='2021-02-11 00:00:00')
+    params_space = list(params_grid([{'interval': [0.002, 0.005],
+                                      'total_levels': [3, 7]}]))
+    engine = SearchEngine(base_config=base_config,
+                          simulator_config=simulator_config,
+                          strategy_class=GridStrategy,
+                          strategy_config=strategy_config,
+                          processes=2,
+                          logs_path=tmp_path)
+    results = list(engine.search(params_space, time_range))
+    assert sorted(tuple(sorted(params.items())) for params, _ in results) == \
+        sorted(tuple(sorted(params.items())) for params in params_space)
+
+    for params, stats in results:
+        runner = StrategyRunner(base_config=base_config,
+                                simulator_config=simulator_config,
+                                exchange_config={})
+        runner.set_strategy(GridStrategy, {**strategy_config, **params})
+        expected = runner.run_simulation(time_range=time_range, logs_path=tmp_path,
+                                         print_stats=False)
+        assert stats.final_balance == pytest.approx(expected.final_balance)
+        assert stats.filled_order_count == expected.filled_order_count
+
+
+def test_successive_halving(base_config: ConfigsScope,
+                            simulator_config: Config,
+                            monkeypatch: tp.Any, tmp_path: tp.Any,
+                            empty_logger_mock: empty_logger_mock) -> None:
+    monkeypatch.setattr(MarketDataDownloader, 'get_candles', get_candles)
+    time_range = TimeRange.from_iso_format(from_ts='2021-02-10 00:00:00',
+                                           to_ts='2021-02-11 00:00:00')
+    params_space = list(params_grid([{'interval': [0.002, 0.005],
+                                      'total_levels': [3, 7]}]))
+    engine = SearchEngine(base_config=base_config,
+                          simulator_config=simulator_config,
+                          strategy_class=GridStrategy,
+                          strategy_config=strategy_config,
+                          processes=2,
+                          logs_path=tmp_path)
+    evaluated: tp.List[tp.Tuple[int, int]] = []
+    evaluate_all = SearchEngine._evaluate_all
+
+    def count_evaluations(self: SearchEngine, candidates: tp.Any,
+                          time_range: TimeRange) -> tp.Any:
+        candidates = list(candidates)
+        evaluated.append((len(candidates), time_range.get_range()))
+        return evaluate_all(self, candidates, time_range)
+
+    monkeypatch.setattr(SearchEngine, '_evaluate_all', count_evaluations)
+    results = engine.successive_halving(
+        params_space, time_range, min_range=6 * 3600,
+        score=lambda stats: stats.calc_absolute_delta())
+    assert evaluated == [(4, 6 * 3600), (2, 12 * 3600), (1, 24 * 3600)]
+    assert len(results) == 1
+    finish_timestamp = results[0][1].finish_timestamp
+    assert finish_timestamp is not None and finish_timestamp > time_range.to_ts - 3600
+
+
+def test_successive_halving_all_failed(base_config: ConfigsScope,
+                                      simulator_config: Config,
+                                      monkeypatch: tp.Any, tmp_path: tp.Any,
+                                      empty_logger_mock: empty_logger_mock) -> None:
+    monkeypatch.setattr(MarketDataDownloader, 'get_candles', get_candles)
+    time_range = TimeRange.from_iso_format(from_ts='2021-02-10 00:00:00',
+                                           to_ts='2021-02-11 00:00:00')
+    # GridStrategy fails without total_levels
+    broken_config = {key: value for key, value in strategy_config.items()
+                     if key != 'total_levels'}
+    engine = SearchEngine(base_config=base_config,
+                          simulator_config=simulator_config,
+                          strategy_class=GridStrategy,
+                          strategy_config=broken_config,
+                          processes=2,
+                          logs_path=tmp_path)
+    with pytest.raises(RuntimeError, match='All 2 evaluations'):
+        engine.successive_halving(
+            params_grid([{'interval': [0.002, 0.005]}]), time_range,
+            min_range=6 * 3600, score=lambda stats: stats.calc_absolute_delta())
+
+
+@pytest.mark.parametrize('params_space,min_range,eta', [
+    ([{'interval': 0.002}], 3600, 1),
+    ([{'interval': 0.002}], 3600, 0),
+    ([{'interval': 0.002}], 0, 2),
+    ([], 3600, 2),
+])
+def test_successive_halving_invalid_args(base_config: ConfigsScope,
+                                         simulator_config: Config,
+                                         params_space: tp.List[Config],
+                                         min_range: int, eta: int) -> None:
+    engine = SearchEngine(base_config=base_config,
+                          simulator_config=simulator_config,
+                          strategy_class=GridStrategy,
+                          strategy_config=strategy_config)
+    time_range = TimeRange.from_iso_format(from_ts='2021-02-10 00:00:00',
+                                           to_ts='2021-02-11 00:00:00')
+    with pytest.raises(ValueError):
+        engine.successive_halving(params_space, time_range, min_range=min_range,
+                                  score=lambda stats: stats.calc_absolute_delta(),
+                                  eta=eta)
@@ -0,0 +1,69 @@
+import typing as tp
+
+from strategies.signal_bus import SignalBus
+from tests.logger.empty_logger_mock import empty_logger_mock
+from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
+from trading import Candle, Signal
+from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
+from trading_system.indicators import MovingAverageHandler
+from trading_system.trading_system import TradingSystem
+from trading_system.trading_system_handler import TradingSystemHandler
+
+
+class DetectorMock(TradingSignalDetector):
+    signal_names = ('mock',)
+    subscribes_to_candles = True
+
+    def __init__(self, handlers: tp.List[TradingSystemHandler]):
+        self.handlers = handlers
+        self.call_count = 0
+        self.candles: tp.List[Candle] = []
+        self.updates: tp.List[tp.List[str]] = []
+
+    def get_required_handlers(self) -> tp.List[TradingSystemHandler]:
+        return self.handlers
+
+    def get_trading_signals(self) -> tp.List[Signal]:
+        self.call_count += 1
+        return [Signal('mock', self.call_count)]
+
+    def on_new_candle(self, candle: Candle) -> None:
+        self.candles.append(candle)
+
+    def on_handler_updated(self, handlers: tp.List[TradingSystemHandler]) -> None:
+        self.updates.append([handler.get_name() for handler in handlers])
+
+
+class StrategyMock:
+    def __init__(self) -> None:
+        self.signals: tp.List[tp.Any] = []
+
+    def handle_mock_signal(self, content: tp.Any) -> None:
+        self.signals.append(content)
+
+
+def test_dispatch(empty_logger_mock: empty_logger_mock) -> None:
+    ti = TradingInterfaceMock.from_price_values([1, 2, 3, 4, 5])
+    ts = TradingSystem(ti, config={
+        "currency_asset": "USDN", "wallet": {"USDN": 100.0},
+        "handlers_retention": 100, "handlers_history_path": None,
+        "indicators_cache": {"enabled": False, "path": None, "max_size_mb": 1}})
+    handler: MovingAverageHandler = ts.add_handler(MovingAverageHandler, {'window_size': 2})
+    gated, polled = DetectorMock([handler]), DetectorMock([])
+    strategy = StrategyMock()
+    bus = SignalBus(strategy, [gated, polled], ts)
+    assert list(bus.dispatch_table) == ['mock']
+
+    ticks = 0
+    while ti.is_alive():
+        ti.update()
+        for _ in range(3):
+            ts.update()
+            bus.dispatch()
+            ticks += 1
+    # The moving average has values from the second candle
+    assert (gated.call_count, polled.call_count) == (3, ticks)
+    assert gated.updates == [[handler.get_name()]] * 3
+    assert [candle.ts for candle in polled.candles] == [0, 1, 2, 3]
+    assert polled.updates == []
+    assert len(strategy.signals) == 3 + ticks
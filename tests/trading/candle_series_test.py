@@ -0,0 +1,56 @@
+import numpy as np
+import typing as tp
+import pytest
+
+from trading import Candle, CandleSeries, TimeRange
+
+candles = [Candle(i, i + 1., i + 2., i + .5, i + 3., 10. * i)
+           for i in range(10)]
+
+
+def test_from_candles_round_trip() -> None:
+    series = CandleSeries.from_candles(candles)
+    assert len(series) == len(candles)
+    assert series.to_candles() == candles
+    assert series[0] == candles[0]
+    assert series[-1] == candles[-1]
+    with pytest.raises(IndexError):
+        series[len(candles)]
+
+
+def test_slices_are_views() -> None:
+    series = CandleSeries.from_candles(candles)
+    window = series[2:7]
+    assert window.to_candles() == candles[2:7]
+    assert np.shares_memory(window.close, series.close)
+    assert window[1:3].to_candles() == candles[3:5]
+    assert len(series[7:2]) == 0
+
+
+@pytest.mark.parametrize("n,end", [(3, None), (3, 5), (20, 5), (3, 0),
+                                   (3, 20)])
+def test_get_last_n(n: int, end: int) -> None:
+    series = CandleSeries.from_candles(candles)
+    stop = len(candles) if end is None else min(end, len(candles))
+    assert series.get_last_n(n, end).to_candles() == \
+        candles[max(0, stop - n):stop]
+
+
+def test_vectorized_prices() -> None:
+    series = CandleSeries.from_candles(candles)
+    assert series.get_mid_prices().tolist() == \
+        [c.get_mid_price() for c in candles]
+    assert series.get_deltas().tolist() == [c.get_delta() for c in candles]
+    assert series.get_lower_prices().tolist() == \
+        [c.get_lower_price() for c in candles]
+    assert series.get_upper_prices().tolist() == \
+        [c.get_upper_price() for c in candles]
+
+
+@pytest.mark.parametrize("from_ts,to_ts,expected", [
+    (3, 6, candles[3:7]), (-5, 2, candles[:3]), (8, 100, candles[8:]),
+    (20, 30, [])])
+def test_get_time_range(from_ts: int, to_ts: int,
+                        expected: tp.List[Candle]) -> None:
+    series = CandleSeries.from_candles(candles)
+    assert series.get_time_range(TimeRange(from_ts, to_ts)).to_candles() == expected
@@ -0,0 +1,42 @@
+import multiprocessing as mp
+import pickle
+
+import numpy as np
+
+from trading import Candle, CandleSeries, SharedCandleSeries
+
+candles = [Candle(i, i + 1., i + 2., i + .5, i + 3., 10. * i)
+           for i in range(10)]
+
+
+def sum_closes(series: CandleSeries) -> float:
+    return float(series.close.sum())
+
+
+def test_shared_round_trip() -> None:
+    series = SharedCandleSeries.create(CandleSeries.from_candles(candles))
+    try:
+        assert series.to_candles() == candles
+        attached = pickle.loads(pickle.dumps(series[2:5]))
+        assert isinstance(attached, SharedCandleSeries)
+        assert attached.to_candles() == candles[2:5]
+
+        series.close[3] = 100.
+        assert attached[1].close == 100.
+        attached.detach()
+    finally:
+        series.detach()
+        series.unlink()
+
+
+def test_shared_with_workers() -> None:
+    series = SharedCandleSeries.create(CandleSeries.from_candles(candles))
+    try:
+        windows = [series[i:i + 3] for i in range(0, 9, 3)]
+        with mp.Pool(processes=2) as pool:
+            sums = pool.map(sum_closes, windows)
+        assert sums == [float(np.sum(window.close)) for window in windows]
+        del windows
+    finally:
+        series.detach()
+        series.unlink()
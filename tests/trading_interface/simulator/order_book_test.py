@@ -0,0 +1,68 @@
+import numpy as np
+
+from trading import Order, Direction, AssetPair
+from trading_interface.simulator.order_book import OrderBook
+
+
+def make_order(order_id: int, price: float, direction: Direction) -> Order:
+    return Order(order_id=str(order_id), asset_pair=AssetPair('WAVES', 'USDN'),
+                 amount=1, price=price, timestamp=0, direction=direction)
+
+
+def test_pop_crossed() -> None:
+    book = OrderBook()
+    buys = [make_order(i, price, Direction.BUY)
+            for i, price in enumerate([1, 3, 2])]
+    sells = [make_order(i + 3, price, Direction.SELL)
+             for i, price in enumerate([6, 4, 5])]
+    for order in buys + sells:
+        book.add(order)
+    assert book.get_best_buy_price() == 3
+    assert book.get_best_sell_price() == 4
+
+    assert book.pop_crossed(buy_price=3.5, sell_price=3.5) == []
+    assert book.pop_crossed(buy_price=5.5, sell_price=1.5) == \
+        [buys[1], buys[2], sells[1], sells[2]]
+    assert len(book) == 2
+    assert book.get_best_buy_price() == 1
+    assert book.get_best_sell_price() == 6
+
+
+def test_remove() -> None:
+    book = OrderBook()
+    orders = [make_order(i, i, Direction.SELL) for i in range(5)]
+    for order in orders:
+        book.add(order)
+    assert book.remove(orders[0])
+    assert not book.remove(orders[0])
+    assert orders[0] not in book
+    assert book.get_best_sell_price() == 1
+    assert book.pop_crossed(buy_price=3, sell_price=10) == orders[1:3]
+    assert not book.remove(orders[1])
+    book.clear()
+    assert len(book) == 0
+    assert book.get_best_sell_price() is None
+
+
+def test_matches_linear_scan() -> None:
+    rng = np.random.default_rng(0)
+    book = OrderBook()
+    active = {}
+    for i in range(2000):
+        direction = Direction.BUY if rng.random() < 0.5 else Direction.SELL
+        order = make_order(i, float(rng.random()), direction)
+        book.add(order)
+        active[order.order_id] = order
+        if rng.random() < 0.2:
+            removed = active.pop(rng.choice(list(active)))
+            assert book.remove(removed)
+
+        price = float(rng.random())
+        expected = {order_id for order_id, order in active.items()
+                    if (order.direction == Direction.BUY and order.price > price * 1.1) or
+                    (order.direction == Direction.SELL and order.price < price * 0.9)}
+        filled = book.pop_crossed(buy_price=price * 0.9, sell_price=price * 1.1)
+        assert {order.order_id for order in filled} == expected
+        for order_id in expected:
+            del active[order_id]
+        assert len(book) == len(active)
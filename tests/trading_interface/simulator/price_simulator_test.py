@@ -1,9 +1,11 @@
 import pytest
 import numpy as np
+import typing as tp
 
 from trading_interface.simulator.price_simulator import PriceSimulator, \
     PriceSimulatorType
 from trading.candle import Candle
+from trading.candle_series import CandleSeries
 
 from tests.logger.empty_logger_mock import empty_logger_mock
 
@@ -74,3 +76,49 @@ def test_same_values(candles_lifetime: int, total_steps: int,
     print(res)
     assert isinstance(res, list)
     assert len(res) == total_steps
+
+
+def random_candles(count: int) -> tp.List[Candle]:
+    candles = []
+    for i in range(count):
+        vals = sorted(np.random.random(4))
+        if i % 2:
+            candles.append(Candle(i, vals[1], vals[2], vals[0], vals[3], 1))
+        else:
+            candles.append(Candle(i, vals[2], vals[1], vals[0], vals[3], 1))
+    candles.append(Candle(count, 1, 1, 1, 1, 1))
+    return candles
+
+
+@pytest.mark.parametrize("candles_lifetime", [2, 4, 5, 20])
+@pytest.mark.parametrize("simulation_type", [PriceSimulatorType.ThreeIntervalPath,
+                                             PriceSimulatorType.Uniform])
+def test_price_matrix_matches_get_price(
+        candles_lifetime: int, simulation_type: PriceSimulatorType,
+        empty_logger_mock: empty_logger_mock) -> None:
+    candles = random_candles(200)
+    ps = PriceSimulator(candles_lifetime, simulation_type)
+    matrix = ps.get_price_matrix(CandleSeries.from_candles(candles))
+    expected = [[ps.get_price(candle, i) for i in range(candles_lifetime)]
+                for candle in candles]
+    assert matrix.shape == (len(candles), candles_lifetime)
+    assert matrix.tolist() == expected
+
+
+def test_price_matrix_noise_bounds(
+        empty_logger_mock: empty_logger_mock) -> None:
+    candles = CandleSeries.from_candles(random_candles(200))
+    ps = PriceSimulator(20, PriceSimulatorType.ThreeIntervalPathNoise)
+    matrix = ps.get_price_matrix(candles)
+    assert (matrix >= candles.low[:, None]).all()
+    assert (matrix <= candles.high[:, None]).all()
+    assert (matrix[:, 0] == candles.open).all()
+    assert (matrix[:, -1] == candles.close).all()
+
+
+def test_price_matrix_cache(empty_logger_mock: empty_logger_mock) -> None:
+    candles = random_candles(50)
+    ps = PriceSimulator(20, PriceSimulatorType.ThreeIntervalPath)
+    matrix = ps.get_price_matrix(CandleSeries.from_candles(candles))
+    assert ps.get_price_matrix(CandleSeries.from_candles(candles)) is matrix
+    assert not matrix.flags.writeable
@@ -0,0 +1,87 @@
+import pytest
+import numpy as np
+import typing as tp
+
+from helpers.typing.common_types import Config
+
+from market_data_api.market_data_downloader import MarketDataDownloader
+from trading_interface.simulator.clock_simulator import ClockSimulator
+from trading_interface.simulator.simulator import Simulator
+from trading import AssetPair, CandleSeries, Timeframe, TimeRange
+
+from tests.configs.base_config import *
+from tests.logger.empty_logger_mock import empty_logger_mock
+
+
+@pytest.fixture
+def random_candles(monkeypatch: tp.Any) -> None:
+    def get_candles(asset_pair: AssetPair, timeframe: Timeframe,
+                    time_range: TimeRange) -> CandleSeries:
+        step = timeframe.to_seconds()
+        ts = np.arange(time_range.from_ts, time_range.to_ts, step)
+        rng = np.random.default_rng(0)
+        close = 5 + np.cumsum(rng.normal(0, 0.05, len(ts)))
+        open = np.concatenate([[5], close[:-1]])
+        return CandleSeries.from_columns(
+            ts=ts, open=open, close=close,
+            low=np.minimum(open, close) - rng.random(len(ts)) * 0.05,
+            high=np.maximum(open, close) + rng.random(len(ts)) * 0.05,
+            volume=np.ones(len(ts)))
+
+    monkeypatch.setattr(MarketDataDownloader, 'get_candles', get_candles)
+
+
+def run_orders(trading_interface_config: Config, simulator_config: Config,
+               event_driven: bool) -> tp.Tuple[tp.List[tp.Tuple[int, str]], int, tp.List[int]]:
+    """
+    Places orders around the price on new candles, returns fill timestamps,
+    number of steps and ticks counted by the steps on every new candle
+    """
+    config = {**simulator_config, 'clock_simulator': {
+        **simulator_config['clock_simulator'], 'event_driven': event_driven}}
+    simulator = Simulator(
+        time_range=TimeRange.from_iso_format(from_ts='2021-02-10 00:00:00',
+                                             to_ts='2021-02-12 00:00:00'),
+        trading_config=trading_interface_config,
+        exchange_config=config)
+    orders: tp.List[tp.Any] = []
+    fills = []
+    iterations = 0
+    ticks = 0
+    candle_ticks = []
+    while simulator.is_alive():
+        iterations += 1
+        ticks += simulator.get_clock().get_ticks_passed()
+        for order in orders:
+            if simulator.order_is_filled(order):
+                fills.append((simulator.get_timestamp(), order.order_id))
+        orders = [order for order in orders
+                  if not simulator.order_is_filled(order)]
+        if simulator.get_clock().get_current_candle_lifetime() == 0:
+            candle_ticks.append(ticks)
+            simulator.cancel_all()
+            price = simulator.get_buy_price()
+            orders = [simulator.buy(1, price * 0.995),
+                      simulator.sell(1, price * 1.005)]
+    return fills, iterations, candle_ticks
+
+
+def test_event_driven_fills(trading_interface_config: Config,
+                            simulator_config: Config,
+                            random_candles: random_candles,
+                            empty_logger_mock: empty_logger_mock) -> None:
+    fills, iterations, ticks = run_orders(
+        trading_interface_config, simulator_config, event_driven=False)
+    event_fills, event_iterations, event_ticks = run_orders(
+        trading_interface_config, simulator_config, event_driven=True)
+    assert len(fills) > 10
+    assert event_fills == fills
+    assert event_iterations < iterations / 5
+    # Strategies counting ticks see the same market time
+    assert len(ticks) > 10
+    assert event_ticks == ticks
+
+
+def test_tick_by_tick_by_default() -> None:
+    clock = ClockSimulator(0, Timeframe('5m'), {'candles_lifetime': 20})
+    assert not clock.event_driven
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from logger.clock import Clock
 from trading import Candle, AssetPair, Asset, Order, Direction
 from trading_interface.trading_interface import TradingInterface
 import typing as tp
@@ -39,6 +40,9 @@ class TradingInterfaceMock(TradingInterface):
     def is_alive(self) -> bool:
         return len(self.processed_candles) < len(self.all_candles)
 
+    def get_clock(self) -> Clock:
+        return Clock()
+
     def get_timestamp(self) -> int:
         return len(self.processed_candles)
 
@@ -0,0 +1,61 @@
+import typing as tp
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tests.logger.empty_logger_mock import empty_logger_mock
+from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
+from trading import TrendType
+from trading_signal_detectors import StochasticRSISignalDetector
+from trading_system.trading_system import TradingSystem
+
+
+def reference_crossings(rsi_values: tp.List[float], stoch_len: int,
+                        k: int, d: int) -> tp.Tuple[float, float]:
+    """ %K and %D by pandas over the last RSI values """
+    values = pd.Series(rsi_values[-(stoch_len + k + d - 1):])
+    low = values.rolling(stoch_len).min()
+    high = values.rolling(stoch_len).max()
+    stoch = ((values - low) / (high - low))[-(k + d - 1):]
+    k_sma = stoch.rolling(k).mean()
+    return k_sma.iloc[-1], k_sma.rolling(d).mean().iloc[-1]
+
+
+@pytest.mark.parametrize("stoch_len,k,d", [(14, 3, 3), (5, 4, 2)])
+def test_stochastic_rsi(stoch_len: int, k: int, d: int,
+                        empty_logger_mock: empty_logger_mock) -> None:
+    values = list(100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 300)))
+    ti = TradingInterfaceMock.from_price_values(values)
+    ts = TradingSystem(ti, config={
+        "currency_asset": "USDN", "wallet": {"USDN": 100.0},
+        "handlers_retention": 100, "handlers_history_path": None,
+        "indicators_cache": {"enabled": False, "path": None, "max_size_mb": 1}})
+    detector = StochasticRSISignalDetector(ts, rsi_len=5, stoch_len=stoch_len, k=k, d=d)
+    ts.add_detector(detector)
+
+    prev = (0., 0.)
+    signals: tp.List[tp.List[tp.Any]] = []
+    expected: tp.List[tp.List[TrendType]] = []
+    while ti.is_alive():
+        ti.update()
+        ts.update()
+        # Signals are taken once
+        signals.append([s.content for s in detector.get_trading_signals() +
+                        detector.get_trading_signals()])
+
+        rsi_values = detector.rsi.get_last_n_values(stoch_len + k + d - 1)
+        if len(rsi_values) < stoch_len + k + d - 1:
+            expected.append([])
+            continue
+        k_sma, d_sma = reference_crossings(rsi_values, stoch_len, k, d)
+        trend = TrendType.UPTREND if prev[0] < prev[1] and k_sma > d_sma else \
+            TrendType.DOWNTREND if prev[0] > prev[1] and k_sma < d_sma else None
+        expected.append([] if trend is None else [trend])
+        prev = (k_sma, d_sma)
+        if not np.isnan(k_sma):
+            assert detector.prev_k_sma == pytest.approx(k_sma)
+            assert detector.prev_d_sma == pytest.approx(d_sma)
+
+    assert signals == expected
+    assert sum(map(len, signals)) > 10
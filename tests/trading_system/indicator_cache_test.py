@@ -0,0 +1,86 @@
+import typing as tp
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pytest
+from mock import MagicMock
+
+from tests.logger.empty_logger_mock import empty_logger_mock
+from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
+from tests.trading_system.indicators.test_series import get_candles
+from trading import CandleSeries
+from trading_system.indicator_cache import IndicatorCache
+from trading_system.indicators import *
+from trading_system.trading_system import TradingSystem
+
+
+class SimulationMock(TradingInterfaceMock):
+    def get_candle_series(self) -> CandleSeries:
+        return CandleSeries.from_candles(self.all_candles)
+
+
+handler_params: tp.List[tp.Tuple[tp.Any, tp.Dict[str, tp.Any]]] = [
+    (ExpMovingAverageHandler, {'window_size': 7}),
+    (MovingAverageHandler, {'window_size': 7}),
+    (RelativeStrengthIndexHandler, {'window_size': 5}),
+    (RelativeStrengthIndexHandler, {'window_size': 5, 'mode': RSIMode.Wilder}),
+    (MovingAverageCDHandler, {'short': 4, 'long': 9, 'average': 6}),
+]
+
+
+def run(cache_path: tp.Optional[Path], enabled: bool) -> tp.List[tp.List[tp.Any]]:
+    ti = SimulationMock(get_candles(100).to_candles())
+    for _ in range(30):
+        ti.update()
+    ts = TradingSystem(ti, config={
+        "currency_asset": "USDN", "wallet": {"USDN": 100.0},
+        "handlers_retention": None, "handlers_history_path": None,
+        "indicators_cache": {"enabled": enabled, "path": cache_path and str(cache_path),
+                             "max_size_mb": 1}})
+    handlers: tp.List[tp.Any] = [ts.add_handler(handler_type, params)
+                                 for handler_type, params in handler_params]
+    while ti.is_alive():
+        ts.update()
+        ti.update()
+    return [handler.get_last_n_values(100) for handler in handlers]
+
+
+@pytest.fixture
+def clear_cache(monkeypatch: tp.Any) -> None:
+    monkeypatch.setattr(IndicatorCache, '_series', OrderedDict())
+    monkeypatch.setattr(IndicatorCache, '_series_size', 0)
+
+
+def test_precomputed_values(tmp_path: Path, monkeypatch: tp.Any, clear_cache: None,
+                            empty_logger_mock: empty_logger_mock) -> None:
+    expected = run(None, enabled=False)
+    cached = run(tmp_path, enabled=True)
+    for values, handler_values in zip(cached, expected):
+        assert len(values) == len(handler_values) > 50
+        np.testing.assert_allclose(values, handler_values, rtol=1e-9)
+
+    # Series are taken from memory and then from disk
+    monkeypatch.setattr(MovingAverageHandler, 'compute_series', pytest.fail)
+    assert run(tmp_path, enabled=True)[1] == cached[1]
+    IndicatorCache._series.clear()
+    assert run(tmp_path, enabled=True)[1] == cached[1]
+    # Memory-mapped series don't take the memory of the process
+    assert not IndicatorCache._series
+
+
+def test_eviction(tmp_path: Path, monkeypatch: tp.Any, clear_cache: None,
+                  empty_logger_mock: empty_logger_mock) -> None:
+    ti = SimulationMock(get_candles(1000).to_candles())
+    ti.update()
+    size = 1000 * 8
+    compute_series = MagicMock(wraps=MovingAverageHandler.compute_series)
+    monkeypatch.setattr(MovingAverageHandler, 'compute_series', compute_series)
+    cache = IndicatorCache(max_size=int(2.5 * size), path=tmp_path)
+    for window_size in range(1, 5):
+        assert cache.precompute(MovingAverageHandler(ti, window_size))
+    # Every series is computed once
+    assert compute_series.call_count == 4
+    assert len(IndicatorCache._series) == 2
+    assert len(list(tmp_path.glob('*.npy'))) == 2
+    assert not cache.precompute(TrendHandler(ti))
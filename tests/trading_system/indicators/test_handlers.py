@@ -1,8 +1,10 @@
+import numpy as np
 import pytest
 
 from tests.logger.empty_logger_mock import empty_logger_mock
 
 from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
+from trading import CandleSeries
 from trading_system.trading_system import Handlers
 
 from trading_system.indicators import *
@@ -97,6 +99,35 @@ def test_moving_average_cd_handler(
     )
 
 
+@pytest.mark.parametrize("warmup_size", [0, 3, 80])
+def test_moving_average_cd_handler_long(warmup_size: int,
+                                        empty_logger_mock: empty_logger_mock) \
+        -> None:
+    """ Streaming signal and warmup against the windowed formula. """
+    values = list(np.random.default_rng(0).normal(100, 10, 200))
+    ti = TradingInterfaceMock.from_price_values(values)
+    handler = MovingAverageCDHandler(ti, 4, 9, 6)
+    handlers = Handlers().add(handler)
+    for _ in range(warmup_size):
+        ti.update()
+    handler.warmup(CandleSeries.from_candles(ti.get_last_n_candles(warmup_size)))
+    while ti.is_alive():
+        ti.update()
+        for h in handlers.values():
+            h.update()
+
+    macd = [macd for macd, _ in handler.get_last_n_values(len(values))]
+    mid_prices = [c.get_mid_price() for c in ti.get_last_n_candles(len(values))]
+    assert len(macd) == len(mid_prices)
+    check_results(macd, [
+        ExpMovingAverageHandler.calculate_from(mid_prices[:i + 1], 2 / 5) -
+        ExpMovingAverageHandler.calculate_from(mid_prices[:i + 1], 2 / 10)
+        for i in range(len(mid_prices))])
+    check_results([signal for _, signal in handler.get_last_n_values(len(values))],
+                  [ExpMovingAverageHandler.calculate_from(macd[max(0, i - 5): i + 1])
+                   for i in range(len(macd))])
+
+
 @pytest.mark.parametrize("values,ti", all_samples.values())
 @pytest.mark.parametrize("window_size", [5])
 def test_moving_average_handler(values: tp.List[float],
@@ -116,6 +147,27 @@ def test_moving_average_handler(values: tp.List[float],
     )
 
 
+@pytest.mark.parametrize("window_size", [1, 3, 50])
+def test_moving_average_handler_long(window_size: int,
+                                     empty_logger_mock: empty_logger_mock) -> None:
+    """ Ring buffer wraps many times and reloads after missed candles. """
+    values = list(np.random.default_rng(0).normal(100, 10, 300))
+    ti = TradingInterfaceMock.from_price_values(values)
+    handler = MovingAverageHandler(ti, window_size)
+    expected = []
+    while ti.is_alive():
+        ti.update()
+        if ti.get_timestamp() % 37 == 0:
+            # Several candles arrive between updates
+            ti.update()
+            ti.update()
+        if handler.update():
+            expected.append(MovingAverageHandler.calculate_from(
+                [c.get_mid_price() for c in ti.get_last_n_candles(window_size)]))
+    assert len(expected) > len(values) - window_size - 20
+    check_results(handler.get_last_n_values(len(expected)), expected)
+
+
 @pytest.mark.parametrize("values,ti", all_samples.values())
 @pytest.mark.parametrize("window_size", [5])
 def test_relative_strength_index_handler(values: tp.List[float],
@@ -137,6 +189,49 @@ def test_relative_strength_index_handler(values: tp.List[float],
     )
 
 
+@pytest.mark.parametrize("window_size", [1, 3, 14])
+def test_relative_strength_index_handler_long(window_size: int,
+                                              empty_logger_mock: empty_logger_mock) \
+        -> None:
+    """ Both modes against reference formulas, with missed candles. """
+    values = list(np.random.default_rng(0).normal(100, 10, 300))
+    ti = TradingInterfaceMock.from_price_values(values)
+    windowed = RelativeStrengthIndexHandler(ti, window_size)
+    wilder = RelativeStrengthIndexHandler(ti, window_size, RSIMode.Wilder)
+    assert wilder.get_name() != windowed.get_name()
+
+    expected_windowed = []
+    expected_wilder = []
+    gain, loss = 0., 0.
+    restarted = True
+    while ti.is_alive():
+        ti.update()
+        if ti.get_timestamp() % 37 == 0:
+            ti.update()
+            ti.update()
+            restarted = True
+        windowed.update()
+        if not wilder.update():
+            continue
+        deltas = [c.get_delta() for c in ti.get_last_n_candles(window_size)]
+        expected_windowed.append(
+            RelativeStrengthIndexHandler.calculate_from(deltas)[1])
+        if restarted:
+            gain = sum(max(d, 0) for d in deltas) / window_size
+            loss = sum(max(-d, 0) for d in deltas) / window_size
+            restarted = False
+        else:
+            gain = (gain * (window_size - 1) + max(deltas[-1], 0)) / window_size
+            loss = (loss * (window_size - 1) + max(-deltas[-1], 0)) / window_size
+        expected_wilder.append(100 - 100 / (1 + gain / loss) if loss else 100)
+
+    assert len(expected_windowed) > len(values) - window_size - 20
+    check_results(windowed.get_last_n_values(len(expected_windowed)),
+                  expected_windowed)
+    check_results(wilder.get_last_n_values(len(expected_wilder)),
+                  expected_wilder)
+
+
 @pytest.mark.parametrize("values,ti", all_samples.values())
 @pytest.mark.parametrize("window_size", [5])
 def test_weighted_moving_average_handler(values: tp.List[float],
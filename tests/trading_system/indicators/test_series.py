@@ -0,0 +1,77 @@
+import typing as tp
+
+import numpy as np
+import pytest
+
+from tests.logger.empty_logger_mock import empty_logger_mock
+from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
+from trading import CandleSeries
+from trading_system.trading_system import Handlers
+
+from trading_system.indicators import *
+from trading_system.indicators.accumulation_distribution_handler import AccumulationDistributionHandler
+from trading_system.indicators.on_balance_volume_handler import OnBalanceVolumeHandler
+from trading_system.indicators.volume_relative_strength_index_handler import VolumeRelativeStrengthIndexHandler
+
+
+def get_candles(size: int) -> CandleSeries:
+    rng = np.random.default_rng(0)
+    close = 100 + np.cumsum(rng.normal(0, 1, size))
+    # Repeated prices for zero deltas
+    close[10:15] = close[10]
+    open = np.concatenate([[100], close[:-1]])
+    return CandleSeries.from_columns(
+        ts=np.arange(size), open=open, close=close,
+        low=np.minimum(open, close) - rng.random(size),
+        high=np.maximum(open, close) + rng.random(size),
+        volume=rng.integers(1, 100, size).astype(float))
+
+
+@pytest.mark.parametrize("handler_type,params", [
+    (ExpMovingAverageHandler, {'window_size': 7}),
+    (ExpMovingAverageHandler, {'window_size': 7, 'smoothing': 3}),
+    (MovingAverageHandler, {'window_size': 7}),
+    (WeightedMovingAverageHandler, {'window_size': 7}),
+    (RelativeStrengthIndexHandler, {'window_size': 5}),
+    (RelativeStrengthIndexHandler, {'window_size': 5, 'mode': RSIMode.Wilder}),
+    (MovingAverageCDHandler, {'short': 4, 'long': 9, 'average': 6}),
+    (OnBalanceVolumeHandler, {}),
+    (AccumulationDistributionHandler, {}),
+    (VolumeRelativeStrengthIndexHandler, {'window_size': 5}),
+])
+def test_compute_series(handler_type: tp.Any, params: tp.Dict[str, tp.Any],
+                        empty_logger_mock: empty_logger_mock) -> None:
+    """ Check equality with the values of update() after every candle. """
+    candles = get_candles(200)
+    ti = TradingInterfaceMock(candles.to_candles())
+    handler = handler_type(trading_interface=ti, **params)
+    handlers = Handlers().add(handler)
+    expected = []
+    while ti.is_alive():
+        ti.update()
+        updated = [h.update() for h in handlers.values()][-1]
+        expected.append(handler.get_last_n_values(1)[0] if updated else np.nan)
+
+    np.testing.assert_allclose(handler_type.compute_series(candles, **params),
+                               np.array(expected, dtype=float), rtol=1e-9)
+
+
+@pytest.mark.parametrize("handler_type,params", [
+    (ExpMovingAverageHandler, {'window_size': 7}),
+    (MovingAverageHandler, {'window_size': 7}),
+    (WeightedMovingAverageHandler, {'window_size': 7}),
+    (RelativeStrengthIndexHandler, {'window_size': 5, 'mode': RSIMode.Wilder}),
+    (MovingAverageCDHandler, {'short': 4, 'long': 9, 'average': 6}),
+    (VolumeRelativeStrengthIndexHandler, {'window_size': 5}),
+])
+def test_warmup_length(handler_type: tp.Any, params: tp.Dict[str, tp.Any]) -> None:
+    values = handler_type.compute_series(get_candles(50), **params)
+    is_nan = np.isnan(values.reshape(len(values), -1)).any(axis=1)
+    assert is_nan.argmin() == handler_type.get_warmup_length(**params)
+
+
+def test_compute_series_short(empty_logger_mock: empty_logger_mock) -> None:
+    candles = get_candles(20)[:3]
+    assert np.isnan(MovingAverageHandler.compute_series(candles, 5)).all()
+    assert np.isnan(RelativeStrengthIndexHandler.compute_series(candles, 5)).all()
+    assert MovingAverageCDHandler.compute_series(candles[:0]).shape == (0, 2)
@@ -0,0 +1,76 @@
+import typing as tp
+
+import numpy as np
+import pytest
+
+import base.geometry.convex_hull as geom
+from tests.logger.empty_logger_mock import empty_logger_mock
+from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
+from trading import Candle, TrendLine
+from trading_system.indicators import TrendHandler
+from trading_system.indicators.trend_handler import MIN_CANDLE_COUNT, PRICE_SHIFT
+
+
+def reference_trend_line(points: np.ndarray,
+                         calc_convex_bound: tp.Callable[..., np.ndarray]) \
+        -> tp.Optional[TrendLine]:
+    """ Rebuilds the bound and fits it by sklearn for every suffix """
+    bound = 0.005
+    for _ in range(10):
+        best_line = None
+        convex_bound = calc_convex_bound(points[-MIN_CANDLE_COUNT:], is_sorted=True)
+        for point_count in range(MIN_CANDLE_COUNT + 1, len(points) + 1):
+            convex_bound = calc_convex_bound(np.concatenate(
+                [[points[len(points) - point_count]], convex_bound]), is_sorted=True)
+            line = TrendLine(*geom.put_line(convex_bound))
+            penalty = sum((p[1] - line.get_value_at(p[0])) ** 2 for p in convex_bound)
+            if penalty < bound:
+                best_line = line
+        if best_line is not None:
+            return best_line
+        bound *= 2
+    return None
+
+
+def check_line(line: tp.Optional[TrendLine], expected: tp.Optional[TrendLine],
+               ts: np.ndarray) -> None:
+    assert (line is None) == (expected is None)
+    if line is not None:
+        assert expected is not None
+        assert line.get_value_at(ts) == pytest.approx(expected.get_value_at(ts))
+
+
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+@pytest.mark.parametrize("seed", range(2))
+@pytest.mark.parametrize("volatility", [0.001, 0.01, 0.1])
+def test_trend_lines(seed: int, volatility: float,
+                     empty_logger_mock: empty_logger_mock) -> None:
+    rng = np.random.default_rng(seed)
+    close = 1.5 + np.cumsum(rng.normal(0, volatility, 50))
+    open = np.concatenate([[1.5], close[:-1]])
+    candles = [Candle(ts=1600000000 + 60 * i, open=open[i], close=close[i],
+                      low=min(open[i], close[i]), high=max(open[i], close[i]),
+                      volume=1) for i in range(len(close))]
+    ti = TradingInterfaceMock(candles)
+    handler = TrendHandler(ti)
+    while ti.is_alive():
+        ti.update()
+        lower, upper = handler.get_trend_lines()
+        last_candles = ti.get_last_n_candles(40)
+        if len(last_candles) < MIN_CANDLE_COUNT:
+            assert lower is None and upper is None
+            continue
+
+        ts = np.array([c.ts for c in last_candles])
+        x = ts - ts[0]
+        expected_lower = reference_trend_line(np.array(
+            [[x, c.get_lower_price()] for x, c in zip(x, last_candles)]),
+            geom.get_lower_bound)
+        expected_upper = reference_trend_line(np.array(
+            [[x, c.get_upper_price()] for x, c in zip(x, last_candles)]),
+            geom.get_upper_bound)
+        for line, expected, shift in [(lower, expected_lower, -PRICE_SHIFT),
+                                      (upper, expected_upper, PRICE_SHIFT)]:
+            if expected is not None:
+                expected = TrendLine(expected.k, expected.b - expected.k * ts[0] + shift)
+            check_line(line, expected, ts)
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 import typing as tp
 
@@ -6,9 +7,11 @@ from trading_system.indicators.accumulation_distribution_handler import Accumula
 from trading_system.indicators.on_balance_volume_handler import OnBalanceVolumeHandler
 from trading_system.indicators.volume_relative_strength_index_handler import VolumeRelativeStrengthIndexHandler
 from test_volume_indicators_formulas import AD_TEST_CASES, OBV_TEST_CASES, VRSI_TEST_CASES
+from tests.trading_system.indicators.test_series import get_candles
 from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
 
 from trading.candle import Candle
+from trading.candle_series import CandleSeries
 
 
 def simulate_handler(handler: TradingSystemHandler) -> None:
@@ -43,3 +46,35 @@ def test_relative_strength_index_handler(candles: tp.List[Candle], result: tp.Li
     handler = VolumeRelativeStrengthIndexHandler(ti, window_size=4)
     simulate_handler(handler)
     assert handler.get_last_n_values(len(candles)) == pytest.approx(result, abs=1e-2)
+
+
+@pytest.mark.parametrize("warmup_size", [0, 2, 50])
+def test_volume_handlers_long(warmup_size: int) -> None:
+    """ Streaming updates after a bulk warmup against the list formulas. """
+    candles = get_candles(200)
+    candles = CandleSeries.from_columns(**{
+        **candles.get_columns(),
+        'high': np.where(np.arange(200) % 17 == 0, candles.low, candles.high)})
+    ti = TradingInterfaceMock(candles.to_candles())
+    for _ in range(warmup_size):
+        ti.update()
+    vrsi = VolumeRelativeStrengthIndexHandler(ti, window_size=14)
+    obv = OnBalanceVolumeHandler(ti, start_candle=500)
+    ad = AccumulationDistributionHandler(ti, start_candle=500)
+    vrsi.warmup(candles[:warmup_size])
+    while ti.is_alive():
+        ti.update()
+        obv.update()
+        ad.update()
+        # Missed candles reload the window
+        if ti.get_timestamp() % 31 != 0:
+            vrsi.update()
+
+    all_candles = candles.to_candles()
+    vrsi_values = VolumeRelativeStrengthIndexHandler.calculate_from(all_candles, 14)
+    assert vrsi.get_last_n_values(100) == pytest.approx(
+        [value for i, value in enumerate(vrsi_values, 14) if i % 31 != 0][-100:])
+    obv_values = OnBalanceVolumeHandler.calculate_from(all_candles)
+    assert obv.get_last_n_values(20) == pytest.approx(obv_values[-20:])
+    ad_values = AccumulationDistributionHandler.calculate_from(all_candles)
+    assert ad.get_last_n_values(20) == pytest.approx(ad_values[-20:])
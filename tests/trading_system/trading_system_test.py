@@ -4,7 +4,8 @@ from mock import MagicMock
 from tests.logger.empty_logger_mock import empty_logger_mock
 
 from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
-from trading_system.trading_system import TradingSystem
+from trading_system.trading_system import TradingSystem, Handlers, HandlersScheduler, \
+    CandlesHandler, OrdersHandler, MovingAverageCDHandler
 from trading import AssetPair, Asset, Direction
 
 one_values = [1] * 10
@@ -119,3 +120,34 @@ def test_trading_system_get_total_balance(ti: TradingInterfaceMock, ts, empty_lo
     ti.update()
     assert pytest.approx(ts.get_total_balance(), 1e-6) == \
            (20 * ts.get_price_by_direction(Direction.SELL))
+
+
+def test_handlers_scheduler(empty_logger_mock):
+    ti = TradingInterfaceMock.from_price_values(real_values)
+    handlers = Handlers().add(CandlesHandler(ti)).add(OrdersHandler(ti)) \
+        .add(MovingAverageCDHandler(ti, 3, 5, 2))
+    scheduler = HandlersScheduler(ti, handlers)
+    orders_handler = handlers['OrdersHandler']
+    orders_handler.update = MagicMock(return_value=False)
+    macd = handlers['MovingAverageCDHandler_s3_l5']
+    macd_update = MagicMock(wraps=macd.update)
+    macd.update = macd_update
+
+    ti.get_last_n_candles = MagicMock(wraps=ti.get_last_n_candles)
+    assert scheduler.update() == set()
+    ti.update()
+    assert scheduler.update() == {'CandlesHandler', 'ExpMovingAverageHandler3_2',
+                                  'ExpMovingAverageHandler5_2', 'MovingAverageCDHandler_s3_l5'}
+    for _ in range(5):
+        assert scheduler.update() == set()
+    # Candle is checked once per tick, no handler polls it
+    assert all(call.args == (1,) for call in ti.get_last_n_candles.call_args_list)
+    assert ti.get_last_n_candles.call_count == 7
+    assert orders_handler.update.call_count == 7
+    assert macd_update.call_count == 1
+
+    ti.update()
+    macd.short_handler.update = MagicMock(return_value=False)
+    macd.long_handler.update = MagicMock(return_value=False)
+    assert scheduler.update() == {'CandlesHandler'}
+    assert macd_update.call_count == 1
@@ -0,0 +1,44 @@
+from tests.logger.empty_logger_mock import empty_logger_mock
+
+from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
+from trading_system.trading_system import Handlers, HandlersScheduler
+from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.update_tracker import UpdateTracker
+
+
+def test_check() -> None:
+    ti = TradingInterfaceMock()
+    first, second = TradingSystemHandler(ti), TradingSystemHandler(ti)
+    tracker = UpdateTracker()
+    all_updates = tracker.subscribe([first, second])
+    any_updates = tracker.subscribe([first, second], updated='any')
+    assert not tracker.check(all_updates) and not tracker.check(any_updates)
+
+    first.version += 1
+    assert not tracker.check(all_updates)
+    assert tracker.check(any_updates)
+    assert not tracker.check(any_updates)
+    second.version += 1
+    assert tracker.check(all_updates)
+    assert not tracker.check(all_updates)
+
+    first.version += 1
+    second.version += 1
+    tracker.reset()
+    assert not tracker.check(all_updates) and not tracker.check(any_updates)
+
+
+def test_scheduler_versions(empty_logger_mock: empty_logger_mock) -> None:
+    ti = TradingInterfaceMock.from_price_values(list(range(1, 11)))
+    handler = TradingSystemHandler(ti)
+    handler.update = handler.received_new_candle  # type: ignore
+    scheduler = HandlersScheduler(ti, Handlers().add(handler))
+    tracker = UpdateTracker()
+    updates = tracker.subscribe([handler])
+    while ti.is_alive():
+        ti.update()
+        for _ in range(3):
+            scheduler.update()
+        assert tracker.check(updates)
+        assert not tracker.check(updates)
+    assert handler.version == 9
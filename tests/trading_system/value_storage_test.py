@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import numpy as np
+
+from tests.logger.empty_logger_mock import empty_logger_mock
+from tests.trading_interface.trading_interface_mock import TradingInterfaceMock
+from trading_system.indicators import MovingAverageCDHandler
+from trading_system.trading_system import Handlers
+from trading_system.value_storage import ValueStorage
+
+
+def test_retention() -> None:
+    storage = ValueStorage(retention=3)
+    for value in range(10):
+        storage.append(value)
+    assert len(storage) == 3
+    assert storage.count == 10
+    assert storage[-1] == 9
+    assert storage.get_last_n(2) == [8, 9]
+    assert storage.get_last_n(5) == [7, 8, 9]
+    assert storage.get_last_n(0) == []
+
+    storage.set_retention(2)
+    assert list(storage) == [8, 9]
+    storage.reset([1., 2.])
+    assert storage.count == 2
+
+
+def test_history(tmp_path: Path) -> None:
+    path = tmp_path / 'history' / 'values.f64'
+    storage = ValueStorage(retention=2)
+    storage.append(-1.)
+    storage.set_history_path(path)
+    for value in range(3000):
+        storage.append(float(value))
+    storage.flush()
+    assert list(ValueStorage.load_history(path)) == [-1.] + list(range(3000))
+
+    storage.reset([1., 2., 3.])
+    storage.flush()
+    assert list(ValueStorage.load_history(path)) == [1., 2., 3.]
+
+
+def test_handler_retention(tmp_path: Path,
+                           empty_logger_mock: empty_logger_mock) -> None:
+    values = list(np.random.default_rng(0).normal(100, 10, 100))
+    ti = TradingInterfaceMock.from_price_values(values)
+    handler = MovingAverageCDHandler(ti, 4, 9, 6)
+    handlers = Handlers().add(handler)
+    for h in handlers.values():
+        h.set_retention(2, tmp_path)
+    reference_ti = TradingInterfaceMock.from_price_values(values)
+    reference = MovingAverageCDHandler(reference_ti, 4, 9, 6)
+    reference_handlers = Handlers().add(reference)
+    while ti.is_alive():
+        ti.update()
+        reference_ti.update()
+        for h in list(handlers.values()) + list(reference_handlers.values()):
+            h.update()
+    for h in handlers.values():
+        h.flush_history()
+
+    assert len(handler.macd_values) == 6
+    assert handler.get_last_n_values(100) == reference.get_last_n_values(6)
+    assert len(handler.short_handler.get_last_n_values(100)) == 2
+    history = ValueStorage.load_history(
+        tmp_path / f'{handler.get_name()}.signal_values.f64')
+    assert list(history) == [signal for _, signal in reference.get_last_n_values(100)]
@@ -6,3 +6,5 @@ from trading.timestamp import *
 from trading.timeframe import *
 from trading.trend import *
 from trading.time_range import *
+from trading.candle_series import *
+from trading.shared_candle_series import *
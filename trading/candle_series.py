@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import hashlib
+import typing as tp
+
+import numpy as np
+
+from trading.candle import Candle
+from trading.time_range import TimeRange
+
+CANDLE_COLUMNS = ('ts', 'open', 'close', 'low', 'high', 'volume')
+
+
+class CandleSeries(tp.Sequence[Candle]):
+    """
+    Columnar (struct-of-arrays) storage of candles.
+
+    Every column is a NumPy array; a series is a [start, stop) window over
+    them, so slicing creates a new window object without copying any data.
+    Indexing by int returns a regular `Candle`, which makes a series a drop-in
+    replacement for `tp.List[Candle]` in code that iterates over candles.
+    """
+
+    def __init__(self, ts: np.ndarray, open: np.ndarray, close: np.ndarray,
+                 low: np.ndarray, high: np.ndarray, volume: np.ndarray,
+                 start: int = 0, stop: tp.Optional[int] = None):
+        self._ts = ts
+        self._open = open
+        self._close = close
+        self._low = low
+        self._high = high
+        self._volume = volume
+        self._start = start
+        self._stop = len(ts) if stop is None else stop
+        self._fingerprint: tp.Optional[str] = None
+
+    @classmethod
+    def from_candles(cls, candles: tp.Iterable[Candle]) -> CandleSeries:
+        candles = list(candles)
+        return cls.from_columns(
+            ts=[candle.ts for candle in candles],
+            open=[candle.open for candle in candles],
+            close=[candle.close for candle in candles],
+            low=[candle.low for candle in candles],
+            high=[candle.high for candle in candles],
+            volume=[candle.volume for candle in candles])
+
+    @classmethod
+    def from_columns(cls, **columns: tp.Iterable[tp.Any]) -> CandleSeries:
+        """ Builds a series from column-wise values, None becomes NaN. """
+        arrays = {name: np.asarray(columns[name], dtype=np.float64)
+                  for name in CANDLE_COLUMNS[1:]}
+        arrays['ts'] = np.asarray(columns['ts'], dtype=np.int64)
+        return cls.from_arrays(arrays)
+
+    @classmethod
+    def from_arrays(cls, columns: tp.Mapping[str, np.ndarray]) -> CandleSeries:
+        """ Series over the arrays of CANDLE_COLUMNS, without copying. """
+        return cls(ts=columns['ts'], open=columns['open'],
+                   close=columns['close'], low=columns['low'],
+                   high=columns['high'], volume=columns['volume'])
+
+    @classmethod
+    def empty(cls) -> CandleSeries:
+        return cls.from_columns(**{name: [] for name in CANDLE_COLUMNS})
+
+    @property
+    def ts(self) -> np.ndarray:
+        return self._ts[self._start:self._stop]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._open[self._start:self._stop]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._close[self._start:self._stop]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._low[self._start:self._stop]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._high[self._start:self._stop]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._volume[self._start:self._stop]
+
+    def get_columns(self) -> tp.Dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in CANDLE_COLUMNS}
+
+    def get_mid_prices(self) -> np.ndarray:
+        return (self.open + self.close) / 2
+
+    def get_deltas(self) -> np.ndarray:
+        return self.close - self.open
+
+    def get_lower_prices(self) -> np.ndarray:
+        return np.minimum(self.open, self.close)
+
+    def get_upper_prices(self) -> np.ndarray:
+        return np.maximum(self.open, self.close)
+
+    def get_last_n(self, n: int, end: tp.Optional[int] = None) -> CandleSeries:
+        """ Window of at most n candles ending right before index 'end'. """
+        stop = len(self) if end is None else min(max(end, 0), len(self))
+        return self._window(max(0, stop - n), stop)
+
+    def get_time_range(self, time_range: TimeRange) -> CandleSeries:
+        """ Window of candles with from_ts <= ts <= to_ts, ts must be sorted. """
+        ts = self.ts
+        return self._window(int(np.searchsorted(ts, time_range.from_ts, 'left')),
+                            int(np.searchsorted(ts, time_range.to_ts, 'right')))
+
+    def get_fingerprint(self) -> str:
+        """ Content hash of the window, computed once per series object. """
+        if self._fingerprint is None:
+            digest = hashlib.sha1()
+            for column in self.get_columns().values():
+                digest.update(np.ascontiguousarray(column).data)
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def to_candles(self) -> tp.List[Candle]:
+        return list(self)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @tp.overload
+    def __getitem__(self, index: int) -> Candle: ...
+
+    @tp.overload
+    def __getitem__(self, index: slice) -> CandleSeries: ...
+
+    def __getitem__(self, index: tp.Union[int, slice]) \
+            -> tp.Union[Candle, CandleSeries]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError('CandleSeries supports only contiguous slices')
+            return self._window(start, max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('CandleSeries index out of range')
+        index += self._start
+        return Candle(ts=self._ts.item(index),
+                      open=self._open.item(index),
+                      close=self._close.item(index),
+                      low=self._low.item(index),
+                      high=self._high.item(index),
+                      volume=self._volume.item(index))
+
+    def __iter__(self) -> tp.Iterator[Candle]:
+        columns = zip(*[column.tolist() for column in
+                        self.get_columns().values()])
+        for ts, open, close, low, high, volume in columns:
+            yield Candle(ts, open, close, low, high, volume)
+
+    def _window(self, start: int, stop: int) -> CandleSeries:
+        return CandleSeries(self._ts, self._open, self._close,
+                            self._low, self._high, self._volume,
+                            self._start + start, self._start + stop)
+
+    def __repr__(self) -> str:
+        return f'CandleSeries of {len(self)} candles'
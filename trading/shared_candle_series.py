@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import typing as tp
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from trading.candle_series import CandleSeries, CANDLE_COLUMNS
+
+
+class SharedCandleSeries(CandleSeries):
+    """
+    CandleSeries with columns placed in one multiprocessing.shared_memory block.
+
+    Pickling a shared series (or any window of it) sends only the block name,
+    so worker processes attach to the same memory without copying candles.
+    The creating process owns the block and must detach() and unlink() it
+    when workers are done.
+    """
+
+    def __init__(self, shared_memory: SharedMemory, length: int,
+                 start: int = 0, stop: tp.Optional[int] = None):
+        columns = {name: np.ndarray((length,), dtype=np.int64 if name == 'ts' else np.float64,
+                                    buffer=shared_memory.buf, offset=i * length * 8)
+                   for i, name in enumerate(CANDLE_COLUMNS)}
+        super().__init__(ts=columns['ts'], open=columns['open'],
+                         close=columns['close'], low=columns['low'],
+                         high=columns['high'], volume=columns['volume'],
+                         start=start, stop=stop)
+        self._shared_memory = shared_memory
+        self._length = length
+
+    @classmethod
+    def create(cls, candles: CandleSeries) -> SharedCandleSeries:
+        shared_memory = SharedMemory(
+            create=True, size=max(1, len(candles) * len(CANDLE_COLUMNS) * 8))
+        series = cls(shared_memory, len(candles))
+        for name, column in candles.get_columns().items():
+            getattr(series, name)[:] = column
+        return series
+
+    @classmethod
+    def attach(cls, name: str, length: int, start: int = 0,
+               stop: tp.Optional[int] = None) -> SharedCandleSeries:
+        return cls(SharedMemory(name=name), length, start, stop)
+
+    def get_name(self) -> str:
+        return self._shared_memory.name
+
+    def detach(self) -> None:
+        """ Detaches this process, the series must not be used afterwards. """
+        self._ts = self._open = self._close = self._low = self._high = \
+            self._volume = np.empty(0)
+        self._start = self._stop = 0
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        self._shared_memory.unlink()
+
+    def _window(self, start: int, stop: int) -> SharedCandleSeries:
+        return SharedCandleSeries(self._shared_memory, self._length,
+                                  self._start + start, self._start + stop)
+
+    def __reduce__(self) -> tp.Tuple[tp.Any, ...]:
+        return SharedCandleSeries.attach, (self.get_name(), self._length,
+                                           self._start, self._stop)
+
+    def __repr__(self) -> str:
+        return f'SharedCandleSeries of {len(self)} candles in {self.get_name()}'
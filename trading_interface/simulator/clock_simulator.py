@@ -11,7 +11,11 @@ class ClockSimulator(Clock):
         self.timeframe = timeframe
         self.seconds_per_candle = self.timeframe.to_seconds()
         self.candles_lifetime = int(config['candles_lifetime'])
+        # Event driven clock skips ticks where nothing can happen,
+        # strategies counting ticks should add get_ticks_passed() on every update
+        self.event_driven = bool(config.get('event_driven', False))
         self.iteration = 0
+        self.step_start = 0
 
     def get_timestamp(self) -> int:
         return int(self.start_ts + self.iteration / self.candles_lifetime * self.seconds_per_candle)
@@ -25,8 +29,21 @@ class ClockSimulator(Clock):
     def get_current_candle_lifetime(self) -> int:
         return self.iteration % self.candles_lifetime
 
+    def get_ticks_passed(self) -> int:
+        return self.iteration - self.step_start
+
+    def start_step(self) -> None:
+        self.step_start = self.iteration
+
     def next_iteration(self) -> None:
         self.iteration += 1
 
+    def jump_to(self, iteration: int) -> None:
+        assert iteration >= self.iteration
+        self.iteration = iteration
+
+    def get_next_candle_iteration(self) -> int:
+        return (self.get_iterated_candles_count() + 1) * self.candles_lifetime
+
     def get_iterated_candles_count(self) -> int:
         return self.iteration // self.candles_lifetime
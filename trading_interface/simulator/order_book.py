@@ -0,0 +1,81 @@
+import heapq
+import itertools
+import typing as tp
+
+from trading import Order, Direction
+
+
+class OrderBook:
+    """
+    Resting orders of the simulator indexed by price.
+    Buy orders are kept in a max-heap and sell orders in a min-heap,
+    so the orders crossed by current prices are always on the tops.
+    Cancelled orders are removed lazily when they reach the top of a heap.
+    """
+
+    def __init__(self) -> None:
+        self._orders: tp.Dict[str, Order] = {}
+        # Heap entries are (key, sequence number, order), the sequence
+        # number keeps orders with equal prices in the placement order
+        self._buy_heap: tp.List[tp.Tuple[float, int, Order]] = []
+        self._sell_heap: tp.List[tp.Tuple[float, int, Order]] = []
+        self._sequence = itertools.count()
+
+    def add(self, order: Order) -> None:
+        self._orders[order.order_id] = order
+        if order.direction == Direction.BUY:
+            heapq.heappush(self._buy_heap,
+                           (-order.price, next(self._sequence), order))
+        else:
+            heapq.heappush(self._sell_heap,
+                           (order.price, next(self._sequence), order))
+
+    def remove(self, order: Order) -> bool:
+        return self._orders.pop(order.order_id, None) is not None
+
+    def clear(self) -> None:
+        self._orders.clear()
+        self._buy_heap.clear()
+        self._sell_heap.clear()
+
+    def get_best_buy_price(self) -> tp.Optional[float]:
+        self._drop_removed(self._buy_heap)
+        return -self._buy_heap[0][0] if self._buy_heap else None
+
+    def get_best_sell_price(self) -> tp.Optional[float]:
+        self._drop_removed(self._sell_heap)
+        return self._sell_heap[0][0] if self._sell_heap else None
+
+    def pop_crossed(self, buy_price: float, sell_price: float) \
+            -> tp.List[Order]:
+        """
+        Removes and returns orders filled at the given prices:
+        buy orders priced above sell_price and sell orders priced below buy_price
+        """
+        filled: tp.List[Order] = []
+        self._drop_removed(self._buy_heap)
+        while self._buy_heap and -self._buy_heap[0][0] > sell_price:
+            filled.append(self._pop(self._buy_heap))
+        self._drop_removed(self._sell_heap)
+        while self._sell_heap and self._sell_heap[0][0] < buy_price:
+            filled.append(self._pop(self._sell_heap))
+        return filled
+
+    def _pop(self, heap: tp.List[tp.Tuple[float, int, Order]]) -> Order:
+        order = heapq.heappop(heap)[2]
+        del self._orders[order.order_id]
+        self._drop_removed(heap)
+        return order
+
+    def _drop_removed(self, heap: tp.List[tp.Tuple[float, int, Order]]) -> None:
+        while heap and self._orders.get(heap[0][2].order_id) is not heap[0][2]:
+            heapq.heappop(heap)
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __iter__(self) -> tp.Iterator[Order]:
+        return iter(list(self._orders.values()))
+
+    def __contains__(self, order: object) -> bool:
+        return isinstance(order, Order) and order.order_id in self._orders
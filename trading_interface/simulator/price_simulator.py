@@ -1,7 +1,8 @@
 import numpy as np
 
-from trading import Candle
+from trading import Candle, CandleSeries
 from logger.logger import Logger
+from collections import OrderedDict
 from enum import Enum
 
 import typing as tp
@@ -20,8 +21,18 @@ class PriceSimulator:
         1. open -> high -> low -> close
         2. open -> low -> high -> close
     Noise can be optionally added
+
+    get_price_matrix builds the prices of a whole candle series at once,
+    matrices are cached by the candles content and shared between simulators.
     """
 
+    MATRICES_CACHE_SIZE = 4
+    # Rows per chunk while building a matrix, bounds temporary arrays size
+    MATRIX_CHUNK_SIZE = 1 << 16
+
+    _price_matrices: tp.Dict[tp.Tuple[str, int, PriceSimulatorType], np.ndarray] = \
+        OrderedDict()
+
     def __init__(self, candles_lifetime: int, simulation_type: PriceSimulatorType):
         self.candles_lifetime = candles_lifetime
         self.current_ts: tp.Optional[int] = None
@@ -47,7 +58,7 @@ class PriceSimulator:
         def noise() -> float:
             return np.random.normal(0, (candle.high - candle.low) / self.candles_lifetime)
 
-        np.random.seed(hash(candle))
+        np.random.seed(hash(candle) % 2 ** 32)
         return self._high_to_low(candle, noise) \
             if hash(candle) % 2 == 0 else self._low_to_high(candle, noise)
 
@@ -55,6 +66,118 @@ class PriceSimulator:
         return [candle.get_delta() * (i / self.candles_lifetime) + candle.open
                 for i in range(self.candles_lifetime)]
 
+    def get_price_matrix(self, candles: CandleSeries) -> np.ndarray:
+        """
+        returns read-only matrix of shape (len(candles), candles_lifetime),
+        matrix[i, j] is the price of candles[i] at the lifetime step j
+        """
+        key = (candles.get_fingerprint(), self.candles_lifetime,
+               self.simulation_type)
+        matrix = PriceSimulator._price_matrices.pop(key, None)
+        if matrix is None:
+            try:
+                builder = self.__getattribute__(
+                    f'{self.simulation_type.value}_matrix')
+            except AttributeError as exception:
+                self.logger.exception('Unknown PriceSimulator type.')
+                raise exception
+            matrix = builder(candles)
+            matrix.setflags(write=False)
+        PriceSimulator._price_matrices[key] = matrix
+        while len(PriceSimulator._price_matrices) > self.MATRICES_CACHE_SIZE:
+            PriceSimulator._price_matrices.popitem(last=False)  # type: ignore
+        return matrix
+
+    def three_interval_path_matrix(self, candles: CandleSeries) -> np.ndarray:
+        return self._build_three_interval_matrix(candles)
+
+    def three_interval_path_noise_matrix(self, candles: CandleSeries) \
+            -> np.ndarray:
+        # Per candle seeding doesn't vectorize, so the whole matrix
+        # gets one generator seeded by the candles content
+        rng = np.random.default_rng(int(candles.get_fingerprint()[:16], 16))
+        return self._build_three_interval_matrix(candles, rng)
+
+    def uniform_matrix(self, candles: CandleSeries) -> np.ndarray:
+        steps = np.arange(self.candles_lifetime) / self.candles_lifetime
+        return np.outer(candles.get_deltas(), steps) + candles.open[:, None]
+
+    def _build_three_interval_matrix(
+            self, candles: CandleSeries,
+            rng: tp.Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        Vectorized three_interval_path over all candles,
+        gives exactly the same points as _build_multi_interval_path
+        """
+        total_steps = self.candles_lifetime
+        if total_steps < 4:
+            self.logger.error("Not enough steps to cover given path.")
+            total_steps = 4
+
+        high_first = np.fromiter(
+            (hash(values) % 2 == 0 for values in
+             zip(*[column.tolist() for column in candles.get_columns().values()])),
+            dtype=bool, count=len(candles))
+        matrix = np.empty((len(candles), self.candles_lifetime))
+        for begin in range(0, len(candles), self.MATRIX_CHUNK_SIZE):
+            chunk = candles[begin:begin + self.MATRIX_CHUNK_SIZE]
+            is_high_first = high_first[begin:begin + self.MATRIX_CHUNK_SIZE]
+            anchors = np.stack([
+                chunk.open,
+                np.where(is_high_first, chunk.high, chunk.low),
+                np.where(is_high_first, chunk.low, chunk.high),
+                chunk.close], axis=1)
+            prices = self._build_anchors_path(anchors, total_steps)
+            if rng is not None:
+                prices = self._add_noise(prices, anchors, rng)
+            matrix[begin:begin + len(chunk)] = \
+                prices[:, :self.candles_lifetime]
+        return matrix
+
+    @staticmethod
+    def _build_anchors_path(anchors: np.ndarray, total_steps: int) \
+            -> np.ndarray:
+        """
+        anchors: matrix of paths [start, corner_1, corner_2, end], one per row
+        returns matrix of 'total_steps' points per row,
+        every interval is split the same way np.linspace does it
+        """
+        rows = np.arange(len(anchors))[:, None]
+        lengths = np.abs(np.diff(anchors, axis=1))
+        total_path = lengths[:, 0] + lengths[:, 1] + lengths[:, 2]
+        total_path = np.where(total_path == 0, 1., total_path)
+        total_intermediate_points = total_steps - 4
+        points_count = (lengths[:, :2] / total_path[:, None] *
+                        total_intermediate_points).astype(np.int64) + 2
+
+        # Indices of the interval corners within the path
+        corners = np.empty((len(anchors), 4), dtype=np.int64)
+        corners[:, 0] = 0
+        corners[:, 1] = points_count[:, 0] - 1
+        corners[:, 2] = corners[:, 1] + points_count[:, 1] - 1
+        corners[:, 3] = total_steps - 1
+
+        steps = np.arange(total_steps)[None, :]
+        interval = (steps > corners[:, 1:2]).astype(np.int64) + \
+            (steps > corners[:, 2:3])
+        start, end = corners[rows, interval], corners[rows, interval + 1]
+        start_price = anchors[rows, interval]
+        end_price = anchors[rows, interval + 1]
+
+        price_step = (end_price - start_price) / (end - start)
+        prices = (steps - start) * price_step + start_price
+        return np.where(steps == end, end_price, prices)
+
+    def _add_noise(self, prices: np.ndarray, anchors: np.ndarray,
+                   rng: np.random.Generator) -> np.ndarray:
+        # Noise doesn't affect starts and ends of the intervals
+        is_anchor = (prices[:, :, None] == anchors[:, None, :]).any(axis=2)
+        low, high = anchors.min(axis=1), anchors.max(axis=1)
+        scale = (high - low) / self.candles_lifetime
+        noisy = prices + rng.standard_normal(prices.shape) * scale[:, None]
+        noisy = np.minimum(np.maximum(noisy, low[:, None]), high[:, None])
+        return np.where(is_anchor, prices, noisy)
+
     def _high_to_low(self, candle: Candle,
                      noise: tp.Optional[tp.Callable[[], float]] = None)\
             -> tp.List[float]:
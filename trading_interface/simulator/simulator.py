@@ -2,40 +2,64 @@ import datetime
 import typing as tp
 from copy import copy
 
+import numpy as np
+
 from helpers.typing.common_types import Config
 
 from trading_interface.simulator.clock_simulator import ClockSimulator
+from trading_interface.simulator.order_book import OrderBook
 from trading_interface.trading_interface import TradingInterface
 from market_data_api.market_data_downloader import MarketDataDownloader
 
-from trading import Order, Direction, AssetPair, Timeframe, TimeRange, Candle
+from trading import Order, Direction, AssetPair, Timeframe, TimeRange, CandleSeries
 from trading_interface.simulator.price_simulator import PriceSimulator, PriceSimulatorType
 
 
 class Simulator(TradingInterface):
-    def __init__(self, time_range: TimeRange, trading_config: Config, exchange_config: Config):
-        ts_offset = int(datetime.timedelta(days=1).total_seconds())
+    # Candles before the simulated range are loaded to warm handlers up
+    HISTORY_OFFSET = int(datetime.timedelta(days=1).total_seconds())
+
+    def __init__(self, time_range: TimeRange, trading_config: Config, exchange_config: Config,
+                 candles: tp.Optional[CandleSeries] = None):
+        """
+        candles: preloaded candles covering the time range with its history,
+                 downloaded if not given
+        """
         self.clock = ClockSimulator(
             start_ts=time_range.from_ts,
             timeframe=Timeframe(trading_config['timeframe']),
             config=exchange_config['clock_simulator'])
         self.asset_pair = AssetPair(*trading_config['asset_pair'])
-        self.candle_index_offset = ts_offset // self.clock.get_seconds_per_candle()
-        self.active_orders: tp.Set[Order] = set()
+        self.candle_index_offset = self.HISTORY_OFFSET // self.clock.get_seconds_per_candle()
+        self.order_book = OrderBook()
         self.last_used_order_id = 0
         self.filled_order_ids: tp.Set[int] = set()
         self.price_shift = float(exchange_config['price_shift'])
         self.price_simulator = PriceSimulator(
             candles_lifetime=self.clock.candles_lifetime,
             simulation_type=PriceSimulatorType(exchange_config['price_simulation_type']))
-        self.candles = MarketDataDownloader.get_candles(
-            asset_pair=self.asset_pair,
-            timeframe=self.clock.get_timeframe(),
-            time_range=TimeRange(time_range.from_ts - ts_offset, time_range.to_ts))
+        self.candles = self.load_candles(time_range, trading_config, candles)
+        self.prices = self.price_simulator.get_price_matrix(self.candles)
+
+    @classmethod
+    def load_candles(cls, time_range: TimeRange, trading_config: Config,
+                     candles: tp.Optional[CandleSeries] = None) -> CandleSeries:
+        """ Candles the simulation of the time range runs on, downloaded if not given """
+        history_range = TimeRange(time_range.from_ts - cls.HISTORY_OFFSET, time_range.to_ts)
+        if candles is None:
+            return MarketDataDownloader.get_candles(
+                asset_pair=AssetPair(*trading_config['asset_pair']),
+                timeframe=Timeframe(trading_config['timeframe']),
+                time_range=history_range)
+        return candles.get_time_range(history_range)
 
     def is_alive(self) -> bool:
         self.__fill_orders()
-        self.clock.next_iteration()
+        self.clock.start_step()
+        if self.clock.event_driven:
+            self.__jump_to_next_event()
+        else:
+            self.clock.next_iteration()
         return self.__get_current_candle_index(truncated_index=False) < len(self.candles)
 
     def stop_trading(self) -> None:
@@ -54,7 +78,7 @@ class Simulator(TradingInterface):
                       price=price,
                       timestamp=self.clock.get_timestamp(),
                       direction=Direction.BUY)
-        self.active_orders.add(copy(order))
+        self.order_book.add(copy(order))
         return order
 
     def sell(self, amount: float, price: float) -> tp.Optional[Order]:
@@ -64,18 +88,14 @@ class Simulator(TradingInterface):
                       price=price,
                       timestamp=self.clock.get_timestamp(),
                       direction=Direction.SELL)
-        self.active_orders.add(copy(order))
+        self.order_book.add(copy(order))
         return order
 
     def cancel_order(self, order: Order) -> bool:
-        try:
-            self.active_orders.remove(order)
-            return True
-        except KeyError:
-            return False
+        return self.order_book.remove(order)
 
     def cancel_all(self) -> None:
-        self.active_orders.clear()
+        self.order_book.clear()
 
     def order_is_filled(self, order: Order) -> bool:
         return order.order_id in self.filled_order_ids
@@ -86,31 +106,61 @@ class Simulator(TradingInterface):
     def get_buy_price(self) -> float:
         return self.__get_current_price() * (1 - self.price_shift)
 
-    def get_last_n_candles(self, n: int) -> tp.List[Candle]:
-        candle_index = self.__get_current_candle_index()
-        return self.candles[max(0, candle_index - n): candle_index]
+    def get_last_n_candles(self, n: int) -> CandleSeries:
+        return self.candles.get_last_n(n, end=self.__get_current_candle_index())
+
+    def get_candle_series(self) -> CandleSeries:
+        return self.candles
 
     def get_orderbook(self):  # type: ignore
         pass
 
-    def __order_is_filled(self, order: Order) -> bool:
-        return (order.direction == Direction.BUY and
-                order.price > self.get_sell_price()) or \
-               (order.direction == Direction.SELL and
-                order.price < self.get_buy_price())
-
     def __fill_orders(self) -> None:
-        filled_orders = set(filter(self.__order_is_filled, self.active_orders))
-        self.active_orders = set(
-            filter(lambda order: not self.__order_is_filled(order),
-                   self.active_orders))
+        if not self.order_book:
+            return
+        price = self.__get_current_price()
+        filled_orders = self.order_book.pop_crossed(
+            buy_price=price * (1 - self.price_shift),
+            sell_price=price * (1 + self.price_shift))
         for order in filled_orders:
             self.filled_order_ids.add(order.order_id)
 
+    def __jump_to_next_event(self) -> None:
+        """
+        Skips ticks where no order can be filled and no new candle starts.
+        An order filled on the way is filled on its own tick and the clock
+        stops right after it, the same way it would go tick by tick.
+        """
+        fill_iteration = self.__get_next_fill_iteration()
+        if fill_iteration is None:
+            self.clock.jump_to(self.clock.get_next_candle_iteration())
+        else:
+            self.clock.jump_to(fill_iteration)
+            self.__fill_orders()
+            self.clock.next_iteration()
+
+    def __get_next_fill_iteration(self) -> tp.Optional[int]:
+        """ First iteration of the current candle where some order is filled. """
+        index = self.__get_current_candle_index(truncated_index=False)
+        if not self.order_book or index >= len(self.candles):
+            return None
+        best_buy_price = self.order_book.get_best_buy_price()
+        best_sell_price = self.order_book.get_best_sell_price()
+
+        prices = self.prices[index, self.clock.get_current_candle_lifetime() + 1:]
+        is_filled = np.zeros(len(prices), dtype=bool)
+        if best_buy_price is not None:
+            is_filled |= best_buy_price > prices * (1 + self.price_shift)
+        if best_sell_price is not None:
+            is_filled |= best_sell_price < prices * (1 - self.price_shift)
+        fill_ticks = np.flatnonzero(is_filled)
+        if not len(fill_ticks):
+            return None
+        return self.clock.iteration + 1 + int(fill_ticks[0])
+
     def __get_current_price(self) -> float:
-        candle = self.candles[self.__get_current_candle_index()]
-        return self.price_simulator.get_price(
-            candle, self.clock.get_current_candle_lifetime())
+        return self.prices.item(self.__get_current_candle_index(),
+                                self.clock.get_current_candle_lifetime())
 
     def __get_current_candle_index(self, truncated_index: bool = True) -> int:
         index = self.candle_index_offset + self.clock.get_iterated_candles_count()
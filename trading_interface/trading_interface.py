@@ -1,7 +1,8 @@
 import typing as tp
 from abc import ABC, abstractmethod
 
-from trading import AssetPair, Order, Candle
+from logger.clock import Clock
+from trading import AssetPair, Order, Candle, CandleSeries
 
 
 class TradingInterface(ABC):
@@ -13,6 +14,10 @@ class TradingInterface(ABC):
     def stop_trading(self) -> None:
         pass
 
+    @abstractmethod
+    def get_clock(self) -> Clock:
+        pass
+
     @abstractmethod
     def get_timestamp(self) -> int:
         pass
@@ -50,5 +55,9 @@ class TradingInterface(ABC):
         pass
 
     @abstractmethod
-    def get_last_n_candles(self, n: int) -> tp.List[Candle]:
+    def get_last_n_candles(self, n: int) -> tp.Sequence[Candle]:
         pass
+
+    def get_candle_series(self) -> tp.Optional[CandleSeries]:
+        """ All candles of a simulation including future ones, None in live trading """
+        return None
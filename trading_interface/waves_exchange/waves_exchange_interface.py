@@ -2,7 +2,7 @@ import requests
 import typing as tp
 from retry import retry
 
-from trading import Asset, AssetPair, Order, Candle, Direction, Timeframe, TimeRange
+from trading import Asset, AssetPair, Order, Candle, CandleSeries, Direction, Timeframe, TimeRange
 from trading_interface.trading_interface import TradingInterface
 from market_data_api.market_data_downloader import MarketDataDownloader
 from trading_interface.waves_exchange.waves_exchange_clock import WAVESExchangeClock
@@ -271,7 +271,7 @@ class WAVESExchangeInterface(TradingInterface):
 
     def _fetch_candles(self) -> None:
         if self.get_timestamp() - self._clock.get_last_request() > self._clock.get_candles_update_rate():
-            new_candles: tp.List[Candle] = MarketDataDownloader.get_candles(
+            new_candles: CandleSeries = MarketDataDownloader.get_candles(
                 self.asset_pair_human_readable, self._candles_lifetime,
                 TimeRange(self._clock.get_last_fetch(), self._clock.get_timestamp()))
             self._clock.update_last_request(self.get_timestamp())
@@ -7,9 +7,12 @@ from trading import Signal, TrendType
 from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
 from trading_system.indicators.exp_moving_average_handler import \
     ExpMovingAverageHandler
+from trading_system.trading_system_handler import TradingSystemHandler
 
 
 class ExpMovingAverageSignalDetector(TradingSignalDetector):
+    signal_names = ('exp_moving_average',)
+
     def __init__(
             self,
             trading_system: ts.TradingSystem,
@@ -30,6 +33,9 @@ class ExpMovingAverageSignalDetector(TradingSignalDetector):
             self.ts.add_handler(ExpMovingAverageHandler,
                                 params={"window_size": high, "smoothing": smoothing})
 
+    def get_required_handlers(self) -> tp.List[TradingSystemHandler]:
+        return [self.low_handler, self.mid_handler, self.high_handler]
+
     def get_trading_signals(self) -> tp.List[Signal]:
         low_values = self.low_handler.get_last_n_values(self.signal_length)
         mid_values = self.mid_handler.get_last_n_values(self.signal_length)
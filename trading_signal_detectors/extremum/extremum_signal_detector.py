@@ -2,7 +2,7 @@ import typing as tp
 
 from logger.logger import Logger
 
-from trading import Signal, TrendType
+from trading import Candle, Signal, TrendType
 import trading_system.trading_system as ts
 
 from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
@@ -11,6 +11,9 @@ PRICE_SHIFT = 0.005
 
 
 class ExtremumSignalDetector(TradingSignalDetector):
+    signal_names = ('extremum',)
+    subscribes_to_candles = True
+
     def __init__(self, trading_system: ts.TradingSystem, extremum_count: int):
         self.logger = Logger('ExtremumSignalDetector')
         self.ts = trading_system
@@ -18,10 +21,18 @@ class ExtremumSignalDetector(TradingSignalDetector):
         self.local_maximums: tp.List[float] = []
         self.local_minimums: tp.List[float] = []
         self.last_candle_timestamp = -1
+        self.signals: tp.List[Signal] = []
 
     def get_trading_signals(self) -> tp.List[Signal]:
+        signals = self.signals
+        self.signals = []
+        return signals
+
+    def on_new_candle(self, candle: Candle) -> None:
         self.__update()
+        self.signals = self.__detect()
 
+    def __detect(self) -> tp.List[Signal]:
         if len(self.local_minimums) >= self.extremum_count and \
                 len(self.local_maximums) >= self.extremum_count:
 
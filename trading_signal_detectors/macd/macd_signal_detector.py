@@ -1,11 +1,11 @@
 import numpy as np
 import typing as tp
 
-from helpers.updates_checker import UpdatesChecker, FromClass
 from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
 from trading import Signal, TrendType
 from trading_system.indicators import MovingAverageCDHandler
 from trading_system.trading_system import TradingSystem
+from trading_system.trading_system_handler import TradingSystemHandler
 
 PRICE_EPS = 1e-5
 
@@ -16,12 +16,16 @@ class MACDSignalDetector(TradingSignalDetector):
         Uptrend signal when macd crosses signal line upwards
         Downtrend signal when macd crosses signal line downwards
     """
+    signal_names = ('moving_average_cd',)
+
     def __init__(self, trading_system: TradingSystem):
         self.ts = trading_system
         self.handler: MovingAverageCDHandler = \
             trading_system.add_handler(MovingAverageCDHandler, params={})
 
-    @UpdatesChecker.on_updates(FromClass(lambda detector: [detector.handler.get_name()]), [])
+    def get_required_handlers(self) -> tp.List[TradingSystemHandler]:
+        return [self.handler]
+
     def get_trading_signals(self) -> tp.List[Signal]:
         values = np.array(self.handler.get_last_n_values(2))
 
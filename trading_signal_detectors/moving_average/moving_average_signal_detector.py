@@ -6,12 +6,15 @@ from logger.logger import Logger
 
 from trading_system.indicators import MovingAverageHandler
 from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
+from trading_system.trading_system_handler import TradingSystemHandler
 from trading import Signal, TrendType
 
 PRICE_EPS = 0.05
 
 
 class MovingAverageSignalDetector(TradingSignalDetector):
+    signal_names = ('moving_average',)
+
     def __init__(self, trading_system: ts.TradingSystem,
                  k_nearest: int, k_further: int, signal_length: int = 5):
         self.logger = Logger('MovingAverageSignalDetector')
@@ -23,8 +26,20 @@ class MovingAverageSignalDetector(TradingSignalDetector):
         self.further_handler: MovingAverageHandler = \
             self.ts.add_handler(MovingAverageHandler,
                                 params={"window_size": k_further})
+        self.signals: tp.List[Signal] = []
+
+    def get_required_handlers(self) -> tp.List[TradingSystemHandler]:
+        return [self.nearest_handler, self.further_handler]
 
     def get_trading_signals(self) -> tp.List[Signal]:
+        signals = self.signals
+        self.signals = []
+        return signals
+
+    def on_handler_updated(self, handlers: tp.List[TradingSystemHandler]) -> None:
+        self.signals = self.__detect()
+
+    def __detect(self) -> tp.List[Signal]:
         further_values = self.further_handler.get_last_n_values(
             self.signal_length)
         nearest_values = self.nearest_handler.get_last_n_values(
@@ -1,12 +1,12 @@
 import typing as tp
 
-from helpers.updates_checker import UpdatesChecker, FromClass
 from trading_signal_detectors.relative_strength_index.relative_strength_index_signal import RSISignal, RSISignalType
 from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
 from trading import Signal
 from trading_system.indicators import RelativeStrengthIndexHandler
 
 from trading_system.trading_system import TradingSystem
+from trading_system.trading_system_handler import TradingSystemHandler
 
 PRICE_EPS = 0.05
 
@@ -16,6 +16,7 @@ class RelativeStrengthIndexSignalDetector(TradingSignalDetector):
         Overbought signal when RSI > overbought_bound
         Oversold signal when RSI < oversold_bound
     """
+    signal_names = ('relative_strength_index',)
 
     def __init__(self, trading_system: TradingSystem, window_size: int,
                  oversold_bound: float = 30, overbought_bound: float = 70):
@@ -26,7 +27,9 @@ class RelativeStrengthIndexSignalDetector(TradingSignalDetector):
             RelativeStrengthIndexHandler, params={"window_size": window_size}
         )
 
-    @UpdatesChecker.on_updates(FromClass(lambda detector: [detector.handler.get_name()]), [])
+    def get_required_handlers(self) -> tp.List[TradingSystemHandler]:
+        return [self.handler]
+
     def get_trading_signals(self) -> tp.List[Signal]:
         values = self.handler.get_last_n_values(1)
 
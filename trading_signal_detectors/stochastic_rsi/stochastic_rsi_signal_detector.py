@@ -1,15 +1,27 @@
+import math
 import typing as tp
-import pandas as pd
 
 import trading_system.trading_system as ts
+from helpers.rolling_window import RollingExtremum, RollingMean
 from logger.logger import Logger
 from trading import Signal, TrendType
 
 from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
 from trading_system.indicators import RelativeStrengthIndexHandler
+from trading_system.trading_system_handler import TradingSystemHandler
 
 
 class StochasticRSISignalDetector(TradingSignalDetector):
+    """
+    Uptrend signal when %K line of RSI stochastic crosses %D line upwards,
+    downtrend signal when it crosses downwards.
+
+    The oscillator is updated with every new RSI value in O(1) amortized:
+    rolling min and max over monotonic deques, %K and %D over running sums.
+    Values are taken when the trading system reports RSI updates.
+    """
+    signal_names = ('stochastic_rsi',)
+
     def __init__(self, trading_system: ts.TradingSystem,
                  rsi_len: int = 14, stoch_len: int = 14,
                  k: int = 3, d: int = 3):
@@ -24,18 +36,37 @@ class StochasticRSISignalDetector(TradingSignalDetector):
         self.prev_k_sma = 0.
         self.prev_d_sma = 0.
 
+        self._rsi_count = 0
+        self._low = RollingExtremum(stoch_len)
+        self._high = RollingExtremum(stoch_len, maximum=True)
+        self._k_sma = RollingMean(k)
+        self._d_sma = RollingMean(d)
+        self.signals: tp.List[Signal] = []
+
+    def get_required_handlers(self) -> tp.List[TradingSystemHandler]:
+        return [self.rsi]
+
     def get_trading_signals(self) -> tp.List[Signal]:
-        rsi_values = self.rsi.get_last_n_values(
-            self.stoch_len + self.k + self.d - 1)
+        signals = self.signals
+        self.signals = []
+        return signals
 
-        if len(rsi_values) < self.stoch_len + self.k + self.d - 1:
+    def on_handler_updated(self, handlers: tp.List[TradingSystemHandler]) -> None:
+        self.signals = self.__detect()
+
+    def __detect(self) -> tp.List[Signal]:
+        new_count = self.rsi.values.count - self._rsi_count
+        if new_count == 0:
             return []
+        self._rsi_count = self.rsi.values.count
+        for value in self.rsi.get_last_n_values(new_count):
+            self.__push(value)
 
-        stoch_values = self.__calculate_stochastic(rsi_values)
-        k_sma_values = self.__calculate_sma(stoch_values, self.k)
-        d_sma_values = self.__calculate_sma(k_sma_values, self.d)
-        k_sma = k_sma_values[-1]
-        d_sma = d_sma_values[-1]
+        k_sma = self._k_sma.get_value()
+        d_sma = self._d_sma.get_value()
+        if k_sma is None or d_sma is None or \
+                self._rsi_count < self.stoch_len + self.k + self.d - 1:
+            return []
         trend: tp.Optional[TrendType] = None
 
         if (self.prev_k_sma < self.prev_d_sma) and (k_sma > d_sma):
@@ -53,13 +84,14 @@ class StochasticRSISignalDetector(TradingSignalDetector):
         self.logger.info(f"SRSI {trend_type} detected")
         return [Signal("stochastic_rsi", trend)]
 
-    def __calculate_stochastic(self, values: tp.List[float]) -> tp.List[float]:
-        vals = pd.Series(values)
-        low = vals.rolling(self.stoch_len).min()
-        high = vals.rolling(self.stoch_len).max()
-        return ((vals - low) / (high - low))[-(self.k + self.d - 1):].tolist()
-
-    def __calculate_sma(self, values: tp.List[float],
-                        window: int) -> tp.List[float]:
-        rolling_mean = pd.Series(values).rolling(window).mean()
-        return rolling_mean[-window:].tolist()
+    def __push(self, rsi: float) -> None:
+        self._low.push(rsi)
+        self._high.push(rsi)
+        low, high = self._low.get_value(), self._high.get_value()
+        if low is None or high is None:
+            return
+        stoch = (rsi - low) / (high - low) if high != low else math.nan
+        self._k_sma.push(stoch)
+        k_sma = self._k_sma.get_value()
+        if k_sma is not None:
+            self._d_sma.push(k_sma)
@@ -1,10 +1,28 @@
 import typing as tp
 from abc import ABC, abstractmethod
 
-from trading import Signal
+from trading import Candle, Signal
+from trading_system.trading_system_handler import TradingSystemHandler
 
 
 class TradingSignalDetector(ABC):
+    # Names of the emitted signals, strategy handlers are resolved for them in advance
+    signal_names: tp.Tuple[str, ...] = ()
+    # on_new_candle is called by the trading system if set
+    subscribes_to_candles = False
+
     @abstractmethod
     def get_trading_signals(self) -> tp.List[Signal]:
         pass
+
+    def get_required_handlers(self) -> tp.List[TradingSystemHandler]:
+        """ Signals are requested only after some of these handlers updated, every tick if empty """
+        return []
+
+    def on_new_candle(self, candle: Candle) -> None:
+        """ Called by the trading system once per candle after handlers updated """
+        pass
+
+    def on_handler_updated(self, handlers: tp.List[TradingSystemHandler]) -> None:
+        """ Called by the trading system with the required handlers updated during the tick """
+        pass
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import typing as tp
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from trading import CandleSeries
+from trading_system.trading_system_handler import TradingSystemHandler
+
+
+class IndicatorCache:
+    """
+    Indicator series precomputed for simulation datasets.
+
+    A series is computed by compute_series() from the candle a handler
+    receives first with the history its first value needs,
+    so it repeats the values of update() on the following candles.
+    Series are keyed by handler name, params, candles fingerprint
+    and the first candle, recently computed ones are kept in memory
+    of the process up to max_size bytes. If path is set, series are also
+    stored there as .npy files, memory-mapped on reading without taking
+    the memory of the process and evicted by the least recent use
+    when their total size exceeds max_size.
+    """
+
+    _series: tp.Dict[str, np.ndarray] = OrderedDict()
+    _series_size = 0
+
+    def __init__(self, max_size: int, path: tp.Optional[Path] = None):
+        self.max_size = max_size
+        self.path = path
+
+    def precompute(self, handler: TradingSystemHandler) -> bool:
+        """ Returns False if the handler can't use precomputed values """
+        candles = handler.ti.get_candle_series()
+        params = handler.get_params()
+        last_candles = handler.ti.get_last_n_candles(1)
+        if candles is None or params is None or len(last_candles) == 0:
+            return False
+        first_index = int(np.searchsorted(candles.ts, last_candles[-1].ts))
+        key = self.get_key(handler, params, candles, first_index)
+
+        values = self._get(key)
+        if values is None:
+            values = self._compute(handler, params, candles, first_index)
+            self._put(key, values)
+        handler.set_precomputed(candles.ts[len(candles) - len(values):], values)
+        return True
+
+    @staticmethod
+    def get_key(handler: TradingSystemHandler, params: tp.Dict[str, tp.Any],
+                candles: CandleSeries, first_index: int) -> str:
+        data = json.dumps({
+            'handler': f'{type(handler).__module__}.{type(handler).__qualname__}',
+            'name': handler.get_name(),
+            'params': params,
+            'candles': candles.get_fingerprint(),
+            'first_index': first_index,
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    @staticmethod
+    def _compute(handler: TradingSystemHandler, params: tp.Dict[str, tp.Any],
+                 candles: CandleSeries, first_index: int) -> np.ndarray:
+        # Candles preceding the first value are taken by update() from the history
+        start = max(0, first_index - handler.get_warmup_length(**params))
+        return handler.compute_series(candles[start:], **params)
+
+    def _get(self, key: str) -> tp.Optional[np.ndarray]:
+        values = IndicatorCache._series.pop(key, None)
+        if values is not None:
+            IndicatorCache._series[key] = values
+            return values
+        if self.path is None:
+            return None
+        try:
+            values = np.load(self._get_path(key), mmap_mode='r')
+            os.utime(self._get_path(key))
+        except (FileNotFoundError, ValueError):
+            return None
+        return values
+
+    def _put(self, key: str, values: np.ndarray) -> None:
+        values.setflags(write=False)
+        self._remember(key, values)
+        if self.path is not None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path / f'.{key}.{os.getpid()}.tmp'
+            with open(tmp_path, 'wb') as file:
+                np.save(file, values)
+            os.replace(tmp_path, self._get_path(key))
+            self._evict_files()
+
+    def _remember(self, key: str, values: np.ndarray) -> None:
+        IndicatorCache._series[key] = values
+        IndicatorCache._series_size += values.nbytes
+        while IndicatorCache._series_size > self.max_size and \
+                len(IndicatorCache._series) > 1:
+            _, evicted = IndicatorCache._series.popitem(last=False)  # type: ignore
+            IndicatorCache._series_size -= evicted.nbytes
+
+    def _evict_files(self) -> None:
+        entries = []
+        total_size = 0
+        for path in self.path.glob('*.npy'):  # type: ignore
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+    def _get_path(self, key: str) -> Path:
+        return self.path / f'{key}.npy'  # type: ignore
@@ -4,3 +4,6 @@ from .moving_average_handler import *
 from .weighted_moving_average_handler import *
 from .relative_strength_index_handler import *
 from .trend_handler import *
+from .volume_relative_strength_index_handler import *
+from .on_balance_volume_handler import *
+from .accumulation_distribution_handler import *
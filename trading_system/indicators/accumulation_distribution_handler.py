@@ -1,7 +1,10 @@
 from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.value_storage import ValueStorage
 from trading_interface.trading_interface import TradingInterface
 from trading.candle import Candle
+from trading.candle_series import CandleSeries
 
+import numpy as np
 import typing as tp
 
 
@@ -10,7 +13,8 @@ class AccumulationDistributionHandler(TradingSystemHandler):
         Accumulation/Distribution formula:
 
         AD[i] = AD[i-1] + CMFV[i], where
-        CMFV[i] = volume[i]*((close[i] - low[i]) - (high[i] - close[i])) / (high[i] - low[i])
+        CMFV[i] = volume[i]*((close[i] - low[i]) - (high[i] - close[i])) / (high[i] - low[i]),
+        CMFV[i] = 0 if high[i] == low[i]
 
         param: start_candle: We start calculating AD from  (current_number_candle - start_candle) candle.
         In general, a rising A/D line helps confirm a rising price trend,
@@ -21,36 +25,57 @@ class AccumulationDistributionHandler(TradingSystemHandler):
         super().__init__(trading_interface)
         self.ti = trading_interface
         self.start_candle = start_candle
-        self.values: tp.List[float] = []
+        self.values = ValueStorage()
         self.calculate_initial_values()
 
     def calculate_initial_values(self) -> None:
         candles = self.ti.get_last_n_candles(self.start_candle)
-        self.values = self.calculate_from(candles)
+        if not isinstance(candles, CandleSeries):
+            candles = CandleSeries.from_candles(candles)
+        self.warmup(candles)
+
+    def warmup(self, candles: CandleSeries) -> None:
+        """
+        Replaces the values with A/D of the candles calculated at once,
+        the following updates continue from its end.
+        """
+        self.values.reset(self.calculate_from(candles))
+        if len(candles) > 0:
+            self.last_candle_timestamp = int(candles.ts[-1])
 
     def update(self) -> bool:
         if not super().received_new_candle():
             return False
 
-        candle = self.ti.get_last_n_candles(1)
-        cmfv = self.calculate_from(candle)[0]
+        candle = self.get_last_candle()
+        price_range = candle.high - candle.low
+        cmfv = candle.volume * ((candle.close - candle.low) - (candle.high - candle.close)) / \
+            price_range if price_range != 0 else 0.
 
         self.values.append(cmfv + (self.values[-1] if self.values else 0))
         return True
 
     def get_last_n_values(self, n: int) -> tp.List[float]:
-        return self.values[-n:]
+        return self.values.get_last_n(n)
 
     @staticmethod
-    def calculate_from(candles: tp.List[Candle]) -> tp.List[float]:
+    def calculate_from(candles: tp.Sequence[Candle]) -> tp.List[float]:
         """
         Calculate AD for given list of candles.
         :param candles: list of candles.
         :return: list of AD[i]
         """
-        ad_values: tp.List[float] = []
-        for candle in candles:
-            cmfv = candle.volume * ((candle.close - candle.low) - (candle.high - candle.close)) / (
-                    candle.high - candle.low)
-            ad_values.append(cmfv + (ad_values[-1] if ad_values else 0))
-        return ad_values
+        if not isinstance(candles, CandleSeries):
+            candles = CandleSeries.from_candles(candles)
+        return AccumulationDistributionHandler.compute_series(candles).tolist()
+
+    @staticmethod
+    def compute_series(candles: CandleSeries,
+                       start_candle: int = 100) -> np.ndarray:
+        """ A/D of a handler created before the first candle """
+        price_range = candles.high - candles.low
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cmfv = np.where(price_range != 0, candles.volume * (
+                (candles.close - candles.low) - (candles.high - candles.close)) /
+                price_range, 0.)
+        return np.cumsum(cmfv)
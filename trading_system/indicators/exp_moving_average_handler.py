@@ -1,13 +1,82 @@
 import typing as tp
 import numpy as np
+import pandas as pd
 
 from logging import INFO
 
 from helpers.typing import Array
 from logger.log_events import ExpMovingAverageEvent
 from logger.logger import Logger
+from trading import CandleSeries
 from trading_interface.trading_interface import TradingInterface
 from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.value_storage import ValueStorage
+
+
+class WindowedExpAverage:
+    """
+    EMA of the last window_size values started from the oldest of them,
+    equal to ExpMovingAverageHandler.calculate_from(window, alpha).
+
+    The window is kept in a ring buffer with its weighted sum
+    S = sum((1 - alpha) ** (window_size - 1 - i) * x_i),
+    so the average alpha * S + (1 - alpha) ** window_size * x_0
+    is updated in O(1) when a value slides in.
+    The sum is recalculated from scratch every time the buffer wraps around
+    to bound floating point drift, and is reset to exact zero
+    when the window holds only zeros.
+    """
+
+    def __init__(self, window_size: int, alpha: float):
+        self.window_size = window_size
+        self.alpha = alpha
+        self._decay = (1 - alpha) ** window_size
+        self._window: tp.List[float] = []
+        self._position = 0
+        self._sum = 0.
+        self._nonzero_count = 0
+
+    def reset(self, values: tp.List[float]) -> None:
+        """ values: exactly window_size last values, oldest first """
+        assert len(values) == self.window_size
+        self._window = list(values)
+        self._position = 0
+        self._sum = self._calculate_sum()
+        self._nonzero_count = sum(int(value != 0) for value in values)
+
+    def push(self, value: float) -> None:
+        old_value = self._window[self._position]
+        self._window[self._position] = value
+        self._position = (self._position + 1) % self.window_size
+        self._nonzero_count += int(value != 0) - int(old_value != 0)
+        if self._nonzero_count == 0:
+            self._sum = 0.
+        elif self._position == 0:
+            self._sum = self._calculate_sum()
+        else:
+            self._sum = (1 - self.alpha) * self._sum \
+                - self._decay * old_value + value
+
+    def get_value(self) -> float:
+        return self.alpha * self._sum + \
+            self._decay * self._window[self._position]
+
+    @staticmethod
+    def calculate_series(values: np.ndarray, window_size: int,
+                         alpha: float) -> np.ndarray:
+        """ Averages of all full windows of values at once """
+        weights = np.logspace(0, window_size - 1, num=window_size,
+                              base=1 - alpha)
+        sums = np.convolve(values, weights)[window_size - 1: len(values)]
+        return alpha * sums + \
+            (1 - alpha) ** window_size * values[:len(sums)]
+
+    def _calculate_sum(self) -> float:
+        total = 0.
+        for i in range(self.window_size):
+            total = total * (1 - self.alpha) + \
+                self._window[(self._position + i) % self.window_size]
+        return total
 
 
 class ExpMovingAverageHandler(TradingSystemHandler):
@@ -24,29 +93,59 @@ class ExpMovingAverageHandler(TradingSystemHandler):
         self.smoothing = smoothing
         self.alpha = smoothing / (1 + window_size)
 
-        self.values: tp.List[float] = []
+        self.values = ValueStorage()
         self.logger = Logger(self.get_name())
 
     def get_name(self) -> str:
         return f'{type(self).__name__}{self.window_size}_{self.smoothing}'
 
+    def get_params(self) -> tp.Dict[str, tp.Any]:
+        return {'window_size': self.window_size, 'smoothing': self.smoothing}
+
     def update(self) -> bool:
+        if self.precomputed is not None:
+            return self.update_precomputed()
         if not super().received_new_candle():
             return False
 
-        new_candle = self.ti.get_last_n_candles(1)[0]
+        new_candle = self.get_last_candle()
         if len(self.values) > 0:
-            self.values.append(
+            self.push_value(
                 new_candle.get_mid_price() * self.alpha +
                 self.values[-1] * (1 - self.alpha))
         else:
-            self.values.append(new_candle.get_mid_price())
+            self.push_value(new_candle.get_mid_price())
+        return True
+
+    def push_value(self, value: float) -> None:
+        self.values.append(float(value))
         self.logger.info_event(
             ExpMovingAverageEvent(self.values[-1], self.window_size))
-        return True
 
     def get_last_n_values(self, n: int) -> tp.List[float]:
-        return self.values[-n:]
+        return self.values.get_last_n(n)
+
+    def warmup(self, candles: CandleSeries) -> None:
+        """
+        Replaces the values with EMA of the whole candles history
+        calculated at once, the following updates continue from its end.
+        """
+        if len(candles) == 0:
+            return
+        self.values.reset(self.compute_series(
+            candles, self.window_size, self.smoothing).tolist())
+        self.last_candle_timestamp = int(candles.ts[-1])
+
+    @staticmethod
+    def compute_series(candles: CandleSeries, window_size: int,
+                       smoothing: int = 2) -> np.ndarray:
+        alpha = smoothing / (1 + window_size)
+        return pd.Series(candles.get_mid_prices()) \
+            .ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+    @staticmethod
+    def get_warmup_length(**params: tp.Any) -> int:
+        return 0
 
     @staticmethod
     def calculate_from(values: Array[float],
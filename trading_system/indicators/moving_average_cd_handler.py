@@ -1,14 +1,24 @@
 import typing as tp
+from pathlib import Path
 
-from helpers.updates_checker import UpdatesChecker, handlers_name
+import numpy as np
+
+from trading import CandleSeries
 from trading_system.indicators.exp_moving_average_handler import \
-    ExpMovingAverageHandler
+    ExpMovingAverageHandler, WindowedExpAverage
 from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.value_storage import ValueStorage
 from trading_interface.trading_interface import TradingInterface
 
 
 class MovingAverageCDHandler(TradingSystemHandler):
-    """ Moving Average Convergence/Divergence(MACD) """
+    """
+    Moving Average Convergence/Divergence(MACD)
+
+    The signal line is EMA of the last `average` MACD values,
+    it is calculated from the shorter history until enough values
+    are collected and then slides in O(1) per candle.
+    """
 
     def __init__(self, trading_interface: TradingInterface, short: int = 12,
                  long: int = 26, average: int = 9):
@@ -25,8 +35,9 @@ class MovingAverageCDHandler(TradingSystemHandler):
         self.short_handler = ExpMovingAverageHandler(self.ti, self.short)
         self.long_handler = ExpMovingAverageHandler(self.ti, self.long)
 
-        self.macd_values: tp.List[float] = []
-        self.signal_values: tp.List[float] = []
+        self.macd_values = ValueStorage()
+        self.signal_values = ValueStorage()
+        self._signal = WindowedExpAverage(average, 2 / (1 + average))
 
     def get_name(self) -> str:
         return f'{type(self).__name__}_s{self.short}_l{self.long}'
@@ -39,8 +50,12 @@ class MovingAverageCDHandler(TradingSystemHandler):
         self.short_handler = tp.cast(ExpMovingAverageHandler, handlers[0])
         self.long_handler = tp.cast(ExpMovingAverageHandler, handlers[1])
 
-    @UpdatesChecker.check_update(handlers_name)
+    def get_params(self) -> tp.Dict[str, tp.Any]:
+        return {'short': self.short, 'long': self.long, 'average': self.average}
+
     def update(self) -> bool:
+        if self.precomputed is not None:
+            return self.update_precomputed()
         if not super().received_new_candle():
             return False
 
@@ -52,10 +67,64 @@ class MovingAverageCDHandler(TradingSystemHandler):
         ema_long = emas_long[0]
 
         self.macd_values.append(ema_short - ema_long)
-        self.signal_values.append(ExpMovingAverageHandler.calculate_from(
-            self.macd_values[-self.average:]))
+        if self.macd_values.count > self.average:
+            self._signal.push(self.macd_values[-1])
+            self.signal_values.append(self._signal.get_value())
+        else:
+            history = self.macd_values.get_last_n(self.average)
+            self.signal_values.append(
+                ExpMovingAverageHandler.calculate_from(history))
+            if len(history) == self.average:
+                self._signal.reset(history)
         return True
 
+    def push_value(self, value: np.ndarray) -> None:
+        """ value: (MACD, signal) """
+        self.macd_values.append(float(value[0]))
+        self.signal_values.append(float(value[1]))
+
+    def warmup(self, candles: CandleSeries) -> None:
+        """
+        Replaces the values of this and the required EMA handlers
+        with ones calculated from the whole candles history at once,
+        the following updates continue from its end.
+        """
+        if len(candles) == 0:
+            return
+        self.short_handler.warmup(candles)
+        self.long_handler.warmup(candles)
+        values = self.compute_series(candles, self.short, self.long, self.average)
+        if len(candles) >= self.average:
+            self._signal.reset(values[-self.average:, 0].tolist())
+        self.macd_values.reset(values[:, 0].tolist())
+        self.signal_values.reset(values[:, 1].tolist())
+        self.last_candle_timestamp = int(candles.ts[-1])
+
+    @staticmethod
+    def compute_series(candles: CandleSeries, short: int = 12,
+                       long: int = 26, average: int = 9) -> np.ndarray:
+        """ Returns (MACD, signal) rows """
+        macd = ExpMovingAverageHandler.compute_series(candles, short) - \
+            ExpMovingAverageHandler.compute_series(candles, long)
+        signal = [ExpMovingAverageHandler.calculate_from(macd[:i + 1])
+                  for i in range(min(len(macd), average - 1))]
+        if len(macd) >= average:
+            signal += WindowedExpAverage.calculate_series(
+                macd, average, 2 / (1 + average)).tolist()
+        return np.column_stack([macd, np.array(signal, dtype=float)])
+
+    @staticmethod
+    def get_warmup_length(**params: tp.Any) -> int:
+        return 0
+
     def get_last_n_values(self, n: int) -> tp.List[tp.Tuple[float, float]]:
         """ Returns MACD and signal value. """
-        return list(zip(self.macd_values[-n:], self.signal_values[-n:]))
+        return list(zip(self.macd_values.get_last_n(n),
+                        self.signal_values.get_last_n(n)))
+
+    def set_retention(self, retention: tp.Optional[int],
+                      history_path: tp.Optional[Path] = None) -> None:
+        # The signal line is started from the first `average` MACD values
+        if retention is not None:
+            retention = max(retention, self.average)
+        super().set_retention(retention, history_path)
@@ -1,15 +1,27 @@
 import typing as tp
 from logging import INFO
 
+import numpy as np
+
 from helpers.typing import Array
 from logger.log_events import MovingAverageEvent
 from logger.logger import Logger
+from trading import CandleSeries
 from trading_interface.trading_interface import TradingInterface
 from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.value_storage import ValueStorage
 
 
 class MovingAverageHandler(TradingSystemHandler):
-    """ Simple Moving Average (SMA or MA) """
+    """
+    Simple Moving Average (SMA or MA)
+
+    Mid prices of the window are kept in a ring buffer with their running sum,
+    so a new candle costs O(1) regardless of the window size.
+    The sum is recalculated from scratch every time the buffer wraps around
+    to bound floating point drift, and the window is reloaded from
+    the trading interface if some candles were missed.
+    """
 
     def __init__(self, trading_interface: TradingInterface, window_size: int):
         super().__init__(trading_interface)
@@ -17,29 +29,76 @@ class MovingAverageHandler(TradingSystemHandler):
 
         self.window_size = window_size
 
-        self.values: tp.List[float] = []
+        self.values = ValueStorage()
+        self._window: tp.List[float] = []
+        self._position = 0
+        self._sum = 0.
+        self._last_ts: tp.Optional[int] = None
         self.logger = Logger(self.get_name())
 
     def get_name(self) -> str:
         return f'{type(self).__name__}{self.window_size}'
 
+    def get_params(self) -> tp.Dict[str, tp.Any]:
+        return {'window_size': self.window_size}
+
     def update(self) -> bool:
+        if self.precomputed is not None:
+            return self.update_precomputed()
         if not super().received_new_candle():
             return False
 
-        candles = self.ti.get_last_n_candles(self.window_size)
-        if len(candles) < self.window_size:
+        candles = self.ti.get_last_n_candles(2)
+        if len(candles) == 2 and candles[0].ts == self._last_ts:
+            self._push(candles[1].get_mid_price())
+        elif not self._reload_window():
             return False
+        self._last_ts = candles[-1].ts
 
-        candle_values = list(map(lambda c: c.get_mid_price(), candles))
-        self.values.append(self.calculate_from(candle_values))
+        self.push_value(self._sum / self.window_size)
+        return True
+
+    def push_value(self, value: float) -> None:
+        self.values.append(float(value))
         self.logger.info_event(
             MovingAverageEvent(self.get_last_n_values(1)[0], self.window_size))
-        return True
 
     def get_last_n_values(self, n: int) -> tp.List[float]:
-        return self.values[-n:]
+        return self.values.get_last_n(n)
+
+    def _push(self, value: float) -> None:
+        old_value = self._window[self._position]
+        self._window[self._position] = value
+        self._position = (self._position + 1) % self.window_size
+        if self._position == 0:
+            self._sum = sum(self._window)
+        else:
+            self._sum += value - old_value
+
+    def _reload_window(self) -> bool:
+        candles = self.ti.get_last_n_candles(self.window_size)
+        if len(candles) < self.window_size:
+            self._last_ts = None
+            return False
+        self._window = [candle.get_mid_price() for candle in candles]
+        self._position = 0
+        self._sum = sum(self._window)
+        return True
 
     @staticmethod
     def calculate_from(values: Array[float]) -> float:
         return sum(values) / len(values)
+
+    @staticmethod
+    def compute_series(candles: CandleSeries,
+                       window_size: int) -> np.ndarray:
+        values = np.full(len(candles), np.nan)
+        if len(candles) >= window_size:
+            values[window_size - 1:] = np.convolve(
+                candles.get_mid_prices(), np.ones(window_size),
+                'valid') / window_size
+        return values
+
+    @staticmethod
+    def get_warmup_length(window_size: int) -> int:
+        return window_size - 1
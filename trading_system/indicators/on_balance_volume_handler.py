@@ -1,7 +1,10 @@
 from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.value_storage import ValueStorage
 from trading_interface.trading_interface import TradingInterface
 from trading.candle import Candle
+from trading.candle_series import CandleSeries
 
+import numpy as np
 import typing as tp
 
 
@@ -22,12 +25,23 @@ class OnBalanceVolumeHandler(TradingSystemHandler):
         super().__init__(trading_interface)
         self.ti = trading_interface
         self.start_candle = start_candle
-        self.values: tp.List[float] = []
+        self.values = ValueStorage()
         self.calculate_initial_values()
 
     def calculate_initial_values(self) -> None:
         candles = self.ti.get_last_n_candles(self.start_candle)
-        self.values = self.calculate_from(candles)
+        if not isinstance(candles, CandleSeries):
+            candles = CandleSeries.from_candles(candles)
+        self.warmup(candles)
+
+    def warmup(self, candles: CandleSeries) -> None:
+        """
+        Replaces the values with OBV of the candles calculated at once,
+        the following updates continue from its end.
+        """
+        self.values.reset(self.calculate_from(candles))
+        if len(candles) > 0:
+            self.last_candle_timestamp = int(candles.ts[-1])
 
     def update(self) -> bool:
         if not super().received_new_candle():
@@ -38,25 +52,33 @@ class OnBalanceVolumeHandler(TradingSystemHandler):
         if len(candles) < 2:
             return False
 
-        self.values.append(self.calculate_from(candles)[-1] + (self.values[-1] if self.values else 0))
+        previous, candle = candles[0], candles[1]
+        change = candle.volume if candle.close > previous.close else \
+            -candle.volume if candle.close < previous.close else 0.
+        self.values.append((self.values[-1] if self.values else 0) + change)
         return True
 
     def get_last_n_values(self, n: int) -> tp.List[float]:
-        return self.values[-n:]
+        return self.values.get_last_n(n)
 
     @staticmethod
-    def calculate_from(candles: tp.List[Candle]) -> tp.List[float]:
+    def calculate_from(candles: tp.Sequence[Candle]) -> tp.List[float]:
         """
             Calculate OBV for given list of candles.
             :param candles: list of candles.
-            :return: list of AD[i]
+            :return: list of OBV[i] starting with 0
         """
-        obv_values: tp.List[float] = [0]
-        for i in range(len(candles) - 1):
-            if candles[i + 1].close > candles[i].close:
-                obv_values.append(obv_values[-1] + candles[i + 1].volume)
-            elif candles[i + 1].close == candles[i].close:
-                obv_values.append(obv_values[-1])
-            else:
-                obv_values.append(obv_values[-1] - candles[i + 1].volume)
-        return obv_values
+        if not isinstance(candles, CandleSeries):
+            candles = CandleSeries.from_candles(candles)
+        values = OnBalanceVolumeHandler.compute_series(candles)
+        values[:1] = 0
+        return values.tolist() if len(values) > 0 else [0.]
+
+    @staticmethod
+    def compute_series(candles: CandleSeries,
+                       start_candle: int = 100) -> np.ndarray:
+        """ OBV of a handler created before the first candle """
+        values = np.full(len(candles), np.nan)
+        changes = np.sign(np.diff(candles.close)) * candles.volume[1:]
+        values[1:] = np.cumsum(changes)
+        return values
@@ -1,53 +1,125 @@
 import typing as tp
+from enum import Enum
 from logging import INFO
 from math import isclose
 
+import numpy as np
+import pandas as pd
+
 from helpers.typing import Array
 from logger.log_events import RSIEvent
 from logger.logger import Logger
+from trading import CandleSeries
 from trading_interface.trading_interface import TradingInterface
-from helpers.updates_checker import UpdatesChecker, handlers_name
 from trading_system.indicators.exp_moving_average_handler import \
-    ExpMovingAverageHandler
+    ExpMovingAverageHandler, WindowedExpAverage
 from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.value_storage import ValueStorage
+
+
+class RSIMode(Enum):
+    # EMA of gains and losses over the last window_size candles only
+    Windowed = 'windowed'
+    # Wilder's smoothing over the whole history seeded with an SMA
+    Wilder = 'wilder'
 
 
 class RelativeStrengthIndexHandler(TradingSystemHandler):
-    """ Relative Strength Index (RSI) """
+    """
+    Relative Strength Index (RSI)
+
+    Average gain and loss are updated in O(1) per candle.
+    In Windowed mode the values are equal to calculate_from() of the last
+    window_size deltas, in Wilder mode the averages are smoothed
+    over the whole history: avg = (avg * (window_size - 1) + x) / window_size.
+    Averages are restarted from the last window_size deltas
+    if some candles were missed.
+    """
 
-    def __init__(self, trading_interface: TradingInterface, window_size: int):
+    def __init__(self, trading_interface: TradingInterface, window_size: int,
+                 mode: RSIMode = RSIMode.Windowed):
         super().__init__(trading_interface)
         self.ti = trading_interface
 
         self.window_size = window_size
         self.alpha = 1 / window_size
+        self.mode = RSIMode(mode)
 
-        self.relative_strength: tp.List[float] = []
-        self.values: tp.List[float] = []
+        self.relative_strength = ValueStorage()
+        self.values = ValueStorage()
+
+        self._gains = WindowedExpAverage(window_size, self.alpha)
+        self._losses = WindowedExpAverage(window_size, self.alpha)
+        self._average_gain = 0.
+        self._average_loss = 0.
+        self._last_ts: tp.Optional[int] = None
 
         self.logger = Logger(self.get_name())
 
     def get_name(self) -> str:
-        return f'{type(self).__name__}{self.window_size}'
+        suffix = '_wilder' if self.mode == RSIMode.Wilder else ''
+        return f'{type(self).__name__}{self.window_size}{suffix}'
+
+    def get_params(self) -> tp.Dict[str, tp.Any]:
+        return {'window_size': self.window_size, 'mode': self.mode.value}
 
-    @UpdatesChecker.check_update(handlers_name)
     def update(self) -> bool:
+        if self.precomputed is not None:
+            return self.update_precomputed()
         if not super().received_new_candle():
             return False
 
-        candles = self.ti.get_last_n_candles(self.window_size)
-        if len(candles) < self.window_size:
+        candles = self.ti.get_last_n_candles(2)
+        if len(candles) == 2 and candles[0].ts == self._last_ts:
+            self._push(candles[1].get_delta())
+        elif not self._reload_window():
             return False
+        self._last_ts = candles[-1].ts
 
-        deltas = list(map(lambda c: c.get_delta(), candles))
-        rs, rsi = self.calculate_from(deltas, self.alpha)
+        rs, rsi = self._calculate_index(self._average_gain, self._average_loss)
         self.relative_strength.append(rs)
         self.values.append(rsi)
         self.logger.info_event(RSIEvent(rsi))
         return True
 
+    def push_value(self, value: float) -> None:
+        rsi = float(value)
+        self.relative_strength.append(
+            rsi / (100 - rsi) if rsi < 100 else float('inf'))
+        self.values.append(rsi)
+        self.logger.info_event(RSIEvent(rsi))
+
     def get_last_n_values(self, n: int) -> tp.List[float]:
-        return self.values[-n:]
+        return self.values.get_last_n(n)
+
+    def _push(self, delta: float) -> None:
+        gain, loss = max(delta, 0), max(-delta, 0)
+        if self.mode == RSIMode.Wilder:
+            self._average_gain += (gain - self._average_gain) * self.alpha
+            self._average_loss += (loss - self._average_loss) * self.alpha
+        else:
+            self._gains.push(gain)
+            self._losses.push(loss)
+            self._average_gain = self._gains.get_value()
+            self._average_loss = self._losses.get_value()
+
+    def _reload_window(self) -> bool:
+        candles = self.ti.get_last_n_candles(self.window_size)
+        if len(candles) < self.window_size:
+            self._last_ts = None
+            return False
+        deltas = [candle.get_delta() for candle in candles]
+        gains = [max(delta, 0) for delta in deltas]
+        losses = [max(-delta, 0) for delta in deltas]
+        if self.mode == RSIMode.Wilder:
+            self._average_gain = sum(gains) / self.window_size
+            self._average_loss = sum(losses) / self.window_size
+        else:
+            self._gains.reset(gains)
+            self._losses.reset(losses)
+            self._average_gain = self._gains.get_value()
+            self._average_loss = self._losses.get_value()
+        return True
 
     @staticmethod
     def calculate_from(deltas: Array[float],
@@ -61,7 +133,47 @@ class RelativeStrengthIndexHandler(TradingSystemHandler):
             list(map(lambda x: max(x, 0), deltas)), alpha)
         average_loss = ExpMovingAverageHandler.calculate_from(
             list(map(lambda x: max(-x, 0), deltas)), alpha)
+        return RelativeStrengthIndexHandler._calculate_index(
+            average_gain, average_loss)
+
+    @staticmethod
+    def compute_series(candles: CandleSeries, window_size: int,
+                       mode: RSIMode = RSIMode.Windowed) -> np.ndarray:
+        """ RSI of a handler updated on every candle """
+        values = np.full(len(candles), np.nan)
+        if len(candles) < window_size:
+            return values
 
+        deltas = candles.get_deltas()
+        gains, losses = np.maximum(deltas, 0), np.maximum(-deltas, 0)
+        alpha = 1 / window_size
+        if RSIMode(mode) == RSIMode.Wilder:
+            def smooth(x: np.ndarray) -> np.ndarray:
+                seeded = np.concatenate(
+                    [[np.sum(x[:window_size]) / window_size], x[window_size:]])
+                return pd.Series(seeded).ewm(alpha=alpha, adjust=False) \
+                    .mean().to_numpy()
+        else:
+            def smooth(x: np.ndarray) -> np.ndarray:
+                return WindowedExpAverage.calculate_series(x, window_size, alpha)
+        average_gain, average_loss = smooth(gains), smooth(losses)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative_strength = np.where(
+                average_loss == 0,
+                np.where(np.isclose(average_gain, 0, rtol=0, atol=1e-7),
+                         1, np.inf),
+                average_gain / average_loss)
+        values[window_size - 1:] = 100 - 100 / (1 + relative_strength)
+        return values
+
+    @staticmethod
+    def get_warmup_length(window_size: int, **params: tp.Any) -> int:
+        return window_size - 1
+
+    @staticmethod
+    def _calculate_index(average_gain: float, average_loss: float) \
+            -> tp.Tuple[float, float]:
         if average_loss == 0:  # Avoid RuntimeWarning with zero division
             relative_strength = \
                 1 if isclose(average_gain, 0, abs_tol=1e-7) else float('inf')
@@ -2,18 +2,20 @@ import typing as tp
 from logging import INFO
 
 import numpy as np
-from mypy_extensions import Arg
 
 import base.geometry.convex_hull as geom
 from logger.log_events import TrendLinesEvent
 from logger.logger import Logger
-from trading import TrendLine
+from trading import CandleSeries, TrendLine
 from trading_interface.trading_interface import TradingInterface
 from trading_system.trading_system_handler import TradingSystemHandler
 
 MIN_CANDLE_COUNT = 5
 MAX_LAST_CANDLE_COUNT = 40
 PRICE_SHIFT = 0.13
+# Max squared error of the bound points, doubled until some line fits
+BOUND = 0.005
+BOUND_STEPS = 10
 
 
 class TrendHandler(TradingSystemHandler):
@@ -30,70 +32,57 @@ class TrendHandler(TradingSystemHandler):
             TrendLinesEvent(lower_trend_line, upper_trend_line))
         return True
 
-    def get_trend_lines(self) -> tp.Tuple[TrendLine, TrendLine]:
+    def get_trend_lines(self) \
+            -> tp.Tuple[tp.Optional[TrendLine], tp.Optional[TrendLine]]:
+        """
+        Lines fitted to the lower and upper convex bounds of the last candles,
+        each over the longest suffix of candles whose bound is close to a line,
+        None if there is no such suffix.
+        """
         candles = self.ti.get_last_n_candles(MAX_LAST_CANDLE_COUNT)
 
         if len(candles) < MIN_CANDLE_COUNT:
-            return None, None  # type: ignore
-
-        ts_offset = candles[0].ts
-        max_price = max(candle.get_upper_price() for candle in candles)
-        coef = max_price / (candles[1].ts - candles[0].ts) / 20
-
-        lower_bound = np.array(
-            [((candles[index].ts - ts_offset) * coef,
-              candles[index].get_lower_price()) for index in
-             range(len(candles))])
-
-        upper_bound = np.array(
-            [((candles[index].ts - ts_offset) * coef,
-              candles[index].get_upper_price()) for index in
-             range(len(candles))])
-
-        lower_trend_line = self.__calculate_trend_line(lower_bound,
-                                                       geom.get_lower_bound)
-        upper_trend_line = self.__calculate_trend_line(upper_bound,
-                                                       geom.get_upper_bound)
+            return None, None
+
+        if isinstance(candles, CandleSeries):
+            ts = candles.ts
+            lower_prices = candles.get_lower_prices()
+            upper_prices = candles.get_upper_prices()
+        else:
+            ts = np.array([candle.ts for candle in candles])
+            lower_prices = np.array([c.get_lower_price() for c in candles])
+            upper_prices = np.array([c.get_upper_price() for c in candles])
+
+        lower_trend_line = self.__calculate_trend_line(
+            ts, lower_prices, upper=False)
+        upper_trend_line = self.__calculate_trend_line(
+            ts, upper_prices, upper=True)
 
         if lower_trend_line is not None:
-            lower_trend_line.k *= coef
-            lower_trend_line.b -= lower_trend_line.k * ts_offset
             lower_trend_line.b -= PRICE_SHIFT
-
         if upper_trend_line is not None:
-            upper_trend_line.k *= coef
-            upper_trend_line.b -= upper_trend_line.k * ts_offset
             upper_trend_line.b += PRICE_SHIFT
-
         return lower_trend_line, upper_trend_line
 
-    def __calculate_trend_line(self, points: np.ndarray,
-                               calc_convex_bound: tp.Callable[
-                                   [np.ndarray, Arg(bool, 'is_sorted')],
-                                   np.ndarray]) -> TrendLine:
-        BOUND = 0.005
-        for iter in range(10):
-            best_line = None
-            convex_bound = calc_convex_bound(points[-MIN_CANDLE_COUNT:],
-                                             is_sorted=True)
-            for point_count in range(MIN_CANDLE_COUNT + 1, len(points) + 1):
-                convex_bound = calc_convex_bound(
-                    np.concatenate(
-                        [[points[len(points) - point_count]], convex_bound]),
-                    is_sorted=True)
-                line = geom.put_line(convex_bound)
-                if self.__calculate_penalty(convex_bound,
-                                            TrendLine(*line)) < BOUND:
-                    best_line = line
-            if best_line is None:
-                BOUND *= 2
-            else:
-                return TrendLine(*best_line)
-        return None  # type: ignore
-
-    def __calculate_penalty(self, points: np.ndarray,
-                            line: TrendLine) -> float:
-        penalty = 0.0
-        for p in points:
-            penalty += (p[1] - line.get_value_at(p[0])) ** 2
-        return penalty
+    @staticmethod
+    def __calculate_trend_line(ts: np.ndarray, prices: np.ndarray,
+                               upper: bool) -> tp.Optional[TrendLine]:
+        """
+        Among suffixes of more than MIN_CANDLE_COUNT candles chooses
+        the longest one with the error below the smallest of bounds
+        BOUND * 2 ** i, i < BOUND_STEPS, that any suffix satisfies
+        """
+        # Candle indices as x keep the fit well conditioned
+        x = (ts - ts[-1]) / (ts[1] - ts[0])
+        k, b, sse = geom.fit_suffix_bounds(x, prices, upper)
+        candidates = slice(0, len(ts) - MIN_CANDLE_COUNT)
+        bounds = BOUND * 2. ** np.arange(BOUND_STEPS)
+        fits = sse[candidates][None, :] < bounds[:, None]
+        steps = np.flatnonzero(fits.any(axis=1))
+        if len(steps) == 0:
+            return None
+        # Suffixes are ordered from the longest one
+        index = int(np.argmax(fits[steps[0]]))
+        scale = ts[1] - ts[0]
+        return TrendLine(k[index] / scale,
+                         b[index] - k[index] / scale * ts[-1])
@@ -1,7 +1,10 @@
 from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.value_storage import ValueStorage
 from trading_interface.trading_interface import TradingInterface
 from trading.candle import Candle
+from trading.candle_series import CandleSeries
 
+import numpy as np
 import typing as tp
 
 
@@ -10,6 +13,11 @@ class VolumeRelativeStrengthIndexHandler(TradingSystemHandler):
          Volume Relative Strength Index formula:
          VRSI = 100 - 100 / (1 + VORS), where
          VORS = (Average Up-Volume) / (Average Down-Volume)
+
+         Volumes of the window are kept in a ring buffer with running sums
+         of total and up volume, so a new candle costs O(1).
+         The sums are recalculated every time the buffer wraps around,
+         the window is reloaded if some candles were missed.
      """
 
     def __init__(self, trading_interface: TradingInterface, window_size: int = 14) -> None:
@@ -18,26 +26,97 @@ class VolumeRelativeStrengthIndexHandler(TradingSystemHandler):
 
         self.window_size = window_size
 
-        self.values: tp.List[float] = []
+        self.values = ValueStorage()
+        self._volumes: tp.List[float] = []
+        self._up_volumes: tp.List[float] = []
+        self._position = 0
+        self._volume_sum = 0.
+        self._up_volume_sum = 0.
+        self._last_ts: tp.Optional[int] = None
+
+    def get_params(self) -> tp.Dict[str, tp.Any]:
+        return {'window_size': self.window_size}
 
     def update(self) -> bool:
+        if self.precomputed is not None:
+            return self.update_precomputed()
         if not super().received_new_candle():
             return False
 
-        candles = self.ti.get_last_n_candles(self.window_size)
-        if len(candles) < self.window_size:
+        candles = self.ti.get_last_n_candles(2)
+        if len(candles) == 2 and candles[0].ts == self._last_ts:
+            self._push(candles[1])
+        elif not self._reload_window(self.ti.get_last_n_candles(self.window_size)):
+            return False
+        self._last_ts = candles[-1].ts
+
+        if self._volume_sum == 0:
             return False
-        self.values.append(self.calculate_from(candles, self.window_size)[0])
+        self.push_value(100 * self._up_volume_sum / self._volume_sum)
         return True
 
+    def push_value(self, value: float) -> None:
+        self.values.append(float(value))
+
     def get_last_n_values(self, n: int) -> tp.List[float]:
-        return self.values[-n:]
+        return self.values.get_last_n(n)
+
+    def warmup(self, candles: CandleSeries) -> None:
+        """
+        Replaces the values with VRSI of the whole candles history
+        calculated at once, the following updates continue from its end.
+        """
+        if not self._reload_window(candles[-self.window_size:]):
+            return
+        values = self.compute_series(candles, self.window_size)
+        self.values.reset(values[~np.isnan(values)].tolist())
+        self._last_ts = self.last_candle_timestamp = int(candles.ts[-1])
+
+    def _push(self, candle: Candle) -> None:
+        up_volume = candle.volume if candle.get_delta() >= 0 else 0.
+        old_volume = self._volumes[self._position]
+        old_up_volume = self._up_volumes[self._position]
+        self._volumes[self._position] = candle.volume
+        self._up_volumes[self._position] = up_volume
+        self._position = (self._position + 1) % self.window_size
+        if self._position == 0:
+            self._volume_sum = sum(self._volumes)
+            self._up_volume_sum = sum(self._up_volumes)
+        else:
+            self._volume_sum += candle.volume - old_volume
+            self._up_volume_sum += up_volume - old_up_volume
+
+    def _reload_window(self, candles: tp.Sequence[Candle]) -> bool:
+        if len(candles) < self.window_size:
+            self._last_ts = None
+            return False
+        self._volumes = [candle.volume for candle in candles]
+        self._up_volumes = [candle.volume if candle.get_delta() >= 0 else 0.
+                            for candle in candles]
+        self._position = 0
+        self._volume_sum = sum(self._volumes)
+        self._up_volume_sum = sum(self._up_volumes)
+        return True
+
+    @staticmethod
+    def calculate_from(candles: tp.Sequence[Candle], window_size: int) -> tp.List[float]:
+        if not isinstance(candles, CandleSeries):
+            candles = CandleSeries.from_candles(candles)
+        return VolumeRelativeStrengthIndexHandler.compute_series(
+            candles, window_size)[window_size - 1:].tolist()
+
+    @staticmethod
+    def compute_series(candles: CandleSeries,
+                       window_size: int = 14) -> np.ndarray:
+        values = np.full(len(candles), np.nan)
+        if len(candles) >= window_size:
+            up_volume = np.where(candles.get_deltas() >= 0, candles.volume, 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                values[window_size - 1:] = 100 * \
+                    np.convolve(up_volume, np.ones(window_size), 'valid') / \
+                    np.convolve(candles.volume, np.ones(window_size), 'valid')
+        return values
 
     @staticmethod
-    def calculate_from(candles: tp.List[Candle], window_size: int) -> tp.List[float]:
-        vrsi_values: tp.List[float] = []
-        for i in range(window_size, len(candles) + 1):
-            total_volume = sum([candle.volume for candle in candles[i - window_size:i]])
-            up_volume = sum([candle.volume if candle.get_delta() >= 0 else 0 for candle in candles[i - window_size:i]])
-            vrsi_values.append(100 * up_volume / total_volume)
-        return vrsi_values
+    def get_warmup_length(window_size: int = 14) -> int:
+        return window_size - 1
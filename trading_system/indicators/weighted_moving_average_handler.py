@@ -1,4 +1,6 @@
+from trading import CandleSeries
 from trading_system.trading_system_handler import TradingSystemHandler
+from trading_system.value_storage import ValueStorage
 from trading_interface.trading_interface import TradingInterface
 
 import numpy as np
@@ -18,12 +20,17 @@ class WeightedMovingAverageHandler(TradingSystemHandler):
         self.weights = np.arange(1, window_size + 1)
         self.denominator = window_size * (window_size + 1) // 2
 
-        self.values: tp.List[float] = []
+        self.values = ValueStorage()
 
     def get_name(self) -> str:
         return f'{type(self).__name__}{self.window_size}'
 
+    def get_params(self) -> tp.Dict[str, tp.Any]:
+        return {'window_size': self.window_size}
+
     def update(self) -> bool:
+        if self.precomputed is not None:
+            return self.update_precomputed()
         if not super().received_new_candle():
             return False
 
@@ -32,14 +39,32 @@ class WeightedMovingAverageHandler(TradingSystemHandler):
             return False
 
         candle_values = list(map(lambda c: c.get_mid_price(), candles))
-        self.values.append(
+        self.push_value(
             np.sum(self.weights * candle_values) / self.denominator)
         return True
 
+    def push_value(self, value: float) -> None:
+        self.values.append(float(value))
+
     def get_last_n_values(self, n: int) -> tp.List[float]:
-        return self.values[-n:]
+        return self.values.get_last_n(n)
 
     @staticmethod
     def calculate_from(values: Array[float]) -> float:
         coefs = np.arange(1, len(values) + 1)
         return np.sum(coefs * values) / (len(values) * (len(values) + 1) / 2)
+
+    @staticmethod
+    def compute_series(candles: CandleSeries,
+                       window_size: int) -> np.ndarray:
+        values = np.full(len(candles), np.nan)
+        if len(candles) >= window_size:
+            weights = np.arange(window_size, 0, -1)
+            values[window_size - 1:] = np.convolve(
+                candles.get_mid_prices(), weights, 'valid') / \
+                (window_size * (window_size + 1) // 2)
+        return values
+
+    @staticmethod
+    def get_warmup_length(window_size: int) -> int:
+        return window_size - 1
@@ -11,6 +11,9 @@ from copy import copy
 
 
 class OrdersHandler(TradingSystemHandler):
+    # Orders are filled between candles
+    subscribes_to_candles = False
+
     def __init__(self, trading_interface: TradingInterface):
         super().__init__(trading_interface)
         self.ti = trading_interface
@@ -4,13 +4,16 @@ import typing as tp
 
 from collections import OrderedDict
 from copy import copy
+from pathlib import Path
 import math
 
 from helpers.typing.common_types import Config
 from trading_interface.trading_interface import TradingInterface
 
 from trading_system.candles_handler import CandlesHandler
+from trading_system.indicator_cache import IndicatorCache
 from trading_system.orders_handler import OrdersHandler
+from trading_system.update_tracker import UpdateTracker
 from trading_system.indicators import *
 
 from trading_system.trading_statistics import TradingStatistics
@@ -23,8 +26,22 @@ from trading import Asset, AssetPair, Signal, Order, Direction, Candle
 from helpers.typing import TradingSystemHandlerT
 from helpers.typing.utils import require
 
+if tp.TYPE_CHECKING:
+    # Detectors depend on the trading system
+    from trading_signal_detectors.trading_signal_detector import TradingSignalDetector
+
 
 class Handlers(OrderedDict):  # type: ignore
+    """
+    Handlers by name in topological order,
+    required handlers are added before the ones depending on them.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Names of the required handlers by handler name
+        self.required: tp.Dict[str, tp.List[str]] = {}
+
     def add(self, handler: TradingSystemHandler) -> Handlers:
         if handler.get_name() in self.keys():
             return self
@@ -37,11 +54,67 @@ class Handlers(OrderedDict):  # type: ignore
                 self.add(dependent_handler)
 
         handler.link_required_handlers(handlers)
+        self.required[handler.get_name()] = \
+            [dependent_handler.get_name() for dependent_handler in handlers]
         self[handler.get_name()] = handler
         return self
 
 
+class HandlersScheduler:
+    """
+    Checks for a new candle once per tick and pushes it to the handlers
+    subscribed to candles in the order of Handlers.
+    Handlers with required handlers are updated only if
+    some of the required ones produced a value during the tick,
+    handlers not subscribed to candles are updated on every tick.
+    Versions of the handlers that produced values are increased.
+    """
+
+    def __init__(self, trading_interface: TradingInterface, handlers: Handlers):
+        self.ti = trading_interface
+        self.handlers = handlers
+        self.last_candle_timestamp = -1
+        # Candle pushed during the last update
+        self.new_candle: tp.Optional[Candle] = None
+        # (name, handler, required names, subscribes to candles)
+        self._schedule: tp.List[tp.Tuple[str, TradingSystemHandler,
+                                         tp.Tuple[str, ...], bool]] = []
+
+    def update(self) -> tp.Set[str]:
+        """ Returns names of the handlers updated with new values """
+        if len(self._schedule) != len(self.handlers):
+            self._schedule = [
+                (name, handler, tuple(self.handlers.required.get(name, [])),
+                 handler.subscribes_to_candles)
+                for name, handler in self.handlers.items()]
+
+        candle: tp.Optional[Candle] = None
+        last_candles = self.ti.get_last_n_candles(1)
+        if last_candles and last_candles[0].ts != self.last_candle_timestamp:
+            candle = last_candles[0]
+            self.last_candle_timestamp = candle.ts
+
+        self.new_candle = candle
+        updated: tp.Set[str] = set()
+        for name, handler, required, subscribes_to_candles in self._schedule:
+            if required and updated.isdisjoint(required):
+                continue
+            if not subscribes_to_candles:
+                is_updated = handler.update()
+            elif candle is None:
+                continue
+            else:
+                is_updated = handler.on_new_candle(candle)
+            if is_updated:
+                handler.version += 1
+                updated.add(name)
+        return updated
+
+
 class TradingSystem:
+    # Is a signal detector of filled orders, see TradingSignalDetector
+    signal_names = ('filled_order',)
+
     def __init__(self, trading_interface: TradingInterface, config: Config):
         self.logger = Logger('TradingSystem')
         self.ti = trading_interface
@@ -55,19 +128,55 @@ class TradingSystem:
             start_timestamp=self.ti.get_timestamp(),
             initial_coin_balance=self.get_total_coin_balance())
         self.trading_signals: tp.List[Signal] = []
+        # Number of values kept in memory by every handler, None keeps all
+        self.handlers_retention: tp.Optional[int] = config.get('handlers_retention')
+        history_path = config.get('handlers_history_path')
+        self.handlers_history_path: tp.Optional[Path] = \
+            None if history_path is None else Path(history_path)
+        # Indicators take values precomputed for the whole simulation if enabled
+        cache_config = config.get('indicators_cache', {'enabled': False})
+        self.indicator_cache: tp.Optional[IndicatorCache] = None
+        if cache_config['enabled']:
+            cache_path = cache_config.get('path')
+            self.indicator_cache = IndicatorCache(
+                max_size=cache_config['max_size_mb'] * 2 ** 20,
+                path=None if cache_path is None else Path(cache_path))
         self.handlers = Handlers() \
             .add(CandlesHandler(trading_interface)) \
             .add(OrdersHandler(trading_interface))
+        self.scheduler = HandlersScheduler(trading_interface, self.handlers)
+        self.update_tracker = UpdateTracker()
+        # Signal detectors called back on new candles and handler updates
+        self.candle_detectors: tp.List[TradingSignalDetector] = []
+        self.handler_detectors: tp.List[tp.Tuple[TradingSignalDetector,
+                                                 tp.Tuple[str, ...]]] = []
         self.logger.info('Trading system initialized')
 
     def add_handler(self, handler_type: tp.Any, params: tp.Dict[str, tp.Any]) -> TradingSystemHandlerT:
         handler = handler_type(trading_interface=self.ti, **params)
+        names = set(self.handlers.keys())
         self.handlers.add(handler)
+        for name, new_handler in self.handlers.items():
+            if name not in names:
+                new_handler.set_retention(self.handlers_retention,
+                                          self.handlers_history_path)
+                if self.indicator_cache is not None:
+                    self.indicator_cache.precompute(new_handler)
         return self.handlers[handler.get_name()]
 
+    def add_detector(self, detector: TradingSignalDetector) -> None:
+        """ Makes update() call back the detector, see TradingSignalDetector """
+        if detector.subscribes_to_candles:
+            self.candle_detectors.append(detector)
+        names = tuple(handler.get_name() for handler in detector.get_required_handlers())
+        if names:
+            self.handler_detectors.append((detector, names))
+
     def stop_trading(self) -> None:
         self.cancel_all()
         self.update()
+        for handler in self.handlers.values():
+            handler.flush_history()
 
     def get_trading_statistics(self) -> TradingStatistics:
         stats = copy(self.stats)
@@ -78,8 +187,15 @@ class TradingSystem:
         return stats
 
     def update(self) -> None:
-        for handler in self.handlers.values():
-            handler.update()
+        updated = self.scheduler.update()
+        if self.scheduler.new_candle is not None:
+            for detector in self.candle_detectors:
+                detector.on_new_candle(self.scheduler.new_candle)
+        if updated:
+            for detector, names in self.handler_detectors:
+                handlers = [self.handlers[name] for name in names if name in updated]
+                if handlers:
+                    detector.on_handler_updated(handlers)
         for order in self.get_handler(OrdersHandler).get_new_filled_orders():
             self._handle_filled_order(order)
             self.trading_signals.append(Signal('filled_order', copy(order)))
@@ -89,6 +205,9 @@ class TradingSystem:
         self.trading_signals = []
         return signals
 
+    def get_required_handlers(self) -> tp.List[TradingSystemHandler]:
+        return []
+
     def exchange_is_alive(self) -> bool:
         return self.ti.is_alive()
 
@@ -190,7 +309,7 @@ class TradingSystem:
         self.logger.info(f'Checking wallet: {self.wallet.items()}')
         return copy(self.wallet)
 
-    def get_last_n_candles(self, n: int) -> tp.List[Candle]:
+    def get_last_n_candles(self, n: int) -> tp.Sequence[Candle]:
         return self.ti.get_last_n_candles(n)
 
     def get_handler(self, cls: tp.Type[TradingSystemHandlerT]) \
@@ -1,13 +1,27 @@
 from __future__ import annotations
 import typing as tp
+from pathlib import Path
 
+import numpy as np
+
+from trading import Candle, CandleSeries
 from trading_interface.trading_interface import TradingInterface
+from trading_system.value_storage import ValueStorage
 
 
 class TradingSystemHandler:
+    # Updated by the scheduler on new candles, otherwise on every tick
+    subscribes_to_candles = True
+
     def __init__(self, trading_interface: TradingInterface):
         self.ti = trading_interface
         self.last_candle_timestamp = -1
+        # Candle pushed by the scheduler for the running update()
+        self.pushed_candle: tp.Optional[Candle] = None
+        # Number of scheduled updates that produced values, see UpdateTracker
+        self.version = 0
+        # (timestamps, values) computed beforehand, see set_precomputed
+        self.precomputed: tp.Optional[tp.Tuple[np.ndarray, np.ndarray]] = None
 
     def update(self) -> bool:
         """ Returns True if updated with new values. """
@@ -25,11 +39,88 @@ class TradingSystemHandler:
         """ Should be unique. """
         return type(self).__name__
 
+    @staticmethod
+    def compute_series(candles: CandleSeries, *args: tp.Any,
+                       **params: tp.Any) -> np.ndarray:
+        """
+        Values of the handler created with params after every candle at once,
+        NaN where update() produces no value. For indicators.
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def get_warmup_length(*args: tp.Any, **params: tp.Any) -> int:
+        """ Number of leading candles compute_series gives no value for """
+        raise NotImplementedError
+
+    def get_params(self) -> tp.Optional[tp.Dict[str, tp.Any]]:
+        """
+        compute_series params repeating the values of update()
+        from the first received candle, None if there are no such params
+        """
+        return None
+
+    def push_value(self, value: tp.Any) -> None:
+        """ Appends a value for the last candle, a row of compute_series """
+        raise NotImplementedError
+
+    def set_precomputed(self, ts: np.ndarray, values: np.ndarray) -> None:
+        """ Makes update() take the values of candles with timestamps ts """
+        self.precomputed = (ts, values)
+
+    def update_precomputed(self) -> bool:
+        if not self.received_new_candle():
+            return False
+        ts, values = self.precomputed  # type: ignore
+        index = int(np.searchsorted(ts, self.last_candle_timestamp))
+        if index == len(ts) or ts[index] != self.last_candle_timestamp or \
+                np.isnan(values[index]).any():
+            return False
+        self.push_value(values[index])
+        return True
+
+    def get_value_storages(self) -> tp.Dict[str, ValueStorage]:
+        """ Series of values of the handler by attribute name """
+        return {name: value for name, value in vars(self).items()
+                if isinstance(value, ValueStorage)}
+
+    def set_retention(self, retention: tp.Optional[int],
+                      history_path: tp.Optional[Path] = None) -> None:
+        """
+        Keeps only the last retention values of every series in memory,
+        history_path: directory to write the whole series to
+        """
+        for name, storage in self.get_value_storages().items():
+            storage.set_retention(retention)
+            if history_path is not None:
+                storage.set_history_path(
+                    history_path / f'{self.get_name()}.{name}.f64')
+
+    def flush_history(self) -> None:
+        for storage in self.get_value_storages().values():
+            storage.flush()
+
+    def on_new_candle(self, candle: Candle) -> bool:
+        """ update() taking the last candle from the scheduler """
+        self.pushed_candle = candle
+        try:
+            return self.update()
+        finally:
+            self.pushed_candle = None
+
+    def get_last_candle(self) -> Candle:
+        if self.pushed_candle is not None:
+            return self.pushed_candle
+        return self.ti.get_last_n_candles(1)[0]
+
     def received_new_candle(self) -> bool:
-        last_candles = self.ti.get_last_n_candles(1)
-        if last_candles:
+        last_candle = self.pushed_candle
+        if last_candle is None:
+            last_candles = self.ti.get_last_n_candles(1)
+            if not last_candles:
+                return False
             last_candle = last_candles[0]
-            if last_candle.ts != self.last_candle_timestamp:
-                self.last_candle_timestamp = last_candle.ts
-                return True
+        if last_candle.ts != self.last_candle_timestamp:
+            self.last_candle_timestamp = last_candle.ts
+            return True
         return False
@@ -0,0 +1,55 @@
+import typing as tp
+
+from trading_system.trading_system_handler import TradingSystemHandler
+
+
+class UpdateTracker:
+    """
+    Updates of the handlers of one trading system.
+
+    Every handler has a `version` increased by the scheduler whenever
+    its update() produces a value. A subscription keeps the versions of
+    its handlers seen by the last successful check, so checking costs
+    a comparison of a few integers and nothing is shared between runs.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: tp.List[TradingSystemHandler] = []
+        self._indices: tp.Dict[int, int] = {}
+        # (handler indices, seen versions, all or any) by subscription id
+        self._subscriptions: tp.List[tp.Tuple[tp.Tuple[int, ...], tp.List[int], bool]] = []
+
+    def subscribe(self, handlers: tp.Sequence[TradingSystemHandler],
+                  updated: str = 'all') -> int:
+        """
+        Returns an id for check()
+        updated: check if 'all' or 'any' of the handlers were updated
+        """
+        assert updated in ('all', 'any')
+        indices = tuple(self._get_index(handler) for handler in handlers)
+        self._subscriptions.append(
+            (indices, [self._handlers[i].version for i in indices], updated == 'all'))
+        return len(self._subscriptions) - 1
+
+    def check(self, subscription: int) -> bool:
+        """ True if the handlers were updated since the last True result """
+        indices, seen, require_all = self._subscriptions[subscription]
+        handlers = self._handlers
+        updated = [handlers[i].version > seen[j] for j, i in enumerate(indices)]
+        if not (all(updated) if require_all else any(updated)):
+            return False
+        for j, i in enumerate(indices):
+            seen[j] = handlers[i].version
+        return True
+
+    def reset(self) -> None:
+        """ Starts all subscriptions from the current versions """
+        for indices, seen, _ in self._subscriptions:
+            seen[:] = [self._handlers[i].version for i in indices]
+
+    def _get_index(self, handler: TradingSystemHandler) -> int:
+        key = id(handler)
+        if key not in self._indices:
+            self._indices[key] = len(self._handlers)
+            self._handlers.append(handler)
+        return self._indices[key]
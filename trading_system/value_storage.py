@@ -0,0 +1,88 @@
+import typing as tp
+from collections import deque
+from itertools import islice
+from pathlib import Path
+
+import numpy as np
+
+
+class ValueStorage:
+    """
+    Series of indicator values with bounded retention.
+
+    Only the last `retention` values are kept in memory (all if None),
+    count is the number of values ever appended.
+    If history_path is set, all values are also appended to that file
+    as raw float64 in chunks, load_history() reads them back.
+    """
+
+    SPILL_CHUNK_SIZE = 1024
+
+    def __init__(self, retention: tp.Optional[int] = None,
+                 history_path: tp.Optional[Path] = None):
+        assert retention is None or retention > 0
+        self.values: tp.Deque[tp.Any] = deque(maxlen=retention)
+        self.count = 0
+        self.history_path: tp.Optional[Path] = None
+        self._pending: tp.List[tp.Any] = []
+        self.set_history_path(history_path)
+
+    def set_retention(self, retention: tp.Optional[int]) -> None:
+        assert retention is None or retention > 0
+        self.values = deque(self.values, maxlen=retention)
+
+    def set_history_path(self, history_path: tp.Optional[Path]) -> None:
+        """ Starts writing the history to a new file, retained values included """
+        self.flush()
+        self.history_path = history_path
+        if history_path is not None:
+            history_path.parent.mkdir(parents=True, exist_ok=True)
+            history_path.write_bytes(b'')
+            self._pending = list(self.values)
+            self.flush()
+
+    def append(self, value: tp.Any) -> None:
+        self.values.append(value)
+        self.count += 1
+        if self.history_path is not None:
+            self._pending.append(value)
+            if len(self._pending) >= self.SPILL_CHUNK_SIZE:
+                self.flush()
+
+    def reset(self, values: tp.Iterable[tp.Any]) -> None:
+        """ Replaces the whole series """
+        self.values.clear()
+        self.count = 0
+        self._pending = []
+        if self.history_path is not None:
+            self.history_path.write_bytes(b'')
+        for value in values:
+            self.append(value)
+
+    def flush(self) -> None:
+        """ Writes appended values to the history file """
+        if self.history_path is None or not self._pending:
+            return
+        with open(self.history_path, 'ab') as file:
+            np.asarray(self._pending, dtype=np.float64).tofile(file)
+        self._pending = []
+
+    def get_last_n(self, n: int) -> tp.List[tp.Any]:
+        if n <= 0:
+            return []
+        if n >= len(self.values):
+            return list(self.values)
+        return list(islice(reversed(self.values), n))[::-1]
+
+    @staticmethod
+    def load_history(history_path: Path) -> np.ndarray:
+        return np.fromfile(history_path, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, index: int) -> tp.Any:
+        return self.values[index]
+
+    def __iter__(self) -> tp.Iterator[tp.Any]:
+        return iter(self.values)
@@ -3,12 +3,12 @@ import sys
 sys.path.append('.')
 
 import os
-import pickle
 import typing as tp
 from pathlib import Path
 from collections import defaultdict
 
 import logger.log_events as log_events
+from logger.event_log import read_event_log
 from logger.logger import Logger
 from visualizer.visualizer import Visualizer
 from trading import Candle
@@ -27,13 +27,12 @@ def get_log_path() -> tp.Optional[Path]:
     return max(logs, key=os.path.getctime)
 
 
-def load_log(filename: Path) -> tp.List[tp.Dict[str, tp.Any]]:
-    with open(filename, 'rb') as f:
-        log = pickle.load(f)
-    return log
+def load_log(filename: Path) -> tp.Iterator[LogEntryType]:
+    """ Events are read lazily while iterating """
+    return read_event_log(filename)
 
 
-def decompose_log(log: tp.List[LogEntryType]) \
+def decompose_log(log: tp.Iterable[LogEntryType]) \
         -> DecomposedLogType:
     events = defaultdict(list)
     for event in log: